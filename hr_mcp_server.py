@@ -35,7 +35,7 @@ from mcp.server.fastmcp import FastMCP
 
 # Import database components
 from src.database.schema import SearchQuery, SearchResult, Candidate
-from src.database.hybrid_search import HybridSearchHandler
+from src.database.hybrid_search import get_handler
 from src.utils.logger import get_logger
 
 # Initialize logger
@@ -48,7 +48,7 @@ mcp = FastMCP("HR Intelligence")
 app = FastAPI(title="HR Intelligence API")
 
 # Initialize the database handler
-db_handler = HybridSearchHandler(
+db_handler = get_handler(
     duckdb_path="data/hr_database.duckdb",
     chroma_path="data/chroma_db"
 )
@@ -17,14 +17,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 # Import database components
 from src.database.schema import SearchQuery, SearchResult
-from src.database.hybrid_search import HybridSearchHandler
+from src.database.hybrid_search import get_handler
 from src.utils.logger import get_logger
 
 # Initialize logger
 logger = get_logger(__name__)
 
 # Initialize the database handler
-db_handler = HybridSearchHandler(
+db_handler = get_handler(
     duckdb_path="data/hr_database.duckdb",
     chroma_path="data/chroma_db"
 )
@@ -361,6 +361,10 @@ def search_by_education(institution: str = None, degree: str = None) -> List[Dic
     return serialized_results
 
 def close_db():
-    """Close the database connection."""
-    db_handler.close()
-    logger.info("Database connections closed")
\ No newline at end of file
+    """
+    Release this module's use of the database.
+    
+    The handler comes from get_handler and may be shared with other modules in the
+    process, so it is not closed here; shared handlers are closed when the process exits.
+    """
+    logger.info("Database handler released; shared connections close at process exit")
\ No newline at end of file
@@ -8,7 +8,7 @@ import os
 import sys
 import asyncio
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,6 +21,54 @@ from src.utils.helpers import load_config, ensure_dir
 
 logger = get_logger(__name__)
 
+# Number of extracted documents written to the database per transaction
+INSERT_BATCH_SIZE = 1000
+
+def _insert_documents(db_handler: DatabaseHandler, documents: List[tuple]) -> int:
+    """
+    Insert documents in a single transaction, retrying them one at a time if it fails.
+
+    Each document's JSON file has already been written, so a document lost here
+    would be skipped by later --skip-existing runs; retrying limits the loss to
+    the documents that fail on their own.
+
+    Args:
+        db_handler: Database handler to insert into
+        documents: (document_type, file_name, content) tuples
+
+    Returns:
+        Number of documents inserted
+    """
+    try:
+        return db_handler.insert_documents(documents)
+    except Exception as e:
+        if len(documents) == 1:
+            logger.error(f"Error inserting {documents[0][1]}: {e}")
+            return 0
+        logger.warning(f"Error inserting a batch of {len(documents)} documents, retrying one at a time: {e}")
+        return sum(_insert_documents(db_handler, [document]) for document in documents)
+
+def _flush_documents(db_handler: DatabaseHandler, documents: List[tuple]) -> Tuple[int, int]:
+    """
+    Insert buffered documents and empty the buffer.
+
+    Args:
+        db_handler: Database handler to insert into
+        documents: Buffered (document_type, file_name, content) tuples
+
+    Returns:
+        Tuple of (documents inserted, documents that failed)
+    """
+    if not documents:
+        return 0, 0
+
+    try:
+        inserted = _insert_documents(db_handler, documents)
+        logger.info(f"Inserted {inserted} documents into database")
+        return inserted, len(documents) - inserted
+    finally:
+        documents.clear()
+
 def parse_args():
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Batch process PDF files for HR intelligence")
@@ -113,6 +161,9 @@ async def async_main(args):
             logger.info(f"Would process: {pdf_file}")
         return 0
 
+    # Extracted documents waiting to be inserted into the database
+    documents = []
+
     # Process PDFs in batch using async method
     try:
         output_files = await pdf_parser.batch_process_async(input_dir, output_dir)
@@ -136,15 +187,23 @@ async def async_main(args):
                 # Extract structured data
                 extracted_data = data_extractor.process_file(text_file, json_file)
 
-                # Insert into database
+                # Buffer for insertion into the database
                 document_type = extracted_data.get('document_type', 'unknown')
-                db_handler.insert_document(document_type, text_file.stem + ".pdf", extracted_data)
-                logger.info(f"Inserted {document_type} document into database")
-
-                processed_count += 1
+                documents.append((document_type, text_file.stem + ".pdf", extracted_data))
             except Exception as e:
                 logger.error(f"Error processing {text_file.name}: {e}")
                 error_count += 1
+                continue
+
+            if len(documents) >= INSERT_BATCH_SIZE:
+                inserted, failed = _flush_documents(db_handler, documents)
+                processed_count += inserted
+                error_count += failed
+
+        # Insert the remaining documents
+        inserted, failed = _flush_documents(db_handler, documents)
+        processed_count += inserted
+        error_count += failed
 
         # Log summary
         logger.info(f"Batch processing complete")
@@ -156,6 +215,9 @@ async def async_main(args):
         logger.error(f"Error in batch processing: {e}")
         return 1
     finally:
+        # Insert documents still buffered after an error; their JSON files already exist
+        _flush_documents(db_handler, documents)
+
         # Close database connection
         db_handler.close()
 
@@ -199,6 +261,9 @@ def main():
             logger.info(f"Would process: {pdf_file}")
         return 0
 
+    # Extracted documents waiting to be inserted into the database
+    documents = []
+
     # Process PDFs in batch
     try:
         output_files = pdf_parser.batch_process(input_dir, output_dir)
@@ -222,15 +287,23 @@ def main():
                 # Extract structured data
                 extracted_data = data_extractor.process_file(text_file, json_file)
 
-                # Insert into database
+                # Buffer for insertion into the database
                 document_type = extracted_data.get('document_type', 'unknown')
-                db_handler.insert_document(document_type, text_file.stem + ".pdf", extracted_data)
-                logger.info(f"Inserted {document_type} document into database")
-
-                processed_count += 1
+                documents.append((document_type, text_file.stem + ".pdf", extracted_data))
             except Exception as e:
                 logger.error(f"Error processing {text_file.name}: {e}")
                 error_count += 1
+                continue
+
+            if len(documents) >= INSERT_BATCH_SIZE:
+                inserted, failed = _flush_documents(db_handler, documents)
+                processed_count += inserted
+                error_count += failed
+
+        # Insert the remaining documents
+        inserted, failed = _flush_documents(db_handler, documents)
+        processed_count += inserted
+        error_count += failed
 
         # Log summary
         logger.info(f"Batch processing complete")
@@ -242,6 +315,9 @@ def main():
         logger.error(f"Error in batch processing: {e}")
         return 1
     finally:
+        # Insert documents still buffered after an error; their JSON files already exist
+        _flush_documents(db_handler, documents)
+
         # Close database connection
         db_handler.close()
 
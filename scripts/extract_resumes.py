@@ -17,8 +17,13 @@ import os
 import sys
 import json
 import re
+import bisect
+import mmap
+import string
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Union
 import shutil
 
 # Add parent directory to path to import modules
@@ -27,26 +32,131 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.utils.logger import get_logger
 from src.retrieval.schema import Resume, ContactInfo, Education, WorkExperience
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the standard library
+    re2 = None
+
 logger = get_logger(__name__)
 
-def extract_candidate_names_from_table(text: str) -> List[Tuple[str, str]]:
+# Document structure patterns. Resume boundaries are found in the UTF-8 encoded
+# (memory-mapped) document, so the heading patterns work on bytes.
+_TABLE_HEADER = '|Name|Email Address|'
+_FALLBACK_NAME_RE = re.compile(rb'# ([A-Z][a-z]+ [A-Z][a-z]+)\n')
+_HEADING_RE = re.compile(rb'# ([^\n]+)')
+
+# Patterns prone to backtracking are compiled with RE2's linear-time engine when it is
+# installed. RE2 has no lookaround support, so only patterns without it can use it.
+_linear_re = re2 if re2 is not None else re
+
+# Resume section headings (matched case-insensitively). A section starts at one of
+# these headings and runs until the next "# Heading:" line (or the end of the resume).
+_SECTION_HEADINGS = {
+    "education": ["Education"],
+    "experience": ["Experience", "Work Experience"],
+    "skills": ["Skills", "Technical Skills"],
+    "certifications": ["Certifications"],
+    "summary": ["Profile", "Summary", "Professional Summary"],
+}
+# Lowercased section headings grouped by their first letter, so each "# " marker only
+# has to be compared against a couple of candidates
+_SECTION_PREFIXES = {}
+for _key, _headings in _SECTION_HEADINGS.items():
+    for _heading in _headings:
+        _SECTION_PREFIXES.setdefault(_heading[0].lower(), []).append((_heading.lower(), _key))
+_ASCII_LETTERS = frozenset(string.ascii_letters)
+
+# Field patterns used inside a section
+_INSTITUTION_KEYWORDS = ("University", "College", "School")
+_INSTITUTION_RE = _linear_re.compile(
+    r'([A-Za-z]+(?: [A-Za-z]+){0,2})[,\n].*?(?:' + '|'.join(_INSTITUTION_KEYWORDS) + ')')
+_DEGREE_RE = re.compile(
+    r'(Bachelor|Master|B\.S\.|M\.S\.|B\.A\.|M\.A\.|PhD|Ph\.D\.|BSc|MSc|MBA)\.? (?:of|in)? ([A-Za-z]+(?: [A-Za-z]+)*)')
+_GPA_RE = re.compile(r'GPA:? (\d+\.\d+)')
+_EXPERIENCE_SPLIT_RE = re.compile(r'# [A-Za-z]')
+_COMPANY_RE = re.compile(r'([A-Za-z]+ [A-Za-z]+ [A-Za-z]+|[A-Za-z]+ [A-Za-z]+|[A-Za-z]+)[,\n]')
+_ROLE_RE = re.compile(
+    r'(Engineer|Developer|Analyst|Manager|Intern|Assistant|Specialist|Lead|Director|Consultant)(?:[,\n]|$)')
+_SKILL_LIST_RE = _linear_re.compile(r'([A-Za-z]+(?:[,/&]? [A-Za-z]+)*(?:, [A-Za-z]+(?:[,/&]? [A-Za-z]+)*)+)')
+
+# Contact patterns. Phone and LinkedIn are each a single alternation so the text
+# is scanned once; the international phone format comes first so the longer match wins.
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_PHONE_RE = re.compile(
+    r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # +1 (123) 456-7890
+    r'|\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # (123) 456-7890 or 123-456-7890
+)
+_LINKEDIN_RE = re.compile(r'linkedin\.com/(?:in/)?[A-Za-z0-9_-]+|linkedin: [A-Za-z0-9_-]+')
+
+# Headings that are never candidate names when falling back to regex matching
+_SECTION_HEADERS = frozenset(["PROFESSIONAL EXPERIENCE", "WORK EXPERIENCE", "EDUCATION", "SKILLS",
+                              "CERTIFICATIONS", "COMMUNITY INVOLVEMENT", "EXTRACURRICULAR ACTIVITIES",
+                              "SPECIALIZED SKILLS", "KEY SKILLS", "SPECIAL MENTIONS", "PROJECT EXPERIENCE",
+                              "LEADERSHIP EXPERIENCE", "TECHNICAL SKILLS", "PROFESSIONAL SUMMARY",
+                              # Add more section headers and educational institutions
+                              "SYRACUSE UNIVERSITY", "EARLHAM COLLEGE", "UNIVERSITY", "COLLEGE",
+                              "SCHOLASTIC ACHIEVEMENTS", "ACHIEVEMENTS", "AWARDS", "HONORS",
+                              "PUBLICATIONS", "RESEARCH", "LANGUAGES", "INTERESTS", "HOBBIES",
+                              "VOLUNTEER EXPERIENCE", "REFERENCES", "ADDITIONAL INFORMATION",
+                              "PROFESSIONAL DEVELOPMENT", "TRAINING", "WORKSHOPS", "CONFERENCES",
+                              "PROJECTS", "ACADEMIC PROJECTS", "PERSONAL PROJECTS", "COURSEWORK",
+                              "RELEVANT COURSEWORK", "ACTIVITIES", "PROFESSIONAL AFFILIATIONS",
+                              "AFFILIATIONS", "MEMBERSHIPS", "PROFESSIONAL MEMBERSHIPS",
+                              "PROFESSIONAL ASSOCIATIONS", "ASSOCIATIONS", "ORGANIZATIONS",
+                              "PROFESSIONAL ORGANIZATIONS", "PROFESSIONAL ACTIVITIES",
+                              "PROFESSIONAL CERTIFICATIONS", "LICENSES", "PROFESSIONAL LICENSES"])
+
+# Section headings skipped when looking for the next candidate's heading
+_SKIP_HEADINGS = frozenset(["EDUCATION", "EXPERIENCE", "SKILLS", "PROJECTS", "WORK EXPERIENCE",
+                            "TECHNICAL SKILLS", "PROFESSIONAL EXPERIENCE"])
+
+# Date range patterns, built from shared fragments so the month alternation is only
+# spelled out once. They are plain alternations (no lookaround), so RE2 can run them.
+_MONTH = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*'
+_MONTH_RANGE = rf'{_MONTH} \d{{4}} [-–] {_MONTH} \d{{4}}'  # Aug 2018 - May 2022
+_YEAR_RANGE = r'\d{4} [-–] (?:\d{4}|Present|\d{2})'  # 2018 - 2022, 2018 - Present, 2018 - 22
+_NUMERIC_RANGE = r'\d{2}/\d{4} [-–] (?:\d{2}/\d{4}|Present)'  # 08/2018 - 05/2022, 08/2018 - Present
+_EDUCATION_DATES_RE = _linear_re.compile('|'.join([_MONTH_RANGE, _YEAR_RANGE, r'\d{4}']))
+_WORK_DATES_RE = _linear_re.compile('|'.join([_MONTH_RANGE, _YEAR_RANGE, _NUMERIC_RANGE]))
+
+def extract_candidate_names_from_table(text: Union[str, bytes, mmap.mmap]) -> List[Tuple[str, str]]:
     """
     Extract candidate names and emails from the tables at the beginning of the document.
 
     Args:
-        text: The full text content of the document
+        text: The full text content of the document, as a string or UTF-8 encoded buffer
 
     Returns:
         List of tuples containing (candidate_name, email)
     """
-    # Find tables with candidate information
-    table_pattern = r'\|Name\|Email Address\|.*?\|(.*?)(?=\n\n# )'
-    tables = re.findall(table_pattern, text, re.DOTALL)
-
     candidates = []
 
-    for table in tables:
+    # Search with markers of the same type as the text; only table rows are decoded
+    if isinstance(text, str):
+        table_header, row_marker, table_end = _TABLE_HEADER, '|', '\n\n# '
+    else:
+        table_header, row_marker, table_end = _TABLE_HEADER.encode(), b'|', b'\n\n# '
+
+    # Find tables with candidate information. A table's rows start after the next '|'
+    # following the header and run until the next heading preceded by a blank line.
+    header_pos = text.find(table_header)
+    while header_pos != -1:
+        rows_start = text.find(row_marker, header_pos + len(table_header))
+        if rows_start == -1:
+            break
+        rows_end = text.find(table_end, rows_start + 1)
+        if rows_end == -1:
+            break
+
         # Extract rows from the table
+        table = text[rows_start + 1:rows_end]
+        if not isinstance(table, str):
+            table = table.decode('utf-8')
         rows = table.strip().split('\n')
         for row in rows:
             # Skip separator rows and empty rows
@@ -54,17 +164,22 @@ def extract_candidate_names_from_table(text: str) -> List[Tuple[str, str]]:
                 continue
 
             # Extract name and email from the row
-            parts = row.split('|')
+            parts = row.split('|', 3)
             if len(parts) >= 3:  # Ensure we have at least name and email
                 name = parts[1].strip()
                 email = parts[2].strip()
                 if name and email and '@' in email:
                     candidates.append((name, email))
 
+        header_pos = text.find(table_header, rows_end)
+
     logger.info(f"Extracted {len(candidates)} candidate names from tables")
     return candidates
 
-def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -> List[Dict[str, Any]]:
+def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False,
+                    include_raw_text: bool = False, jsonl: bool = False,
+                    workers: Optional[int] = None, validate: bool = True,
+                    pretty: bool = False) -> List[Dict[str, Any]]:
     """
     Extract individual resumes from a processed text file.
 
@@ -72,6 +187,11 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
         text_file_path: Path to the processed text file
         output_dir: Directory to save individual resume JSON files
         debug: Whether to print debug information
+        include_raw_text: Whether to keep the raw resume text in the saved JSON
+        jsonl: Whether to write all resumes to a single resumes.jsonl file instead of one file per candidate
+        workers: Number of worker processes for per-resume extraction (defaults to the CPU count)
+        validate: Whether to validate each extracted resume against the Resume schema
+        pretty: Whether to indent the per-candidate JSON files (compact by default)
 
     Returns:
         List of extracted resume data dictionaries
@@ -80,9 +200,68 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
     output_path = Path(output_dir)
     output_path.mkdir(exist_ok=True, parents=True)
 
-    # Read the processed text file
-    with open(text_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Map the processed text file instead of reading it into memory; only the
+    # text of each resume is decoded
+    with open(text_file_path, 'rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            resume_map = _map_resumes(b'')
+        else:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                resume_map = _map_resumes(content)
+
+    # Debug: Print the first few lines of each extracted resume
+    if debug:
+        logger.info("=== DEBUG: First 10 lines of each extracted resume ===")
+        for candidate_name, resume_data in resume_map.items():
+            resume_text = resume_data["text"]
+            preview = _first_n_lines(resume_text, 10)
+            logger.info(f"--- {candidate_name} ---\n{preview}\n...")
+
+    # Process each resume; candidates are independent, so spread them over worker processes
+    names = list(resume_map)
+    texts = [resume_map[name]["text"] for name in names]
+    emails = [resume_map[name]["email"] for name in names]
+    save_args = (repeat(str(output_path)), repeat(include_raw_text), repeat(jsonl), repeat(validate),
+                 repeat(pretty))
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(names) < 2:
+        results = list(map(_process_resume, names, texts, emails, *save_args))
+    else:
+        chunksize = max(1, len(names) // (4 * workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_process_resume, names, texts, emails, *save_args,
+                                        chunksize=chunksize))
+
+    extracted_resumes = [resume_data for resume_data in results if resume_data is not None]
+
+    if jsonl:
+        output_file = output_path / "resumes.jsonl"
+        with open(output_file, 'wb') as f:
+            f.writelines(_dump_json(resume_data) + b'\n' for resume_data in extracted_resumes)
+        logger.info(f"Saved {len(extracted_resumes)} resumes to {output_file}")
+
+    failed = len(results) - len(extracted_resumes)
+    logger.info(f"Successfully extracted {len(extracted_resumes)} resumes ({failed} failed)")
+    return extracted_resumes
+
+def _map_resumes(content: Union[bytes, mmap.mmap]) -> Dict[str, Dict[str, str]]:
+    """
+    Split the processed text into the resume text of each candidate.
+
+    Resume boundaries are found by scanning the encoded document; only the
+    table rows, headings and the text of each resume are decoded.
+
+    Args:
+        content: The UTF-8 encoded (usually memory-mapped) processed text file
+
+    Returns:
+        Dictionary mapping candidate names to their resume text and email
+    """
+    # Normalize Windows line endings the way reading in text mode would
+    if content.find(b'\r') != -1:
+        content = content[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
 
     # Extract candidate names and emails from the tables at the beginning
     candidates = extract_candidate_names_from_table(content)
@@ -91,28 +270,10 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
         logger.warning("No candidates found in the tables. Falling back to regex pattern matching.")
         # This fallback is now more restrictive to avoid matching section headers
         # It requires names to be in the format "Firstname Lastname" with proper capitalization
-        name_pattern = r'# ([A-Z][a-z]+ [A-Z][a-z]+)\n'
-        names = re.findall(name_pattern, content)
+        names = [name.decode('utf-8') for name in _FALLBACK_NAME_RE.findall(content)]
 
         # Additional filtering to exclude common section headers
-        section_headers = ["PROFESSIONAL EXPERIENCE", "WORK EXPERIENCE", "EDUCATION", "SKILLS",
-                          "CERTIFICATIONS", "COMMUNITY INVOLVEMENT", "EXTRACURRICULAR ACTIVITIES",
-                          "SPECIALIZED SKILLS", "KEY SKILLS", "SPECIAL MENTIONS", "PROJECT EXPERIENCE",
-                          "LEADERSHIP EXPERIENCE", "TECHNICAL SKILLS", "PROFESSIONAL SUMMARY",
-                          # Add more section headers and educational institutions
-                          "SYRACUSE UNIVERSITY", "EARLHAM COLLEGE", "UNIVERSITY", "COLLEGE",
-                          "SCHOLASTIC ACHIEVEMENTS", "ACHIEVEMENTS", "AWARDS", "HONORS",
-                          "PUBLICATIONS", "RESEARCH", "LANGUAGES", "INTERESTS", "HOBBIES",
-                          "VOLUNTEER EXPERIENCE", "REFERENCES", "ADDITIONAL INFORMATION",
-                          "PROFESSIONAL DEVELOPMENT", "TRAINING", "WORKSHOPS", "CONFERENCES",
-                          "PROJECTS", "ACADEMIC PROJECTS", "PERSONAL PROJECTS", "COURSEWORK",
-                          "RELEVANT COURSEWORK", "ACTIVITIES", "PROFESSIONAL AFFILIATIONS",
-                          "AFFILIATIONS", "MEMBERSHIPS", "PROFESSIONAL MEMBERSHIPS",
-                          "PROFESSIONAL ASSOCIATIONS", "ASSOCIATIONS", "ORGANIZATIONS",
-                          "PROFESSIONAL ORGANIZATIONS", "PROFESSIONAL ACTIVITIES",
-                          "PROFESSIONAL CERTIFICATIONS", "LICENSES", "PROFESSIONAL LICENSES"]
-
-        candidates = [(name, "") for name in names if name not in section_headers]
+        candidates = [(name, "") for name in names if name not in _SECTION_HEADERS]
 
         # Log the candidates found through regex
         logger.info(f"Found {len(candidates)} candidates through regex pattern matching")
@@ -138,8 +299,23 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
         if candidate_name in name_variations:
             all_candidate_variations.extend(name_variations[candidate_name])
 
-    # Find all headings in the document
-    heading_matches = list(re.finditer(r'# ([^\n]+)', content))
+    # Find all headings in the document and lowercase them once for matching
+    heading_matches = list(_HEADING_RE.finditer(content))
+    headings = [match.group(1).decode('utf-8') for match in heading_matches]
+    heading_texts = [heading.lower() for heading in headings]
+
+    # In a single pass over the headings, record the first heading containing each name
+    # variation and every heading that belongs to a candidate; the next such heading
+    # after a candidate's own heading marks the end of their resume
+    variations_lower = [name.lower() for name in all_candidate_variations]
+    first_heading_index = {}
+    boundary_indices = []
+    for j, heading_text in enumerate(heading_texts):
+        contained = [name for name in variations_lower if name in heading_text]
+        for name in contained:
+            first_heading_index.setdefault(name, j)
+        if contained and headings[j] not in _SKIP_HEADINGS:
+            boundary_indices.append(j)
 
     # Extract resume sections based on headings
     for i, (candidate_name, email) in enumerate(candidates):
@@ -155,48 +331,25 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
 
         # Try each name variation
         for name_variation in names_to_try:
-            # Find the heading that matches this candidate
-            candidate_heading_index = None
-            for j, match in enumerate(heading_matches):
-                heading_text = match.group(1)
-                # Check if the heading contains the candidate name (case insensitive)
-                if name_variation.lower() in heading_text.lower():
-                    candidate_heading_index = j
-                    break
+            # Find the heading that contains this candidate name (case insensitive)
+            candidate_heading_index = first_heading_index.get(name_variation.lower())
 
             if candidate_heading_index is not None:
                 # Found the candidate's heading
                 start_pos = heading_matches[candidate_heading_index].start()
 
                 # Find the next candidate heading
-                next_candidate_index = None
-                for j in range(candidate_heading_index + 1, len(heading_matches)):
-                    heading_text = heading_matches[j].group(1)
-                    # Check if this heading is for another candidate
-                    is_candidate_heading = False
-                    for other_name in all_candidate_variations:
-                        if other_name.lower() in heading_text.lower():
-                            is_candidate_heading = True
-                            break
-
-                    # Skip headings that are clearly section headers
-                    if heading_text in ["EDUCATION", "EXPERIENCE", "SKILLS", "PROJECTS", "WORK EXPERIENCE",
-                                       "TECHNICAL SKILLS", "PROFESSIONAL EXPERIENCE"]:
-                        continue
-
-                    if is_candidate_heading:
-                        next_candidate_index = j
-                        break
+                next_boundary = bisect.bisect_right(boundary_indices, candidate_heading_index)
 
                 # If we found the next candidate, use their heading as the end point
-                if next_candidate_index is not None:
-                    end_pos = heading_matches[next_candidate_index].start()
+                if next_boundary < len(boundary_indices):
+                    end_pos = heading_matches[boundary_indices[next_boundary]].start()
                 else:
                     # If this is the last candidate, go to the end of the document
                     end_pos = len(content)
 
                 # Extract the resume content
-                resume_text = content[start_pos:end_pos].strip()
+                resume_text = content[start_pos:end_pos].decode('utf-8').strip()
 
                 # Store in the map
                 resume_map[candidate_name] = {
@@ -211,12 +364,14 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
         if not resume_found:
             # Try to find by email
             if email:
-                email_pattern = re.escape(email)
-                email_match = re.search(email_pattern, content)
+                # Emails are literals, so a plain substring search is enough
+                email_start = content.find(email.encode('utf-8'))
+
+                if email_start != -1:
+                    email_end = email_start + len(email.encode('utf-8'))
 
-                if email_match:
                     # Find the nearest heading before this email
-                    heading_pos = content[:email_match.start()].rfind("# ")
+                    heading_pos = content.rfind(b"# ", 0, email_start)
                     if heading_pos != -1:
                         start_pos = heading_pos
 
@@ -224,35 +379,34 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
                         end_pos = len(content)
                         for other_name, _ in candidates:
                             if other_name != candidate_name:
-                                other_pattern = f"# {re.escape(other_name)}"
-                                other_match = re.search(other_pattern, content[email_match.end():])
-                                if other_match:
-                                    end_pos = email_match.end() + other_match.start()
+                                other_pos = content.find(f"# {other_name}".encode('utf-8'), email_end)
+                                if other_pos != -1:
+                                    end_pos = other_pos
                                     break
 
                             # Extract the resume content
-                            resume_text = content[start_pos:end_pos].strip()
+                            resume_text = content[start_pos:end_pos].decode('utf-8').strip()
 
                             # IMPROVED: Check if the extracted text is just the applicant table
                             # If it contains "Job applicants as of" and doesn't have enough content, try to find the actual resume
                             if "Job applicants as of" in resume_text and len(resume_text.split('\n')) < 30:
                                 # Search for the candidate's actual resume section
                                 # Look for a section that starts with the candidate's name as a heading
-                                candidate_section_pattern = f"# {re.escape(candidate_name)}\n"
-                                candidate_section_match = re.search(candidate_section_pattern, content)
+                                candidate_heading = f"# {candidate_name}\n".encode('utf-8')
+                                candidate_section_pos = content.find(candidate_heading)
 
-                                if candidate_section_match:
-                                    start_pos = candidate_section_match.start()
+                                if candidate_section_pos != -1:
+                                    start_pos = candidate_section_pos
 
                                     # Find the next heading after this position
-                                    next_heading_match = re.search(r'\n# ', content[start_pos + len(candidate_section_pattern):])
-                                    if next_heading_match:
-                                        end_pos = start_pos + len(candidate_section_pattern) + next_heading_match.start()
+                                    next_heading_pos = content.find(b"\n# ", start_pos + len(candidate_heading))
+                                    if next_heading_pos != -1:
+                                        end_pos = next_heading_pos
                                     else:
                                         end_pos = len(content)
 
                                     # Extract the actual resume content
-                                    resume_text = content[start_pos:end_pos].strip()
+                                    resume_text = content[start_pos:end_pos].decode('utf-8').strip()
                                     logger.info(f"Found better resume content for {candidate_name} using name-based search")
 
                             # Store in the map
@@ -269,150 +423,257 @@ def extract_resumes(text_file_path: str, output_dir: str, debug: bool = False) -
 
     logger.info(f"Extracted {len(resume_map)} resumes from the text file")
 
-    # Debug: Print the first few lines of each extracted resume
-    if debug:
-        logger.info("=== DEBUG: First 10 lines of each extracted resume ===")
-        for candidate_name, resume_data in resume_map.items():
-            resume_text = resume_data["text"]
-            preview_lines = resume_text.split('\n')[:10]
-            preview = '\n'.join(preview_lines)
-            logger.info(f"--- {candidate_name} ---\n{preview}\n...")
+    return resume_map
+
+def _process_resume(candidate_name: str, resume_text: str, email: str, output_dir: str,
+                    include_raw_text: bool, jsonl: bool, validate: bool = True,
+                    pretty: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    Extract, validate and save the structured data for a single resume.
 
-    # Process each resume
-    extracted_resumes = []
+    This is a top-level function so it can be dispatched to worker processes.
 
-    for candidate_name, resume_data in resume_map.items():
-        try:
-            resume_text = resume_data["text"]
-            email = resume_data["email"] or extract_email(resume_text)
-
-            logger.info(f"Processing resume for {candidate_name}")
-
-            # Extract contact information
-            phone = extract_phone(resume_text)
-            linkedin = extract_linkedin(resume_text)
-
-            # Extract education
-            education_list = extract_education(resume_text)
-
-            # Extract work experience
-            work_experience_list = extract_work_experience(resume_text)
-
-            # Extract skills
-            skills = extract_skills(resume_text)
-
-            # Extract certifications
-            certifications = extract_certifications(resume_text)
-
-            # Extract summary/profile
-            summary = extract_summary(resume_text)
-
-            # Create resume dictionary
-            resume_data = {
-                "document_type": "resume",
-                "candidate_name": candidate_name,
-                "contact_info": {
-                    "email": email,
-                    "phone": phone,
-                    "linkedin": linkedin,
-                    "address": None,
-                    "website": None
-                },
-                "education": education_list,
-                "work_experience": work_experience_list,
-                "skills": skills,
-                "certifications": certifications,
-                "summary": summary,
-                "raw_text": resume_text  # Include the raw text for LLM processing
-            }
-
-            # Validate against schema
+    Args:
+        candidate_name: Name of the candidate
+        resume_text: Raw text of the candidate's resume
+        email: Email address from the applicant table, if any
+        output_dir: Directory to save the resume JSON file
+        include_raw_text: Whether to keep the raw resume text in the saved JSON
+        jsonl: Whether the caller writes a single JSON Lines file (skips the per-candidate file)
+        validate: Whether to validate the resume against the Resume schema
+        pretty: Whether to indent the saved JSON file
+
+    Returns:
+        The extracted resume data, or None if processing failed
+    """
+    try:
+        email = email or extract_email(resume_text)
+
+        logger.debug("Processing resume for %s", candidate_name)
+
+        # Extract contact information
+        phone = extract_phone(resume_text)
+        linkedin = extract_linkedin(resume_text)
+
+        # Split the resume into sections once and share them between the extractors
+        sections = _split_sections(resume_text)
+
+        # Extract education
+        education_list = extract_education(resume_text, sections)
+
+        # Extract work experience
+        work_experience_list = extract_work_experience(resume_text, sections)
+
+        # Extract skills
+        skills = extract_skills(resume_text, sections)
+
+        # Extract certifications
+        certifications = extract_certifications(resume_text, sections)
+
+        # Extract summary/profile
+        summary = extract_summary(resume_text, sections)
+
+        # Create resume dictionary
+        resume_data = {
+            "document_type": "resume",
+            "candidate_name": candidate_name,
+            "contact_info": {
+                "email": email,
+                "phone": phone,
+                "linkedin": linkedin,
+                "address": None,
+                "website": None
+            },
+            "education": education_list,
+            "work_experience": work_experience_list,
+            "skills": skills,
+            "certifications": certifications,
+            "summary": summary
+        }
+
+        # Validate against schema (before raw_text is added, so no copy is needed)
+        if validate:
             try:
-                # Create a copy without the raw_text field for validation
-                validation_data = {k: v for k, v in resume_data.items() if k != "raw_text"}
-                Resume(**validation_data)
-                logger.info(f"Resume for {candidate_name} validated successfully")
+                Resume.model_validate(resume_data)
+                logger.debug("Resume for %s validated successfully", candidate_name)
             except Exception as e:
                 logger.warning(f"Resume for {candidate_name} failed validation: {e}")
                 # Continue processing even if validation fails
 
-            # Save to JSON file
-            output_file = output_path / f"{candidate_name.replace(' ', '_')}.json"
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(resume_data, f, indent=2)
-
-            logger.info(f"Saved resume for {candidate_name} to {output_file}")
-            extracted_resumes.append(resume_data)
-
-        except Exception as e:
-            logger.error(f"Error processing resume for {candidate_name}: {e}")
-
-    logger.info(f"Successfully extracted {len(extracted_resumes)} resumes")
-    return extracted_resumes
+        # Only keep the raw text when requested (needed for LLM processing)
+        if include_raw_text:
+            resume_data["raw_text"] = resume_text
+
+        # Save to JSON file (JSON Lines output is written once by the caller)
+        if not jsonl:
+            output_file = Path(output_dir) / f"{candidate_name.replace(' ', '_')}.json"
+            with open(output_file, 'wb') as f:
+                f.write(_dump_json(resume_data, indent=pretty))
+
+            logger.debug("Saved resume for %s to %s", candidate_name, output_file)
+
+        return resume_data
+
+    except Exception as e:
+        logger.error(f"Error processing resume for {candidate_name}: {e}")
+        return None
+
+def _dump_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON in one buffer, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _first_n_lines(text: str, n: int) -> str:
+    """Return the first n lines of text without splitting the whole string."""
+    pos = 0
+    for _ in range(n):
+        newline = text.find('\n', pos)
+        if newline == -1:
+            return text
+        pos = newline + 1
+    return text[:max(pos - 1, 0)]
 
 def extract_email(text: str) -> str:
     """Extract email address from text."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    match = re.search(email_pattern, text)
+    # An email address needs an '@', so skip the regex when there is none
+    if '@' not in text:
+        return ""
+    match = _EMAIL_RE.search(text)
     return match.group(0) if match else ""
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract phone number from text."""
-    phone_patterns = [
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',  # (123) 456-7890 or 123-456-7890
-        r'\+\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'  # +1 (123) 456-7890
-    ]
-
-    for pattern in phone_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
-
-    return None
+    match = _PHONE_RE.search(text)
+    return match.group(0) if match else None
 
 def extract_linkedin(text: str) -> Optional[str]:
     """Extract LinkedIn URL or username from text."""
-    linkedin_patterns = [
-        r'linkedin\.com/in/[A-Za-z0-9_-]+',
-        r'linkedin\.com/[A-Za-z0-9_-]+',
-        r'linkedin: [A-Za-z0-9_-]+'
-    ]
+    if 'linkedin' not in text:
+        return None
+    match = _LINKEDIN_RE.search(text)
+    return match.group(0) if match else None
 
-    for pattern in linkedin_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return match.group(0)
+def _extract_bullets(text: str) -> List[str]:
+    """
+    Extract "- " bullet points from text, line by line.
 
-    return None
+    A bullet runs until the next bullet or blank line; wrapped lines in between
+    are joined onto it.
 
-def extract_education(text: str) -> List[Dict[str, Any]]:
-    """Extract education information from text."""
-    education_list = []
+    Args:
+        text: Text containing bullet points
 
-    # Look for education section
-    education_section_match = re.search(r'# Education:?(.*?)(?=# [A-Za-z]+:|$)', text, re.DOTALL)
-    if not education_section_match:
-        education_section_match = re.search(r'# EDUCATION:?(.*?)(?=# [A-Za-z]+:|$)', text, re.DOTALL)
+    Returns:
+        List of non-empty bullet point texts
+    """
+    bullets = []
+    current = None
+
+    for line in text.splitlines():
+        line = line.strip()
+        if line == '-' or line.startswith('- '):
+            if current:
+                bullets.append(' '.join(current))
+            current = [line[2:].strip()] if len(line) > 2 else []
+        elif line and current is not None:
+            current.append(line)
+        else:
+            if current:
+                bullets.append(' '.join(current))
+            current = None
+
+    if current:
+        bullets.append(' '.join(current))
+
+    return bullets
+
+def _split_sections(text: str) -> Dict[str, str]:
+    """
+    Split a resume into its known sections in a single pass.
 
-    if education_section_match:
-        education_text = education_section_match.group(1)
+    The text is scanned once for "# " markers. A marker followed by a known heading
+    opens a section; a marker followed by a single word and a colon ("# Word:") closes
+    every open section.
 
-        # Look for institutions
-        institutions = re.findall(r'([A-Za-z]+ [A-Za-z]+ [A-Za-z]+|[A-Za-z]+ [A-Za-z]+|[A-Za-z]+)[,\n].*?(?:University|College|School)', education_text)
+    Args:
+        text: The resume text
 
-        for institution in institutions:
-            # Extract degree
-            degree_match = re.search(r'(Bachelor|Master|B\.S\.|M\.S\.|B\.A\.|M\.A\.|PhD|Ph\.D\.|BSc|MSc|MBA)\.? (?:of|in)? ([A-Za-z]+(?: [A-Za-z]+)*)', education_text)
-            degree = degree_match.group(0) if degree_match else "Degree not specified"
+    Returns:
+        Dictionary mapping section keys (see _SECTION_HEADINGS) to the section body.
+        Only the first occurrence of each section is kept.
+    """
+    sections = {}
+    seen = set()
+    open_sections = []  # (key, body_start) pairs waiting for the next section break
+    text_len = len(text)
+
+    pos = text.find('# ')
+    while pos != -1:
+        word_start = pos + 2
+
+        # Close open sections at a section break
+        word_end = word_start
+        while word_end < text_len and text[word_end] in _ASCII_LETTERS:
+            word_end += 1
+        if word_end > word_start and text.startswith(':', word_end):
+            for key, body_start in open_sections:
+                sections[key] = text[body_start:pos]
+            open_sections = []
+
+        # Open a section at a known heading
+        for heading, key in _SECTION_PREFIXES.get(text[word_start:word_start + 1].lower(), ()):
+            if text[word_start:word_start + len(heading)].lower() == heading:
+                if key not in seen:
+                    seen.add(key)
+                    body_start = word_start + len(heading)
+                    if text.startswith(':', body_start):
+                        body_start += 1
+                    open_sections.append((key, body_start))
+                break
 
-            # Extract dates
-            dates_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4} [-–] (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}|(\d{4} [-–] \d{4})|(\d{4} [-–] Present)|(\d{4} [-–] \d{2})|(\d{4})', education_text)
-            dates = dates_match.group(0) if dates_match else ""
+        pos = text.find('# ', word_start)
+
+    # A section running to the end of the resume stops before a trailing newline
+    text_end = text_len - 1 if text.endswith('\n') else text_len
+    for key, body_start in open_sections:
+        sections[key] = text[body_start:text_end]
 
-            # Extract GPA
-            gpa_match = re.search(r'GPA:? (\d+\.\d+)', education_text)
-            gpa = float(gpa_match.group(1)) if gpa_match else None
+    return sections
 
+def extract_education(text: str, sections: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """Extract education information from text (or from pre-split sections)."""
+    education_list = []
+
+    # Look for education section
+    if sections is None:
+        sections = _split_sections(text)
+    education_text = sections.get("education")
+
+    if education_text is not None:
+        # Look for institutions (skipping the regex if no institution keyword appears)
+        if not any(keyword in education_text for keyword in _INSTITUTION_KEYWORDS):
+            return education_list
+        institutions = _INSTITUTION_RE.findall(education_text)
+        if not institutions:
+            return education_list
+
+        # Degree, dates and GPA are taken from the whole section, so look them up once
+        # Extract degree
+        degree_match = _DEGREE_RE.search(education_text)
+        degree = degree_match.group(0) if degree_match else "Degree not specified"
+
+        # Extract dates
+        dates_match = _EDUCATION_DATES_RE.search(education_text)
+        dates = dates_match.group(0) if dates_match else ""
+
+        # Extract GPA
+        gpa_match = _GPA_RE.search(education_text) if 'GPA' in education_text else None
+        gpa = float(gpa_match.group(1)) if gpa_match else None
+
+        for institution in institutions:
             education_list.append({
                 "institution": institution.strip(),
                 "degree": degree,
@@ -423,41 +684,37 @@ def extract_education(text: str) -> List[Dict[str, Any]]:
 
     return education_list
 
-def extract_work_experience(text: str) -> List[Dict[str, Any]]:
-    """Extract work experience information from text."""
+def extract_work_experience(text: str, sections: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+    """Extract work experience information from text (or from pre-split sections)."""
     work_experience_list = []
 
     # Look for experience section
-    experience_section_match = re.search(r'# (Experience|EXPERIENCE|Work Experience|WORK EXPERIENCE):?(.*?)(?=# [A-Za-z]+:|$)', text, re.DOTALL)
-
-    if experience_section_match:
-        experience_text = experience_section_match.group(2)
+    if sections is None:
+        sections = _split_sections(text)
+    experience_text = sections.get("experience")
 
+    if experience_text is not None:
         # Split into individual experiences
-        experiences = re.split(r'# [A-Za-z]', experience_text)
+        experiences = _EXPERIENCE_SPLIT_RE.split(experience_text)
 
         for exp in experiences:
             if not exp.strip():
                 continue
 
             # Extract company
-            company_match = re.search(r'([A-Za-z]+ [A-Za-z]+ [A-Za-z]+|[A-Za-z]+ [A-Za-z]+|[A-Za-z]+)[,\n]', exp)
+            company_match = _COMPANY_RE.search(exp)
             company = company_match.group(1) if company_match else "Company not specified"
 
             # Extract role
-            role_match = re.search(r'(Engineer|Developer|Analyst|Manager|Intern|Assistant|Specialist|Lead|Director|Consultant)(?:[,\n]|$)', exp)
+            role_match = _ROLE_RE.search(exp)
             role = role_match.group(1) if role_match else "Role not specified"
 
             # Extract dates
-            dates_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4} [-–] (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{4}|(\d{4} [-–] \d{4})|(\d{4} [-–] Present)|(\d{4} [-–] \d{2})|(\d{2}/\d{4} [-–] \d{2}/\d{4})|(\d{2}/\d{4} [-–] Present)', exp)
+            dates_match = _WORK_DATES_RE.search(exp)
             dates = dates_match.group(0) if dates_match else ""
 
             # Extract responsibilities
-            responsibilities = []
-            bullet_points = re.findall(r'- (.*?)(?=\n- |\n\n|$)', exp)
-            for point in bullet_points:
-                if point.strip():
-                    responsibilities.append(point.strip())
+            responsibilities = _extract_bullets(exp)
 
             work_experience_list.append({
                 "company": company.strip(),
@@ -470,58 +727,51 @@ def extract_work_experience(text: str) -> List[Dict[str, Any]]:
 
     return work_experience_list
 
-def extract_skills(text: str) -> List[str]:
-    """Extract skills from text."""
+def extract_skills(text: str, sections: Optional[Dict[str, str]] = None) -> List[str]:
+    """Extract skills from text (or from pre-split sections)."""
     skills = []
 
     # Look for skills section
-    skills_section_match = re.search(r'# (Skills|SKILLS|Technical Skills|TECHNICAL SKILLS):?(.*?)(?=# [A-Za-z]+:|$)', text, re.DOTALL)
-
-    if skills_section_match:
-        skills_text = skills_section_match.group(2)
+    if sections is None:
+        sections = _split_sections(text)
+    skills_text = sections.get("skills")
 
+    if skills_text is not None:
         # Extract skills from bullet points
-        bullet_skills = re.findall(r'- (.*?)(?=\n- |\n\n|$)', skills_text)
-        for skill in bullet_skills:
-            if skill.strip():
-                skills.append(skill.strip())
+        skills = _extract_bullets(skills_text)
 
-        # Extract skills from comma-separated lists
+        # Extract skills from comma-separated lists. Matches start and end with a letter
+        # and contain single separators, so the pieces need no stripping or filtering.
         if not skills:
-            skill_lists = re.findall(r'([A-Za-z]+(?:[,/&]? [A-Za-z]+)*(?:, [A-Za-z]+(?:[,/&]? [A-Za-z]+)*)+)', skills_text)
-            for skill_list in skill_lists:
-                for skill in skill_list.split(', '):
-                    if skill.strip():
-                        skills.append(skill.strip())
+            skills = [skill for skill_list in _SKILL_LIST_RE.findall(skills_text)
+                      for skill in skill_list.split(', ')]
 
     return skills
 
-def extract_certifications(text: str) -> Optional[List[str]]:
-    """Extract certifications from text."""
+def extract_certifications(text: str, sections: Optional[Dict[str, str]] = None) -> Optional[List[str]]:
+    """Extract certifications from text (or from pre-split sections)."""
     certifications = []
 
     # Look for certifications section
-    cert_section_match = re.search(r'# (Certifications|CERTIFICATIONS):?(.*?)(?=# [A-Za-z]+:|$)', text, re.DOTALL)
-
-    if cert_section_match:
-        cert_text = cert_section_match.group(2)
+    if sections is None:
+        sections = _split_sections(text)
+    cert_text = sections.get("certifications")
 
+    if cert_text is not None:
         # Extract certifications from bullet points
-        bullet_certs = re.findall(r'- (.*?)(?=\n- |\n\n|$)', cert_text)
-        for cert in bullet_certs:
-            if cert.strip():
-                certifications.append(cert.strip())
+        certifications = _extract_bullets(cert_text)
 
     return certifications if certifications else None
 
-def extract_summary(text: str) -> Optional[str]:
-    """Extract summary/profile from text."""
+def extract_summary(text: str, sections: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """Extract summary/profile from text (or from pre-split sections)."""
     # Look for summary/profile section
-    summary_section_match = re.search(r'# (Profile|PROFILE|Summary|SUMMARY|Professional Summary):?(.*?)(?=# [A-Za-z]+:|$)', text, re.DOTALL)
+    if sections is None:
+        sections = _split_sections(text)
+    summary_text = sections.get("summary")
 
-    if summary_section_match:
-        summary_text = summary_section_match.group(2).strip()
-        return summary_text
+    if summary_text is not None:
+        return summary_text.strip()
 
     return None
 
@@ -534,6 +784,16 @@ def main():
     parser.add_argument('--output-dir', required=True, help='Directory to save individual resume JSON files')
     parser.add_argument('--clean', action='store_true', help='Clean the output directory before extraction')
     parser.add_argument('--debug', action='store_true', help='Print debug information')
+    parser.add_argument('--include-raw-text', action='store_true',
+                        help='Include the raw resume text in the output JSON files (required for LLM processing)')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Write all resumes to a single resumes.jsonl file instead of one JSON file per candidate')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Number of worker processes for resume extraction (default: CPU count)')
+    parser.add_argument('--skip-validation', action='store_true',
+                        help='Skip validating extracted resumes against the Resume schema')
+    parser.add_argument('--pretty', action='store_true',
+                        help='Write indented, human-readable JSON files instead of compact JSON')
     args = parser.parse_args()
 
     # Clean the output directory if requested
@@ -542,12 +802,15 @@ def main():
         if output_path.exists():
             logger.info(f"Cleaning output directory: {args.output_dir}")
             # Remove all JSON files in the directory
-            for file_path in output_path.glob('*.json'):
-                file_path.unlink()
+            with os.scandir(output_path) as it:
+                for entry in it:
+                    if entry.is_file() and entry.name.endswith('.json'):
+                        os.unlink(entry.path)
             logger.info(f"Output directory cleaned")
 
     # Extract resumes
-    extract_resumes(args.input_file, args.output_dir, args.debug)
+    extract_resumes(args.input_file, args.output_dir, args.debug, args.include_raw_text, args.jsonl,
+                    args.workers, not args.skip_validation, args.pretty)
 
 if __name__ == "__main__":
     main()
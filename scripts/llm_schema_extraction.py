@@ -1,133 +1,1185 @@
 #!/usr/bin/env python3
 """
 Script to use an LLM to extract structured information from resumes according to the schema.
-Uses GPT-4o with structured output from OpenAI.
+Uses OpenAI structured outputs, with gpt-4o-mini escalating to GPT-4o when needed.
 """
 
 import os
 import sys
 import json
+import asyncio
+import random
+import uuid
+import hashlib
 import argparse
+import importlib.util
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-import requests
+from typing import Dict, List, Any, Optional, Tuple, Union
+import httpx
 from dotenv import load_dotenv
-from openai import OpenAI
+from pydantic import ValidationError
+import openai
+from openai import AsyncOpenAI
 import re
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import get_logger
+from src.utils.helpers import load_config
+from src.ingestion.database_handler import DatabaseHandler
 from src.retrieval.schema import Resume, Education, WorkExperience, ContactInfo
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import tiktoken
+except ImportError:  # tiktoken is optional; fall back to a character-based estimate
+    tiktoken = None
+
 logger = get_logger(__name__)
 
 # Load environment variables from .env file
 load_dotenv()
 
-def get_llm_extraction(resume_text: str, schema_json: str, preview_only: bool = False) -> Dict[str, Any]:
+# Maximum number of OpenAI requests in flight at once
+DEFAULT_CONCURRENCY = int(os.getenv("OPENAI_CONCURRENCY", "25"))
+
+# Resumes are extracted with the cheaper model first, and only re-extracted with the
+# fallback model when the result fails schema validation. An empty fallback disables this.
+EXTRACTION_MODEL = os.getenv("OPENAI_EXTRACTION_MODEL", "gpt-4o-mini")
+FALLBACK_MODEL = os.getenv("OPENAI_FALLBACK_MODEL", "gpt-4o")
+
+# Number of resumes served by each model (or the cache) in this run
+_model_usage: Counter = Counter()
+
+# Attempts per API call, with full-jitter exponential backoff between them
+MAX_API_ATTEMPTS = 6
+_RETRY_MAX_WAIT = 60.0
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APIConnectionError,  # includes APITimeoutError
+    openai.InternalServerError
+)
+
+# HTTP/2 lets concurrent requests share one connection; httpx needs the optional h2 package for it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Seconds between status checks of a submitted batch job
+BATCH_POLL_INTERVAL = 30
+
+_BATCH_TERMINAL_STATES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+# Directory where LLM responses are cached, keyed by a hash of the request
+DEFAULT_CACHE_DIR = "data/cache/llm_extraction"
+
+# Extracted resumes waiting to be inserted into the database, and how many are inserted at once
+DB_QUEUE_SIZE = 256
+DB_INSERT_BATCH_SIZE = 64
+
+# Marker of the applicant summary tables that precede the resumes in the source text
+_APPLICANT_MARKER = "Job applicants as of"
+_NEXT_HEADING_RE = re.compile(r'\n# [A-Z]')
+
+# Token budget for the resume text sent in each request
+MAX_RESUME_TOKENS = 6000
+# Rough characters-per-token ratio used when tiktoken is not installed
+_CHARS_PER_TOKEN = 4
+_BLANK_LINES_RE = re.compile(r'\n(?:[ \t]*\n){2,}')
+_SPACE_RUN_RE = re.compile(r'[ \t]{2,}')
+
+def _create_client(max_connections: int = DEFAULT_CONCURRENCY) -> AsyncOpenAI:
     """
-    Use GPT-4o to extract structured information from resume text according to the schema.
-    Uses OpenAI's structured output feature for more reliable extraction.
+    Create the OpenAI client shared by all requests in a run.
+
+    The client keeps a pool of keep-alive connections sized to the request
+    concurrency, and uses HTTP/2 when available, so TLS handshakes are paid
+    once per connection rather than once per resume.
 
     Args:
-        resume_text: The raw text of the resume
-        schema_json: JSON string representation of the schema
-        preview_only: If True, only print the prompt and don't call the API
+        max_connections: Maximum number of pooled connections
 
     Returns:
-        Dictionary containing the structured resume information
+        An AsyncOpenAI client
     """
     # Get API key from environment variable
     api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key and not preview_only:
+    if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
 
-    # Initialize OpenAI client
-    if not preview_only:
-        client = OpenAI(api_key=api_key)
-
-    # Parse the schema JSON to include in the system message
-    schema_dict = json.loads(schema_json)
-
-    # System message with instructions and schema
-    system_message = f"""
-You are an expert resume parser. Extract structured information from the resume text according to the provided schema.
-
-Schema:
-```json
-{json.dumps(schema_dict, indent=2)}
-```
-
-Follow these guidelines:
-1. Extract all relevant information that fits the schema
-2. If information is not present in the resume, use null or empty lists as appropriate
-3. Be precise and accurate in your extraction
-4. For education and work experience, extract dates in the format provided in the resume
-5. For responsibilities, extract complete bullet points as separate items in the list
-6. Your response must be a valid JSON object that conforms to the schema
-7. The JSON object must include the following required fields: document_type, candidate_name, contact_info, education, work_experience, skills
-"""
+    max_connections = max(max_connections, 1)
+    http_client = httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        timeout=httpx.Timeout(600.0, connect=5.0)
+    )
+
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
+def _strict_json_schema(node: Any) -> Any:
+    """
+    Convert a Pydantic JSON schema to the form required by OpenAI strict structured outputs.
+
+    Every object lists all of its properties as required and disallows additional
+    properties; optional fields stay optional by being nullable. Defaults, which
+    strict mode does not accept, are dropped.
+
+    Args:
+        node: JSON schema (or a part of one)
+
+    Returns:
+        The strict JSON schema
+    """
+    if isinstance(node, list):
+        return [_strict_json_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+
+    strict = {}
+    for key, value in node.items():
+        if key == "default":
+            continue
+        if key in ("properties", "$defs"):
+            # Keys of these mappings are names, not schema keywords
+            strict[key] = {name: _strict_json_schema(sub) for name, sub in value.items()}
+        else:
+            strict[key] = _strict_json_schema(value)
+
+    if "properties" in strict:
+        strict["required"] = list(strict["properties"])
+        strict["additionalProperties"] = False
+
+    return strict
+
+# Structured output format: the API guarantees responses conform to the Resume schema
+_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "Resume",
+        "strict": True,
+        "schema": _strict_json_schema(Resume.model_json_schema())
+    }
+}
+
+# Instructions sent as the system message of every request. It is identical
+# across calls, so OpenAI can serve it from its prompt cache; the schema itself
+# is sent through _RESPONSE_FORMAT.
+_SYSTEM_MESSAGE = (
+    "TASK: Extract the resume into JSON matching the response schema.\n"
+    "CONSTRAINTS: null or [] for missing information; copy dates as written; "
+    "one list item per responsibility bullet; document_type is \"resume\"."
+)
+
+def _build_messages(resume_text: str) -> List[Dict[str, str]]:
+    """
+    Build the chat messages asking the LLM to extract a resume.
+
+    Only the user message varies between resumes; the static instructions
+    live in the shared system message so they form a cacheable prefix.
+
+    Args:
+        resume_text: The raw text of the resume
+
+    Returns:
+        List of chat messages (system message with the instructions, user message with the resume)
+    """
+    user_message = f"RESUME:\n{resume_text}"
+
+    return [
+        {"role": "system", "content": _SYSTEM_MESSAGE},
+        {"role": "user", "content": user_message}
+    ]
+
+def _completion_params(messages: List[Dict[str, str]], model: str = EXTRACTION_MODEL) -> Dict[str, Any]:
+    """
+    Build the chat completion request parameters for the given messages.
+
+    Used both for direct API calls and for the request bodies of a batch job.
+    """
+    return {
+        "model": model,
+        "temperature": 0.2,  # Low temperature for more deterministic output
+        "messages": messages,
+        "response_format": _RESPONSE_FORMAT
+    }
+
+def _request_key(params: Dict[str, Any]) -> str:
+    """
+    Get a key identifying a chat completion request.
+
+    The key hashes the full request (model, sampling parameters, system message and
+    resume text), so changing any of them changes the key.
+
+    Args:
+        params: Chat completion request parameters
+
+    Returns:
+        Hex digest of the request
+    """
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+
+def _cache_file(cache_dir: Path, params: Dict[str, Any]) -> Path:
+    """
+    Get the cache file for a chat completion request.
+
+    Args:
+        cache_dir: Directory holding cached responses
+        params: Chat completion request parameters
+
+    Returns:
+        Path to the cache file
+    """
+    return cache_dir / f"{_request_key(params)}.json"
+
+def _read_cached_response(cache_file: Path) -> Optional[Dict[str, Any]]:
+    """Load a cached response, or return None if it is missing or unreadable."""
+    try:
+        return _read_json_file(cache_file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache file {cache_file}: {e}")
+        return None
+
+def _write_cached_response(cache_file: Path, data: Dict[str, Any]) -> None:
+    """Store a response in the cache."""
+    cache_file.parent.mkdir(exist_ok=True, parents=True)
+    _write_json_file(cache_file, data)
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Get the number of seconds to wait before retrying a failed API call.
+
+    Uses the server's Retry-After header when present, otherwise a random
+    delay of up to 2**attempt seconds so that concurrent requests that failed
+    together do not retry together.
+
+    Args:
+        error: The error raised by the failed call
+        attempt: Number of attempts made so far
+
+    Returns:
+        Delay in seconds, at most _RETRY_MAX_WAIT
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _RETRY_MAX_WAIT)
+        except ValueError:
+            pass
+
+    return random.uniform(0, min(_RETRY_MAX_WAIT, 2 ** attempt))
+
+async def _create_completion(client: AsyncOpenAI, params: Dict[str, Any]) -> Any:
+    """
+    Call the chat completions API, retrying rate limits and transient failures.
+
+    Retries happen while the caller holds its concurrency slot, so a burst of
+    429s also slows down the rate of new requests.
 
-    user_message = f"Extract structured information from this resume:\n\n{resume_text}"
+    Args:
+        client: OpenAI client
+        params: Chat completion request parameters
+
+    Returns:
+        The chat completion
+    """
+    # Retries are handled here rather than by the SDK so the backoff can be longer
+    client = client.with_options(max_retries=0)
+
+    for attempt in range(1, MAX_API_ATTEMPTS + 1):
+        try:
+            return await client.chat.completions.create(**params)
+        except _RETRYABLE_ERRORS as e:
+            if attempt == MAX_API_ATTEMPTS:
+                raise
+            delay = _retry_delay(e, attempt)
+            logger.warning(f"OpenAI request failed ({type(e).__name__}), retrying in {delay:.1f}s "
+                           f"(attempt {attempt}/{MAX_API_ATTEMPTS})")
+            await asyncio.sleep(delay)
+
+def _is_valid_resume(extracted_data: Dict[str, Any]) -> bool:
+    """Check whether extracted data validates against the Resume schema."""
+    try:
+        Resume.model_validate(extracted_data)
+        return True
+    except ValidationError:
+        return False
+
+async def _escalate_if_invalid(client: AsyncOpenAI, extracted_data: Dict[str, Any],
+                               messages: List[Dict[str, str]], model: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Re-extract a resume with FALLBACK_MODEL if the first-pass result fails validation.
+
+    Args:
+        client: OpenAI client
+        extracted_data: Result of the first-pass extraction
+        messages: Chat messages used for the first pass
+        model: Model that produced extracted_data
+
+    Returns:
+        Tuple of (extracted data, model that produced it)
+    """
+    if _is_valid_resume(extracted_data):
+        return extracted_data, model
+    if not FALLBACK_MODEL or model == FALLBACK_MODEL:
+        logger.warning(f"{model} result failed validation; saving it anyway")
+        return extracted_data, model
+
+    logger.info(f"{model} result failed validation, re-extracting with {FALLBACK_MODEL}")
+    response = await _create_completion(client, _completion_params(messages, FALLBACK_MODEL))
+    return _load_json(response.choices[0].message.content), FALLBACK_MODEL
+
+def _log_model_usage() -> None:
+    """Log how many resumes each model (or the cache) served in this run."""
+    if _model_usage:
+        usage = ", ".join(f"{source}: {count}" for source, count in _model_usage.most_common())
+        logger.info(f"Resumes served by: {usage}")
+
+async def get_llm_extraction(resume_text: str, preview_only: bool = False,
+                             client: Optional[AsyncOpenAI] = None,
+                             cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """
+    Use an LLM to extract structured information from resume text according to the schema.
+    Uses OpenAI's structured output feature for more reliable extraction. The resume is
+    extracted with EXTRACTION_MODEL and escalated to FALLBACK_MODEL if the result does
+    not validate.
+
+    Args:
+        resume_text: The raw text of the resume
+        preview_only: If True, only print the prompt and don't call the API
+        client: OpenAI client to use; one is created if not provided
+        cache_dir: Directory of cached responses to reuse and extend; None disables caching
+
+    Returns:
+        Dictionary containing the structured resume information
+    """
+    extracted_data, _ = await _extract_resume(resume_text, preview_only, client, cache_dir)
+    return extracted_data
+
+async def _extract_resume(resume_text: str, preview_only: bool = False,
+                          client: Optional[AsyncOpenAI] = None,
+                          cache_dir: Optional[Path] = None) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Extract a resume like get_llm_extraction, also reporting where the result came from.
+
+    Args:
+        resume_text: The raw text of the resume
+        preview_only: If True, only print the prompt and don't call the API
+        client: OpenAI client to use; one is created if not provided
+        cache_dir: Directory of cached responses to reuse and extend; None disables caching
+
+    Returns:
+        Tuple of (structured resume information, model that produced it or "cache";
+        None in preview mode)
+    """
+    messages = _build_messages(resume_text)
 
     # Print the prompt for preview
     logger.info("=== PROMPT PREVIEW ===")
-    logger.info(f"System message:\n{system_message}")
-    logger.info(f"User message:\n{user_message}")
+    logger.info(f"System message:\n{messages[0]['content']}")
+    logger.info(f"User message:\n{messages[1]['content']}")
     logger.info("=== END PROMPT PREVIEW ===")
 
     if preview_only:
         # Return a placeholder response for preview mode
-        return {"preview_mode": True, "message": "Preview only - no API call made"}
+        return {"preview_mode": True, "message": "Preview only - no API call made"}, None
+
+    params = _completion_params(messages)
+
+    # Reuse the response from a previous identical request if there is one
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = _cache_file(cache_dir, params)
+        cached = await asyncio.to_thread(_read_cached_response, cache_file)
+        if cached is not None:
+            logger.info("Using cached LLM response")
+            _model_usage["cache"] += 1
+            return cached, "cache"
+
+    # A client created here is only used for this resume, so it is closed again below
+    owns_client = client is None
+    if owns_client:
+        client = _create_client()
 
     try:
         # Call the OpenAI API with structured output format
-        response = client.chat.completions.create(
-            model="gpt-4o",
-            temperature=0.2,  # Low temperature for more deterministic output
-            messages=[
-                {"role": "system", "content": system_message},
-                {"role": "user", "content": user_message}
-            ],
-            response_format={"type": "json_object"}
-        )
+        response = await _create_completion(client, params)
 
         # Extract the structured response
-        extracted_data = json.loads(response.choices[0].message.content)
-        return extracted_data
+        extracted_data = _load_json(response.choices[0].message.content)
+        extracted_data, model = await _escalate_if_invalid(client, extracted_data, messages, params["model"])
+        logger.info(f"Resume extracted by {model}")
+        _model_usage[model] += 1
+
+        if cache_file is not None:
+            await asyncio.to_thread(_write_cached_response, cache_file, extracted_data)
+
+        return extracted_data, model
 
     except Exception as e:
         logger.error(f"Error calling OpenAI API: {e}")
         raise
+    finally:
+        if owns_client:
+            await client.close()
+
+def _load_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dump_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 encoded JSON in one buffer, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+def _read_json_file(path: Path) -> Dict[str, Any]:
+    """Load a JSON file."""
+    return _load_json(path.read_bytes())
+
+def _write_file_atomic(path: Path, content: bytes) -> None:
+    """
+    Write a file so that readers see either the old or the new content, never a partial write.
+
+    The content is written to a temporary file in the same directory, which is then
+    renamed over the target.
+    """
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(tmp_path, 'xb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _write_json_file(output_file: Path, data: Dict[str, Any]) -> None:
+    """Write data to an indented JSON file."""
+    _write_file_atomic(output_file, _dump_json(data, indent=True))
+
+def _extract_candidate_section(text: str, candidate_name: str) -> str:
+    """
+    Extract a candidate's section from text that also contains other content.
+
+    Args:
+        text: Text containing the candidate's "# <name>" heading
+        candidate_name: Name of the candidate
+
+    Returns:
+        Text from the candidate's heading up to the next major heading,
+        or the unchanged text if the heading is not found
+    """
+    heading = f"# {candidate_name}\n"
+    start_pos = text.find(heading)
+    if start_pos == -1:
+        return text
+
+    # Find the next major heading after this candidate's heading
+    next_heading_match = _NEXT_HEADING_RE.search(text, start_pos + len(heading))
+    if next_heading_match:
+        return text[start_pos:next_heading_match.start()].strip()
+
+    # If no next heading, just use the rest of the text
+    return text[start_pos:].strip()
+
+@lru_cache(maxsize=None)
+def _get_encoding():
+    """Get the tokenizer for the extraction model, or None if tiktoken is unavailable."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding, estimating tokens from length: {e}")
+        return None
+
+def _compact_resume_text(text: str, max_tokens: int = MAX_RESUME_TOKENS) -> str:
+    """
+    Reduce the number of tokens sent for a resume.
+
+    Collapses runs of blank lines and repeated spaces, then truncates the text
+    to the token budget.
+
+    Args:
+        text: Resume text
+        max_tokens: Maximum number of tokens to keep
+
+    Returns:
+        The compacted text
+    """
+    text = _BLANK_LINES_RE.sub('\n\n', text)
+    text = _SPACE_RUN_RE.sub(' ', text)
+
+    encoding = _get_encoding()
+    if encoding is not None:
+        tokens = encoding.encode(text)
+        if len(tokens) > max_tokens:
+            logger.warning(f"Truncating resume text from {len(tokens)} to {max_tokens} tokens")
+            text = encoding.decode(tokens[:max_tokens])
+    elif len(text) > max_tokens * _CHARS_PER_TOKEN:
+        logger.warning(f"Truncating resume text from {len(text)} to {max_tokens * _CHARS_PER_TOKEN} characters")
+        text = text[:max_tokens * _CHARS_PER_TOKEN]
+
+    return text
+
+def _prepare_resume_text(resume_data: Dict[str, Any], candidate_name: str) -> str:
+    """
+    Build the resume text sent to the LLM from an extracted resume.
+
+    Args:
+        resume_data: Extracted resume data
+        candidate_name: Name of the candidate, used to locate their section
+
+    Returns:
+        The resume text to extract from
+    """
+    # Get the raw text of the resume
+    resume_text = resume_data.get("raw_text", "")
+    if not resume_text:
+        logger.warning(f"No raw_text field found for {candidate_name}, using fallback method")
+        # If raw_text field doesn't exist, convert the entire resume data to text
+        # Remove the raw_text field if it exists to avoid circular references
+        resume_data_copy = {k: v for k, v in resume_data.items() if k != "raw_text"}
+        resume_text = _dump_json(resume_data_copy, indent=True).decode('utf-8')
+
+    # IMPROVED: Clean up the raw text if it contains applicant tables
+    if _APPLICANT_MARKER in resume_text:
+        logger.warning(f"Resume for {candidate_name} contains applicant tables, cleaning up")
+
+        # Try to extract just the relevant section for this candidate
+        resume_text = _extract_candidate_section(resume_text, candidate_name)
+
+        # If we couldn't find a section with the candidate's name, use the basic info we have
+        if _APPLICANT_MARKER in resume_text:
+            logger.warning(f"Could not find clean section for {candidate_name}, using basic info")
+            # Create a simplified resume text with just the basic info we know
+            resume_text = f"# {candidate_name}\n\nEmail: {resume_data.get('contact_info', {}).get('email', '')}\n"
+
+            # Add any other fields we have
+            if resume_data.get('contact_info', {}).get('phone'):
+                resume_text += f"Phone: {resume_data['contact_info']['phone']}\n"
+            if resume_data.get('contact_info', {}).get('linkedin'):
+                resume_text += f"LinkedIn: {resume_data['contact_info']['linkedin']}\n"
+
+    return _compact_resume_text(resume_text)
+
+class _DatabaseWriter:
+    """
+    Inserts extracted resumes into the database while extraction continues.
+
+    Resumes are queued by the extraction tasks and inserted in batches by a
+    single consumer task, so database writes overlap with waiting on the LLM.
+    The bounded queue applies backpressure if the database falls behind.
+
+    Once a resume is inserted, a marker naming the database is written next to
+    its output file, so later runs can tell which up-to-date outputs still need
+    to be inserted.
+    """
+
+    def __init__(self, db_config: Dict[str, Any], batch_size: int = DB_INSERT_BATCH_SIZE,
+                 max_pending: int = DB_QUEUE_SIZE):
+        """
+        Initialize the writer.
+
+        Args:
+            db_config: Database configuration for DatabaseHandler
+            batch_size: Maximum number of resumes inserted per transaction
+            max_pending: Maximum number of resumes waiting to be inserted
+        """
+        self.db_config = db_config
+        self.db_marker = _db_marker(db_config)
+        self.batch_size = batch_size
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self.inserted_count = 0
+        # SQLite connections can only be used from the thread that created them
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._db_handler = None
+        self._consumer = None
+
+    async def start(self) -> None:
+        """Connect to the database and start the consumer task."""
+        loop = asyncio.get_running_loop()
+        self._db_handler = await loop.run_in_executor(self._executor, DatabaseHandler, self.db_config)
+        self._consumer = asyncio.create_task(self._consume())
+
+    async def put(self, extracted_data: Dict[str, Any], output_file: Optional[Path] = None) -> None:
+        """
+        Queue an extracted resume for insertion.
+
+        Args:
+            extracted_data: Structured resume to insert
+            output_file: Output file of the resume, marked as inserted once the insert succeeds
+        """
+        candidate_name = extracted_data.get('candidate_name') or 'Unknown'
+        document_type = extracted_data.get('document_type', 'resume')
+        original_file = f"{candidate_name.replace(' ', '_')}.pdf"  # Simulated original file name
+        await self.queue.put(((document_type, original_file, extracted_data), output_file))
+
+    def _insert(self, batch: List[Tuple[Tuple[str, str, Dict[str, Any]], Optional[Path]]]) -> int:
+        """
+        Insert a batch of queued resumes, retrying them one at a time if the batch fails.
+
+        Runs on the writer thread.
+
+        Args:
+            batch: Queued (document, output file) pairs
+
+        Returns:
+            Number of resumes inserted
+        """
+        try:
+            inserted = self._db_handler.insert_documents([document for document, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                document, output_file = batch[0]
+                logger.error(f"Error inserting resume {output_file or document[1]} into the database: {e}")
+                return 0
+            logger.warning(f"Error inserting {len(batch)} resumes into the database, retrying one at a time: {e}")
+            return sum(self._insert([item]) for item in batch)
+
+        for _, output_file in batch:
+            if output_file is not None:
+                _write_file_atomic(_db_marker_file(output_file), self.db_marker)
+        return inserted
+
+    async def _consume(self) -> None:
+        """Insert queued resumes in batches until the end-of-input marker is received."""
+        loop = asyncio.get_running_loop()
+        done = False
+        while not done:
+            batch = []
+            item = await self.queue.get()
+            while True:
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size or self.queue.empty():
+                    break
+                item = self.queue.get_nowait()
+
+            if batch:
+                self.inserted_count += await loop.run_in_executor(self._executor, self._insert, batch)
+
+    async def close(self) -> int:
+        """
+        Wait for queued resumes to be inserted and close the database connection.
+
+        Returns:
+            Number of resumes inserted
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if self._consumer is not None:
+                await self.queue.put(None)
+                await self._consumer
+            if self._db_handler is not None:
+                await loop.run_in_executor(self._executor, self._db_handler.close)
+        finally:
+            self._executor.shutdown(wait=False)
+
+        logger.info(f"Inserted {self.inserted_count} resumes into the database")
+        return self.inserted_count
+
+def _key_file(output_file: Path) -> Path:
+    """Get the sidecar file recording the request an output file was produced from."""
+    return output_file.with_suffix(".sha256")
+
+def _db_marker_file(output_file: Path) -> Path:
+    """Get the sidecar file recording the database an output file was inserted into."""
+    return output_file.with_suffix(".inserted")
+
+def _db_marker(db_config: Dict[str, Any]) -> bytes:
+    """Identify a database for the inserted markers, by the resolved path of its file."""
+    return str(Path(db_config.get('path', '../data/hr_database.db')).resolve()).encode("utf-8")
+
+def _is_inserted(output_file: Path, db_marker: bytes) -> bool:
+    """Check whether an output file has been inserted into the database identified by db_marker."""
+    try:
+        return _db_marker_file(output_file).read_bytes() == db_marker
+    except OSError:
+        return False
+
+async def _queue_uninserted(db_writer: _DatabaseWriter, output_files: List[Path]) -> None:
+    """
+    Queue up-to-date outputs that have not been inserted into the writer's database yet.
+
+    Covers outputs produced by runs without --insert-db and resumes whose insert failed.
+
+    Args:
+        db_writer: Writer to queue the resumes on
+        output_files: Up-to-date output files that were not reprocessed
+    """
+    uninserted = [output_file for output_file in output_files if not _is_inserted(output_file, db_writer.db_marker)]
+    if uninserted:
+        logger.info(f"Queueing {len(uninserted)} up-to-date resumes that are not in the database yet")
+    for output_file in uninserted:
+        try:
+            extracted_data = await asyncio.to_thread(_read_json_file, output_file)
+        except Exception as e:
+            logger.error(f"Error reading output file {output_file}: {e}")
+            continue
+        await db_writer.put(extracted_data, output_file)
+
+def _is_up_to_date(resume_file: Path, output_file: Path, request_key: str) -> bool:
+    """
+    Check whether an output file is newer than its resume file and was produced by the same request.
+
+    Args:
+        resume_file: Extracted resume JSON file
+        output_file: LLM-processed resume JSON file
+        request_key: Key of the request that would be sent for the resume now
+
+    Returns:
+        True if the output does not need to be regenerated
+    """
+    try:
+        if output_file.stat().st_mtime < resume_file.stat().st_mtime:
+            return False
+        return _key_file(output_file).read_text(encoding="utf-8") == request_key
+    except OSError:
+        return False
+
+def _drop_up_to_date(groups: List[Tuple[str, List[Tuple[Path, str]]]],
+                     output_path: Path) -> Tuple[List[Tuple[str, List[Tuple[Path, str]]]], List[Path]]:
+    """
+    Remove resumes whose output files are already up to date.
+
+    Args:
+        groups: (resume text, [(resume file, candidate name), ...]) groups
+        output_path: Directory of LLM-processed resume JSON files
+
+    Returns:
+        Tuple of (the groups that still have resumes to process, the up-to-date output files)
+    """
+    remaining = []
+    up_to_date = []
+    for resume_text, resumes in groups:
+        request_key = _request_key(_completion_params(_build_messages(resume_text)))
+        stale = []
+        for resume_file, candidate_name in resumes:
+            output_file = output_path / resume_file.name
+            if _is_up_to_date(resume_file, output_file, request_key):
+                up_to_date.append(output_file)
+            else:
+                stale.append((resume_file, candidate_name))
+        if stale:
+            remaining.append((resume_text, stale))
+
+    if up_to_date:
+        logger.info(f"Skipping {len(up_to_date)} resumes whose output is up to date (use --force to reprocess)")
+
+    return remaining, up_to_date
+
+async def _save_extraction(extracted_data: Dict[str, Any], candidate_name: str, output_file: Path,
+                           model: str, db_writer: Optional[_DatabaseWriter] = None,
+                           request_key: Optional[str] = None) -> None:
+    """
+    Save an LLM-extracted resume.
+
+    The resume has already been validated (and escalated if needed) by
+    _escalate_if_invalid, so it is written as is.
+
+    Args:
+        extracted_data: Structured resume returned by the LLM
+        candidate_name: Name of the candidate, for logging
+        output_file: Path of the JSON file to write
+        model: Model that extracted the resume, or "cache", for logging
+        db_writer: If given, the resume is also queued for insertion into the database, and its
+            output is marked as inserted once that succeeds
+        request_key: Key of the request that produced the resume, recorded next to the output
+    """
+    # The new output is not in the database until it is inserted again
+    await asyncio.to_thread(_db_marker_file(output_file).unlink, missing_ok=True)
+
+    # Save to JSON file
+    await asyncio.to_thread(_write_json_file, output_file, extracted_data)
+    if request_key is not None:
+        await asyncio.to_thread(_write_file_atomic, _key_file(output_file), request_key.encode("utf-8"))
+
+    logger.info(f"Saved resume for {candidate_name} extracted by {model} to {output_file}")
+
+    if db_writer is not None:
+        await db_writer.put(extracted_data, output_file)
+
+async def _load_resume_text(resume_file: Path) -> Optional[Tuple[str, str]]:
+    """
+    Load a resume file and build the text to send to the LLM.
+
+    Args:
+        resume_file: Extracted resume JSON file
+
+    Returns:
+        Tuple of (candidate name, resume text), or None if the file could not be read
+    """
+    try:
+        # Read the resume file without blocking the event loop
+        resume_data = await asyncio.to_thread(_read_json_file, resume_file)
+    except Exception as e:
+        logger.error(f"Error reading resume file {resume_file}: {e}")
+        return None
+
+    candidate_name = resume_data.get("candidate_name", "Unknown")
+    return candidate_name, _prepare_resume_text(resume_data, candidate_name)
+
+async def _group_resumes(resume_files: List[Path]) -> List[Tuple[str, List[Tuple[Path, str]]]]:
+    """
+    Load resume files and group the ones whose resume text is identical.
+
+    Each group needs only one LLM request; its result is saved for every file in the group.
+
+    Args:
+        resume_files: Extracted resume JSON files
+
+    Returns:
+        List of (resume text, [(resume file, candidate name), ...]) groups
+    """
+    loaded = await asyncio.gather(*(_load_resume_text(resume_file) for resume_file in resume_files))
+
+    groups: Dict[str, Tuple[str, List[Tuple[Path, str]]]] = {}
+    resume_count = 0
+    for resume_file, resume in zip(resume_files, loaded):
+        if resume is None:
+            continue
+        candidate_name, resume_text = resume
+        resume_count += 1
+
+        key = hashlib.blake2b(resume_text.encode("utf-8"), digest_size=16).hexdigest()
+        if key in groups:
+            groups[key][1].append((resume_file, candidate_name))
+        else:
+            groups[key] = (resume_text, [(resume_file, candidate_name)])
+
+    duplicate_count = resume_count - len(groups)
+    if duplicate_count:
+        logger.info(f"Found {duplicate_count} duplicate resumes; each unique resume is sent to the LLM once")
 
-def process_resumes(input_dir: str, output_dir: str, preview_only: bool = False, max_previews: int = 3) -> None:
+    return list(groups.values())
+
+async def _process_resume_group(resume_text: str, resumes: List[Tuple[Path, str]], output_path: Path,
+                                preview_only: bool, client: Optional[AsyncOpenAI],
+                                semaphore: asyncio.Semaphore, cache_dir: Optional[Path] = None,
+                                db_writer: Optional[_DatabaseWriter] = None) -> None:
     """
-    Process all resume JSON files in the input directory using GPT-4o.
+    Extract a resume once, then validate and save it for every file it came from.
 
     Args:
-        input_dir: Directory containing extracted resume JSON files
-        output_dir: Directory to save LLM-processed resume JSON files
+        resume_text: Text of the resume to send to the LLM
+        resumes: (resume file, candidate name) pairs sharing this resume text
+        output_path: Directory to save the LLM-processed resumes to
+        preview_only: If True, only print the prompt and don't call the API
+        client: Shared OpenAI client (None in preview mode)
+        semaphore: Semaphore bounding the number of concurrent API calls
+        cache_dir: Directory of cached LLM responses; None disables caching
+        db_writer: If given, extracted resumes are also inserted into the database
+    """
+    resume_file, candidate_name = resumes[0]
+    try:
+        logger.info(f"Processing resume for {candidate_name}")
+
+        # Use the LLM to extract structured information
+        async with semaphore:
+            extracted_data, model = await _extract_resume(resume_text, preview_only, client, cache_dir)
+
+        if preview_only:
+            # Skip the rest in preview mode
+            return
+
+        request_key = _request_key(_completion_params(_build_messages(resume_text)))
+        for resume_file, candidate_name in resumes:
+            await _save_extraction(extracted_data, candidate_name, output_path / resume_file.name, model,
+                                   db_writer, request_key)
+
+    except Exception as e:
+        logger.error(f"Error processing resume file {resume_file}: {e}")
+
+async def process_resumes(resume_files: List[Path], output_path: Path,
+                          preview_only: bool = False, concurrency: int = DEFAULT_CONCURRENCY,
+                          cache_dir: Optional[Path] = None, db_config: Optional[Dict[str, Any]] = None,
+                          force: bool = False) -> None:
+    """
+    Process resume JSON files with the LLM, overlapping the API calls.
+
+    Args:
+        resume_files: Extracted resume JSON files to process
+        output_path: Directory to save LLM-processed resume JSON files
         preview_only: If True, only print the prompts and don't call the API
-        max_previews: Maximum number of prompts to preview
+        concurrency: Maximum number of API calls in flight at once
+        cache_dir: Directory of cached LLM responses; None disables caching
+        db_config: If given, extracted resumes are also inserted into this database as they arrive
+        force: If True, reprocess resumes even if their output is up to date
+    """
+    groups = await _group_resumes(resume_files)
+    up_to_date = []
+    if not force and not preview_only:
+        groups, up_to_date = _drop_up_to_date(groups, output_path)
+
+    client = None if preview_only else _create_client(concurrency)
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    db_writer = None
+    try:
+        if db_config is not None and not preview_only:
+            db_writer = _DatabaseWriter(db_config)
+            await db_writer.start()
+            await _queue_uninserted(db_writer, up_to_date)
+
+        await asyncio.gather(*(
+            _process_resume_group(resume_text, resumes, output_path, preview_only, client, semaphore,
+                                  cache_dir, db_writer)
+            for resume_text, resumes in groups
+        ))
+    finally:
+        if db_writer is not None:
+            await db_writer.close()
+        if client is not None:
+            await client.close()
+
+    _log_model_usage()
+
+async def _save_batch_result(client: AsyncOpenAI, extracted_data: Dict[str, Any], params: Dict[str, Any],
+                             resumes: List[Tuple[Path, str]], request_key: str, cache_file: Optional[Path],
+                             output_path: Path, db_writer: Optional[_DatabaseWriter]) -> None:
+    """
+    Escalate, cache and save the extraction of one batch request for every file it came from.
+
+    Args:
+        client: OpenAI client
+        extracted_data: Structured resume returned for the request
+        params: Chat completion request parameters of the request
+        resumes: (resume file, candidate name) pairs sharing this request
+        request_key: Key of the request, recorded next to each output
+        cache_file: Cache file to store the result in; None disables caching
+        output_path: Directory to save the LLM-processed resumes to
+        db_writer: If given, the resumes are also inserted into the database
     """
-    # This function is now replaced by the code in main()
-    pass
+    extracted_data, model = await _escalate_if_invalid(client, extracted_data, params["messages"], params["model"])
+    _model_usage[model] += 1
+    if cache_file is not None:
+        await asyncio.to_thread(_write_cached_response, cache_file, extracted_data)
+    for resume_file, candidate_name in resumes:
+        await _save_extraction(extracted_data, candidate_name, output_path / resume_file.name, model,
+                               db_writer, request_key)
+
+async def _retry_batch_request(client: AsyncOpenAI, semaphore: asyncio.Semaphore,
+                               resumes: List[Tuple[Path, str]], request_key: str, params: Dict[str, Any],
+                               cache_file: Optional[Path], output_path: Path,
+                               db_writer: Optional[_DatabaseWriter]) -> None:
+    """
+    Re-run a request that the batch job did not complete with a direct API call.
+
+    Args:
+        client: OpenAI client
+        semaphore: Semaphore bounding the number of concurrent API calls
+        resumes: (resume file, candidate name) pairs sharing this request
+        request_key: Key of the request, recorded next to each output
+        params: Chat completion request parameters of the request
+        cache_file: Cache file to store the result in; None disables caching
+        output_path: Directory to save the LLM-processed resumes to
+        db_writer: If given, the resumes are also inserted into the database
+    """
+    candidate_name = resumes[0][1]
+    try:
+        logger.info(f"Retrying resume for {candidate_name} outside the batch")
+        async with semaphore:
+            response = await _create_completion(client, params)
+        extracted_data = _load_json(response.choices[0].message.content)
+        await _save_batch_result(client, extracted_data, params, resumes, request_key, cache_file,
+                                 output_path, db_writer)
+    except Exception as e:
+        logger.error(f"Error processing resume for {candidate_name}: {e}")
+
+async def process_resumes_batch(resume_files: List[Path], output_path: Path,
+                                poll_interval: float = BATCH_POLL_INTERVAL,
+                                cache_dir: Optional[Path] = None,
+                                db_config: Optional[Dict[str, Any]] = None,
+                                force: bool = False) -> None:
+    """
+    Process resume JSON files through the OpenAI Batch API.
+
+    All prompts are uploaded as a single JSONL file and submitted as one batch job,
+    which is polled until it finishes. Results are matched back to their resume
+    files by custom_id. Resumes with a cached response are saved directly and
+    not submitted, and identical resumes are submitted once.
+
+    Args:
+        resume_files: Extracted resume JSON files to process
+        output_path: Directory to save LLM-processed resume JSON files
+        poll_interval: Seconds to wait between batch status checks
+        cache_dir: Directory of cached LLM responses; None disables caching
+        db_config: If given, extracted resumes are also inserted into this database
+        force: If True, reprocess resumes even if their output is up to date
+    """
+    groups = await _group_resumes(resume_files)
+    up_to_date = []
+    if not force:
+        groups, up_to_date = _drop_up_to_date(groups, output_path)
+
+    client = _create_client()
+
+    db_writer = None
+    try:
+        if db_config is not None:
+            db_writer = _DatabaseWriter(db_config)
+            await db_writer.start()
+            await _queue_uninserted(db_writer, up_to_date)
+
+        # Build one chat completion request per unique resume, keyed by its first file name
+        pending = {}
+        cache_files = {}
+        request_lines = []
+        for resume_text, resumes in groups:
+            params = _completion_params(_build_messages(resume_text))
+            request_key = _request_key(params)
+
+            if cache_dir is not None:
+                cache_file = _cache_file(cache_dir, params)
+                cached = await asyncio.to_thread(_read_cached_response, cache_file)
+                if cached is not None:
+                    logger.info(f"Using cached LLM response for {resumes[0][1]}")
+                    _model_usage["cache"] += 1
+                    for resume_file, candidate_name in resumes:
+                        await _save_extraction(cached, candidate_name, output_path / resume_file.name, "cache",
+                                               db_writer, request_key)
+                    continue
+
+            custom_id = resumes[0][0].name
+            pending[custom_id] = (resumes, request_key, params)
+            if cache_dir is not None:
+                cache_files[custom_id] = cache_file
+
+            request_lines.append(_dump_json({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": params
+            }))
+
+        if not request_lines:
+            logger.info("No resumes to submit")
+            return
+
+        batch_input = await client.files.create(
+            file=("resume_extraction_batch.jsonl", b"\n".join(request_lines)),
+            purpose="batch"
+        )
+        batch = await client.batches.create(
+            input_file_id=batch_input.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(request_lines)} resumes")
+
+        # Poll until the batch reaches a terminal state
+        while batch.status not in _BATCH_TERMINAL_STATES:
+            await asyncio.sleep(poll_interval)
+            batch = await client.batches.retrieve(batch.id)
+            logger.info(f"Batch {batch.id} status: {batch.status}")
+
+        if batch.status != "completed":
+            logger.error(f"Batch {batch.id} finished with status {batch.status}")
+
+        # Demultiplex the results back to the output files of each resume
+        completed = set()
+        if batch.output_file_id:
+            output = await client.files.content(batch.output_file_id)
+            for line in output.text.splitlines():
+                if not line.strip():
+                    continue
+                result = _load_json(line)
+                custom_id = result["custom_id"]
+                if custom_id not in pending:
+                    logger.warning(f"Ignoring batch result with unknown custom_id {custom_id}")
+                    continue
+                resumes, request_key, params = pending[custom_id]
+
+                response = result.get("response") or {}
+                if result.get("error") or response.get("status_code") != 200:
+                    logger.error(f"Batch request for {resumes[0][1]} failed: "
+                                 f"{result.get('error') or response.get('body')}")
+                    continue
+
+                try:
+                    extracted_data = _load_json(response["body"]["choices"][0]["message"]["content"])
+                    await _save_batch_result(client, extracted_data, params, resumes, request_key,
+                                             cache_files.get(custom_id), output_path, db_writer)
+                    completed.add(custom_id)
+                except Exception as e:
+                    logger.error(f"Error processing batch result for {custom_id}: {e}")
+
+        # Requests that failed inside the batch are reported in a separate error file
+        if batch.error_file_id:
+            errors = await client.files.content(batch.error_file_id)
+            for line in errors.text.splitlines():
+                if not line.strip():
+                    continue
+                result = _load_json(line)
+                custom_id = result.get("custom_id")
+                name = pending[custom_id][0][0][1] if custom_id in pending else custom_id
+                error = result.get("error") or (result.get("response") or {}).get("body")
+                logger.error(f"Batch request for {name} failed: {error}")
+
+        # Retry every resume the batch did not produce a result for with direct API calls
+        retry_ids = [custom_id for custom_id in pending if custom_id not in completed]
+        if retry_ids:
+            logger.warning(f"{len(retry_ids)} resumes have no batch result, retrying them with direct API calls")
+            semaphore = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+            await asyncio.gather(*(
+                _retry_batch_request(client, semaphore, *pending[custom_id], cache_files.get(custom_id),
+                                     output_path, db_writer)
+                for custom_id in retry_ids
+            ))
+    finally:
+        if db_writer is not None:
+            await db_writer.close()
+        await client.close()
+        _log_model_usage()
 
 def main():
     """Main function to run the script."""
-    parser = argparse.ArgumentParser(description="Use GPT-4o to extract structured information from resumes.")
+    parser = argparse.ArgumentParser(description="Use an LLM to extract structured information from resumes.")
     parser.add_argument("--input-dir", type=str, default="data/extracted_resumes",
                         help="Directory containing extracted resume JSON files")
     parser.add_argument("--output-dir", type=str, default="data/llm_processed_resumes",
-                        help="Directory to save GPT-4o processed resume JSON files")
+                        help="Directory to save LLM-processed resume JSON files")
     parser.add_argument("--preview", action="store_true",
                         help="Preview mode: only print prompts, don't call the API")
     parser.add_argument("--max-previews", type=int, default=3,
                         help="Maximum number of prompts to preview in preview mode")
     parser.add_argument("--specific-file", type=str, default=None,
                         help="Process only a specific file in the input directory")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Maximum number of concurrent API requests "
+                             "(default: $OPENAI_CONCURRENCY or 25)")
+    parser.add_argument("--mode", choices=["online", "batch"], default="online",
+                        help="online: call the API directly; batch: submit all resumes as one "
+                             "OpenAI Batch API job (half the cost, results within 24h)")
+    parser.add_argument("--cache-dir", type=str, default=DEFAULT_CACHE_DIR,
+                        help="Directory where LLM responses are cached and reused across runs")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always call the API, ignoring and not updating the response cache")
+    parser.add_argument("--force", action="store_true",
+                        help="Reprocess resumes even if their output file is up to date")
+    parser.add_argument("--insert-db", action="store_true",
+                        help="Also insert each processed resume into the database as soon as it is extracted; "
+                             "up-to-date outputs not yet in the database are inserted too")
+    parser.add_argument("--config", type=str, default="config/config.yaml",
+                        help="Path to configuration file (used with --insert-db)")
 
     args = parser.parse_args()
 
@@ -143,97 +1195,42 @@ def main():
         logger.info(f"Processing only the specified file: {args.specific_file}")
     else:
         # Process all resume files in the directory
-        resume_files = list(input_path.glob("*.json"))
+        if not input_path.is_dir():
+            logger.error(f"Input directory {args.input_dir} not found")
+            return
+        with os.scandir(input_path) as entries:
+            resume_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+            )
         logger.info(f"Found {len(resume_files)} resume files to process")
 
     # Ensure output directory exists
     output_path = Path(args.output_dir)
     output_path.mkdir(exist_ok=True, parents=True)
 
-    # Get the schema as a JSON string
-    schema_dict = Resume.model_json_schema()  # Updated from schema() to model_json_schema()
-    schema_json = json.dumps(schema_dict, indent=2)
-
     # Limit the number of previews if in preview mode
     if args.preview:
         if not args.specific_file:
             resume_files = resume_files[:args.max_previews]
         logger.info(f"Preview mode: showing prompts for {len(resume_files)} resumes")
 
-    for resume_file in resume_files:
-        try:
-            # Read the resume file
-            with open(resume_file, 'r', encoding='utf-8') as f:
-                resume_data = json.load(f)
-
-            candidate_name = resume_data.get("candidate_name", "Unknown")
-            logger.info(f"Processing resume for {candidate_name}")
-
-            # Get the raw text of the resume
-            resume_text = resume_data.get("raw_text", "")
-            if not resume_text:
-                logger.warning(f"No raw_text field found for {candidate_name}, using fallback method")
-                # If raw_text field doesn't exist, convert the entire resume data to text
-                # Remove the raw_text field if it exists to avoid circular references
-                resume_data_copy = {k: v for k, v in resume_data.items() if k != "raw_text"}
-                resume_text = json.dumps(resume_data_copy, indent=2)
-
-            # IMPROVED: Clean up the raw text if it contains applicant tables
-            if "Job applicants as of" in resume_text:
-                logger.warning(f"Resume for {candidate_name} contains applicant tables, cleaning up")
-
-                # Try to extract just the relevant section for this candidate
-                candidate_section_pattern = f"# {re.escape(candidate_name)}\n"
-                candidate_section_match = re.search(candidate_section_pattern, resume_text)
-
-                if candidate_section_match:
-                    start_pos = candidate_section_match.start()
-
-                    # Find the next major heading after this position
-                    next_heading_match = re.search(r'\n# [A-Z]', resume_text[start_pos + len(candidate_section_pattern):])
-                    if next_heading_match:
-                        end_pos = start_pos + len(candidate_section_pattern) + next_heading_match.start()
-                        resume_text = resume_text[start_pos:end_pos].strip()
-                    else:
-                        # If no next heading, just use the rest of the text
-                        resume_text = resume_text[start_pos:].strip()
-
-                # If we couldn't find a section with the candidate's name, use the basic info we have
-                if "Job applicants as of" in resume_text:
-                    logger.warning(f"Could not find clean section for {candidate_name}, using basic info")
-                    # Create a simplified resume text with just the basic info we know
-                    resume_text = f"# {candidate_name}\n\nEmail: {resume_data.get('contact_info', {}).get('email', '')}\n"
-
-                    # Add any other fields we have
-                    if resume_data.get('contact_info', {}).get('phone'):
-                        resume_text += f"Phone: {resume_data['contact_info']['phone']}\n"
-                    if resume_data.get('contact_info', {}).get('linkedin'):
-                        resume_text += f"LinkedIn: {resume_data['contact_info']['linkedin']}\n"
-
-            # Use GPT-4o to extract structured information
-            extracted_data = get_llm_extraction(resume_text, schema_json, args.preview)
-
-            if args.preview:
-                # Skip the rest in preview mode
-                continue
-
-            # Validate against schema
-            try:
-                Resume(**extracted_data)
-                logger.info(f"GPT-4o extracted resume for {candidate_name} validated successfully")
-            except Exception as e:
-                logger.warning(f"GPT-4o extracted resume for {candidate_name} failed validation: {e}")
-                # Continue processing even if validation fails
-
-            # Save to JSON file
-            output_file = output_path / resume_file.name
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(extracted_data, f, indent=2)
+    cache_dir = None if args.no_cache else Path(args.cache_dir)
 
-            logger.info(f"Saved GPT-4o processed resume for {candidate_name} to {output_file}")
+    db_config = None
+    if args.insert_db:
+        config = load_config(args.config)
+        if not config:
+            logger.error("Failed to load configuration")
+            return
+        db_config = config.get('database', {})
 
-        except Exception as e:
-            logger.error(f"Error processing resume file {resume_file}: {e}")
+    if args.mode == "batch" and not args.preview:
+        asyncio.run(process_resumes_batch(resume_files, output_path, cache_dir=cache_dir, db_config=db_config,
+                                          force=args.force))
+    else:
+        asyncio.run(process_resumes(resume_files, output_path, args.preview, args.concurrency, cache_dir,
+                                    db_config, args.force))
 
 if __name__ == "__main__":
     main()
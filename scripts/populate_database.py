@@ -6,9 +6,9 @@ Script to insert extracted resumes into the database.
 import os
 import sys
 import json
-import glob
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -17,8 +17,70 @@ from src.utils.logger import get_logger
 from src.ingestion.database_handler import DatabaseHandler
 from src.utils.helpers import load_config
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Number of threads used to load resume JSON files
+DEFAULT_LOAD_WORKERS = 16
+
+# Number of resumes written to the database per transaction
+INSERT_BATCH_SIZE = 1000
+
+def _load_resume(resume_file: str) -> Optional[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Load a resume JSON file as a row for insertion.
+
+    Args:
+        resume_file: Path to the resume JSON file
+
+    Returns:
+        Tuple of (document_type, original file name, resume data), or None if the file could not be loaded
+    """
+    try:
+        if orjson is not None:
+            with open(resume_file, 'rb') as f:
+                resume_data = orjson.loads(f.read())
+        else:
+            with open(resume_file, 'r', encoding='utf-8') as f:
+                resume_data = json.load(f)
+
+        candidate_name = resume_data.get('candidate_name', Path(resume_file).stem)
+        document_type = resume_data.get('document_type', 'resume')
+        original_file = f"{candidate_name.replace(' ', '_')}.pdf"  # Simulated original file name
+
+        return document_type, original_file, resume_data
+
+    except Exception as e:
+        logger.error(f"Error loading resume {resume_file}: {e}")
+        return None
+
+def _insert_batch(db_handler: DatabaseHandler, batch: List[Tuple[str, Tuple[str, str, Dict[str, Any]]]]) -> int:
+    """
+    Insert a batch of resumes in a single transaction.
+
+    If the batch fails, its resumes are retried one at a time so a single bad
+    resume only loses itself, and that resume's file is named in the log.
+
+    Args:
+        db_handler: Database handler to insert into
+        batch: (resume file, (document_type, original file name, resume data)) pairs
+
+    Returns:
+        Number of resumes inserted
+    """
+    try:
+        return db_handler.insert_documents([document for _, document in batch])
+    except Exception as e:
+        if len(batch) == 1:
+            logger.error(f"Error inserting resume {batch[0][0]}: {e}")
+            return 0
+        logger.warning(f"Error inserting a batch of {len(batch)} resumes, retrying one at a time: {e}")
+        return sum(_insert_batch(db_handler, [item]) for item in batch)
+
 def populate_database(resumes_dir: str, config_path: str) -> int:
     """
     Insert extracted resumes into the database.
@@ -40,33 +102,30 @@ def populate_database(resumes_dir: str, config_path: str) -> int:
     db_handler = DatabaseHandler(config.get('database', {}))
 
     # Get all JSON files in the resumes directory
-    resume_files = glob.glob(os.path.join(resumes_dir, "*.json"))
-    logger.info(f"Found {len(resume_files)} resume JSON files in {resumes_dir}")
-
-    # Insert each resume into the database
-    inserted_count = 0
-
-    for resume_file in resume_files:
-        try:
-            # Load resume data
-            with open(resume_file, 'r', encoding='utf-8') as f:
-                resume_data = json.load(f)
-
-            # Get candidate name for logging
-            candidate_name = resume_data.get('candidate_name', Path(resume_file).stem)
-            logger.info(f"Inserting resume for {candidate_name} into database")
-
-            # Insert into database
-            document_type = resume_data.get('document_type', 'resume')
-            original_file = f"{candidate_name.replace(' ', '_')}.pdf"  # Simulated original file name
+    if not os.path.isdir(resumes_dir):
+        logger.error(f"Resumes directory {resumes_dir} not found")
+        db_handler.close()
+        return 0
 
-            db_handler.insert_document(document_type, original_file, resume_data)
-            logger.info(f"Successfully inserted resume for {candidate_name}")
+    with os.scandir(resumes_dir) as entries:
+        resume_files = sorted(
+            entry.path for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        )
+    logger.info(f"Found {len(resume_files)} resume JSON files in {resumes_dir}")
 
-            inserted_count += 1
+    # Load the resume files in parallel; file reads release the GIL
+    with ThreadPoolExecutor(max_workers=DEFAULT_LOAD_WORKERS) as executor:
+        documents = [
+            (resume_file, doc)
+            for resume_file, doc in zip(resume_files, executor.map(_load_resume, resume_files))
+            if doc is not None
+        ]
 
-        except Exception as e:
-            logger.error(f"Error inserting resume {resume_file}: {e}")
+    # Insert the resumes in bounded transactions
+    inserted_count = 0
+    for start in range(0, len(documents), INSERT_BATCH_SIZE):
+        inserted_count += _insert_batch(db_handler, documents[start:start + INSERT_BATCH_SIZE])
 
     # Close database connection
     db_handler.close()
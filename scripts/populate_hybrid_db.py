@@ -5,79 +5,66 @@ Script to populate the hybrid database with extracted resumes.
 
 import os
 import sys
-import json
-import glob
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import List, Optional
 import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from tqdm import tqdm
-import uuid
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import get_logger
-from src.database.schema import Candidate, ContactInfo, Education, WorkExperience
-from src.database.hybrid_search import HybridSearchHandler
+from src.database.schema import Candidate
+from src.database.resume_loader import convert_json_to_candidate, load_candidate_file
 
 logger = get_logger(__name__)
 
-def convert_json_to_candidate(resume_data: Dict[str, Any]) -> Candidate:
+# Number of candidates inserted per database call
+DEFAULT_BATCH_SIZE = 500
+
+# Number of files handed to a parsing process at a time
+LOAD_CHUNKSIZE = 64
+
+def _flush_batch(db_handler: "HybridSearchHandler", batch: List[Candidate]) -> int:
     """
-    Convert a resume JSON to a Candidate object.
+    Insert a batch of candidates and clear it.
 
     Args:
-        resume_data: Resume data as a dictionary
+        db_handler: Hybrid database handler
+        batch: Candidates waiting to be inserted
 
     Returns:
-        Candidate object
+        Number of candidates inserted
     """
-    # Create contact info
-    contact_info = ContactInfo(**resume_data.get("contact_info", {}))
-
-    # Create education list
-    education_list = []
-    for edu_data in resume_data.get("education", []):
-        # Set graduation_date to None to avoid date parsing issues
-        edu_data["graduation_date"] = None
-        education_list.append(Education(**edu_data))
-
-    # Create work experience list
-    work_experience_list = []
-    for exp_data in resume_data.get("work_experience", []):
-        # Handle date format issues - set to None to avoid date parsing
-        exp_data["start_date"] = None
-        exp_data["end_date"] = None
-
-        # Add an ID field if missing
-        if "id" not in exp_data:
-            exp_data["id"] = str(uuid.uuid4())
-
-        work_experience_list.append(WorkExperience(**exp_data))
-
-    # Ensure certifications is a list
-    certifications = resume_data.get("certifications", [])
-    if certifications is None:
-        certifications = []
-
-    # Create candidate
-    candidate = Candidate(
-        candidate_name=resume_data.get("candidate_name", ""),
-        document_type=resume_data.get("document_type", "resume"),
-        contact_info=contact_info,
-        education=education_list,
-        work_experience=work_experience_list,
-        skills=resume_data.get("skills", []),
-        certifications=certifications,
-        summary=resume_data.get("summary", None),
-        raw_text=resume_data.get("raw_text", None)
-    )
+    if not batch:
+        return 0
+
+    try:
+        db_handler.insert_candidates_bulk(batch)
+        logger.info(f"Successfully inserted a batch of {len(batch)} resumes")
+        return len(batch)
+    except Exception as e:
+        if len(batch) == 1:
+            logger.error(f"Error inserting resume for {batch[0].candidate_name}: {e}")
+            logger.exception(e)
+            return 0
 
-    return candidate
+        # A failed batch leaves nothing behind, so retry its resumes one at a time
+        # and only drop the ones that fail on their own
+        logger.warning(f"Error inserting a batch of {len(batch)} resumes, retrying one at a time: {e}")
+        return sum(_flush_batch(db_handler, [candidate]) for candidate in batch)
+    finally:
+        batch.clear()
 
 def populate_database(resumes_dir: str,
                       duckdb_path: str = "data/hr_database.duckdb",
-                      chroma_path: str = "data/chroma_db") -> int:
+                      chroma_path: str = "data/chroma_db",
+                      batch_size: int = DEFAULT_BATCH_SIZE,
+                      workers: Optional[int] = None,
+                      trust_input: bool = False) -> int:
     """
     Insert extracted resumes into the hybrid database.
 
@@ -85,10 +72,17 @@ def populate_database(resumes_dir: str,
         resumes_dir: Directory containing extracted resume JSON files
         duckdb_path: Path to the DuckDB database file
         chroma_path: Path to the ChromaDB directory
+        batch_size: Number of candidates to insert per database call
+        workers: Number of processes used to parse resumes (defaults to the CPU count)
+        trust_input: Whether to skip Pydantic validation of the resume JSON
 
     Returns:
         Number of resumes inserted into the database
     """
+    # Imported here rather than at module level: spawned parsing workers re-import
+    # this script, and must not load ChromaDB and the embedding model
+    from src.database.hybrid_search import HybridSearchHandler
+
     # Initialize database handler
     db_handler = HybridSearchHandler(
         duckdb_path=duckdb_path,
@@ -96,34 +90,41 @@ def populate_database(resumes_dir: str,
     )
 
     # Get all JSON files in the resumes directory
-    resume_files = glob.glob(os.path.join(resumes_dir, "*.json"))
+    if not os.path.isdir(resumes_dir):
+        logger.error(f"Resumes directory {resumes_dir} not found")
+        db_handler.close()
+        return 0
+
+    with os.scandir(resumes_dir) as entries:
+        resume_files = sorted(
+            entry.path for entry in entries
+            if entry.name.endswith(".json") and not entry.name.startswith(".") and entry.is_file()
+        )
     logger.info(f"Found {len(resume_files)} resume JSON files in {resumes_dir}")
 
-    # Insert each resume into the database
+    # Convert resumes and insert them in batches
     inserted_count = 0
+    batch: List[Candidate] = []
 
-    for resume_file in tqdm(resume_files, desc="Inserting resumes"):
-        try:
-            # Load resume data
-            with open(resume_file, 'r', encoding='utf-8') as f:
-                resume_data = json.load(f)
+    # Parse and validate resumes in worker processes; insert from this one.
+    # Workers are spawned rather than forked so they do not inherit the open
+    # database connections or the embedding model's threads.
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        candidates = executor.map(
+            partial(load_candidate_file, trust_input=trust_input),
+            resume_files,
+            chunksize=LOAD_CHUNKSIZE
+        )
 
-            # Get candidate name for logging
-            candidate_name = resume_data.get('candidate_name', Path(resume_file).stem)
-            logger.info(f"Inserting resume for {candidate_name} into database")
+        for candidate in tqdm(candidates, total=len(resume_files), desc="Inserting resumes"):
+            if candidate is None:
+                continue
 
-            # Convert to Candidate object
-            candidate = convert_json_to_candidate(resume_data)
+            batch.append(candidate)
+            if len(batch) >= batch_size:
+                inserted_count += _flush_batch(db_handler, batch)
 
-            # Insert into database
-            db_handler.insert_candidate(candidate)
-            logger.info(f"Successfully inserted resume for {candidate_name}")
-
-            inserted_count += 1
-
-        except Exception as e:
-            logger.error(f"Error inserting resume {resume_file}: {e}")
-            logger.exception(e)
+    inserted_count += _flush_batch(db_handler, batch)
 
     # Close database connection
     db_handler.close()
@@ -156,13 +157,36 @@ def main():
         help="Path to the ChromaDB directory"
     )
 
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help="Number of candidates to insert per database call"
+    )
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes used to parse resumes (defaults to the CPU count)"
+    )
+
+    parser.add_argument(
+        "--trust-input",
+        action="store_true",
+        help="Skip Pydantic validation of the resume JSON (only for already validated extraction output)"
+    )
+
     args = parser.parse_args()
 
     # Populate database
     inserted_count = populate_database(
         args.resumes_dir,
         args.duckdb_path,
-        args.chroma_path
+        args.chroma_path,
+        args.batch_size,
+        args.workers,
+        args.trust_input
     )
 
     print(f"Successfully inserted {inserted_count} resumes into the database")
@@ -33,7 +33,7 @@ fi
 
 # Step 2: Extract individual resumes
 echo "Step 2: Extracting individual resumes..."
-python scripts/extract_resumes.py --input-file "data/processed_text/Sales Engineer AI Growth.txt" --output-dir "data/extracted_resumes" --clean
+python scripts/extract_resumes.py --input-file "data/processed_text/Sales Engineer AI Growth.txt" --output-dir "data/extracted_resumes" --clean --include-raw-text
 
 # Step 3: Process resumes with GPT-4o
 echo "Step 3: Processing resumes with GPT-4o..."
@@ -5,7 +5,10 @@ Script to search for resumes using the hybrid search capabilities.
 
 import os
 import sys
+import csv
 import json
+import socket
+import socketserver
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import argparse
@@ -16,16 +19,57 @@ from rich.table import Table
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import get_logger
-from src.database.schema import SearchQuery
-from src.database.hybrid_search import HybridSearchHandler
+from src.database.schema import SearchQuery, SearchResult
+from src.database.hybrid_search import get_handler
 
 logger = get_logger(__name__)
 console = Console()
 
+# Default path of the search server's Unix socket (see --serve)
+DEFAULT_SOCKET_PATH = "data/search_resumes.sock"
+
+# Seconds to wait on a search server socket operation before giving up. The server
+# answers one connection at a time, so a stalled peer must not block it (or the
+# clients queued behind it) forever.
+SERVER_TIMEOUT = 10.0
+
+# Result sets larger than this are printed as TSV rather than a rich table
+MAX_TABLE_ROWS = 100
+
+def _write_tsv(results, verbose=False):
+    """
+    Write search results to stdout as tab-separated values, one row per result.
+
+    Args:
+        results: List of search results
+        verbose: Whether to include match details
+    """
+    writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+
+    header = ["score", "name", "skills", "experience"]
+    if verbose:
+        header.append("match_details")
+    writer.writerow(header)
+
+    for result in results:
+        candidate = result.candidate
+        row = [
+            f"{result.score:.2f}",
+            candidate.candidate_name,
+            ", ".join(candidate.skills),
+            "; ".join(f"{exp.role} at {exp.company}" for exp in candidate.work_experience)
+        ]
+        if verbose:
+            row.append(", ".join(f"{key}: {value:.2f}" for key, value in result.match_details.items()))
+        writer.writerow(row)
+
 def display_search_results(results, verbose=False):
     """
     Display search results in a formatted table.
 
+    Large result sets are written as plain tab-separated rows instead, since a
+    rich table has to hold every formatted row in memory before it is printed.
+
     Args:
         results: List of search results
         verbose: Whether to display detailed information
@@ -34,6 +78,10 @@ def display_search_results(results, verbose=False):
         console.print("[bold red]No results found[/bold red]")
         return
 
+    if len(results) > MAX_TABLE_ROWS:
+        _write_tsv(results, verbose)
+        return
+
     table = Table(title="Search Results")
 
     table.add_column("Score", justify="right", style="cyan", no_wrap=True)
@@ -86,6 +134,134 @@ def display_search_results(results, verbose=False):
 
     console.print(table)
 
+class _SearchRequestHandler(socketserver.StreamRequestHandler):
+    """Answer one JSON search request per connection using the server's shared handler."""
+
+    # Drop clients that stop sending instead of blocking the server
+    timeout = SERVER_TIMEOUT
+
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+
+            if (request.get("duckdb_path"), request.get("chroma_path")) != self.server.db_paths:
+                response = {"error": "server is attached to a different database"}
+            else:
+                results = self.server.db_handler.search(SearchQuery(**request["query"]))
+                response = {"results": [result.model_dump(mode="json") for result in results]}
+
+        except Exception as e:
+            logger.error(f"Error handling search request: {e}")
+            response = {"error": str(e)}
+
+        self.wfile.write(json.dumps(response).encode('utf-8') + b"\n")
+
+def _server_is_running(socket_path: str) -> bool:
+    """
+    Check whether a search server is listening on a socket.
+
+    Args:
+        socket_path: Path of the Unix domain socket
+
+    Returns:
+        True if something accepts connections on the socket
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(SERVER_TIMEOUT)
+            sock.connect(socket_path)
+        return True
+    except OSError:
+        return False
+
+def serve(socket_path: str = DEFAULT_SOCKET_PATH,
+          duckdb_path: str = "data/hr_database.duckdb",
+          chroma_path: str = "data/chroma_db") -> int:
+    """
+    Run a search server on a Unix domain socket.
+
+    The databases and embedding model are loaded once, so searches sent by other
+    invocations of this script skip the startup cost.
+
+    Args:
+        socket_path: Path of the Unix domain socket to listen on
+        duckdb_path: Path to the DuckDB database file
+        chroma_path: Path to the ChromaDB directory
+
+    Returns:
+        Exit code: 0 after serving, 1 if another server already owns the socket
+    """
+    if os.path.exists(socket_path):
+        # Never take over the socket of a server that is still running
+        if _server_is_running(socket_path):
+            logger.error(f"A search server is already running on {socket_path}")
+            return 1
+
+        # Remove a stale socket left behind by a previous server
+        os.unlink(socket_path)
+    Path(socket_path).parent.mkdir(exist_ok=True, parents=True)
+
+    db_handler = get_handler(duckdb_path, chroma_path)
+
+    server = socketserver.UnixStreamServer(socket_path, _SearchRequestHandler)
+    server.db_handler = db_handler
+    server.db_paths = (duckdb_path, chroma_path)
+
+    logger.info(f"Serving searches on {socket_path}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        os.unlink(socket_path)
+
+    return 0
+
+def _search_via_server(socket_path: str,
+                       search_query: SearchQuery,
+                       duckdb_path: str,
+                       chroma_path: str) -> Optional[List[SearchResult]]:
+    """
+    Send a search to a running search server.
+
+    Args:
+        socket_path: Path of the server's Unix domain socket
+        search_query: Search query parameters
+        duckdb_path: Path to the DuckDB database file
+        chroma_path: Path to the ChromaDB directory
+
+    Returns:
+        List of search results, or None if no suitable server is available
+    """
+    if not os.path.exists(socket_path):
+        return None
+
+    request = {
+        "duckdb_path": duckdb_path,
+        "chroma_path": chroma_path,
+        "query": search_query.model_dump()
+    }
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            # A hung or busy server times out (socket.timeout is an OSError) and
+            # the search falls back to running in-process
+            sock.settimeout(SERVER_TIMEOUT)
+            sock.connect(socket_path)
+            sock.sendall(json.dumps(request).encode('utf-8') + b"\n")
+            with sock.makefile('rb') as f:
+                response = json.loads(f.readline())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Search server at {socket_path} is not available ({e}), searching in-process")
+        return None
+
+    if "error" in response:
+        logger.warning(f"Search server could not handle the query ({response['error']}), searching in-process")
+        return None
+
+    return [SearchResult(**result) for result in response["results"]]
+
 def search_resumes(query_text: Optional[str] = None,
                    skills: Optional[List[str]] = None,
                    companies: Optional[List[str]] = None,
@@ -94,10 +270,14 @@ def search_resumes(query_text: Optional[str] = None,
                    limit: int = 10,
                    duckdb_path: str = "data/hr_database.duckdb",
                    chroma_path: str = "data/chroma_db",
-                   verbose: bool = False):
+                   verbose: bool = False,
+                   socket_path: Optional[str] = DEFAULT_SOCKET_PATH):
     """
     Search for resumes using the hybrid search capabilities.
 
+    The search is sent to a running search server (see --serve) when there is
+    one, and is otherwise run in-process.
+
     Args:
         query_text: Free text query for semantic search
         skills: List of skills to search for
@@ -108,13 +288,8 @@ def search_resumes(query_text: Optional[str] = None,
         duckdb_path: Path to the DuckDB database file
         chroma_path: Path to the ChromaDB directory
         verbose: Whether to display detailed information
+        socket_path: Path of the search server's socket, or None to always search in-process
     """
-    # Initialize database handler
-    db_handler = HybridSearchHandler(
-        duckdb_path=duckdb_path,
-        chroma_path=chroma_path
-    )
-
     # Create search query
     search_query = SearchQuery(
         text=query_text,
@@ -125,15 +300,17 @@ def search_resumes(query_text: Optional[str] = None,
         limit=limit
     )
 
-    # Perform search
-    results = db_handler.search(search_query)
+    results = None
+    if socket_path:
+        results = _search_via_server(socket_path, search_query, duckdb_path, chroma_path)
+
+    if results is None:
+        # Perform search with the process-wide handler (closed at exit)
+        results = get_handler(duckdb_path, chroma_path).search(search_query)
 
     # Display results
     display_search_results(results, verbose)
 
-    # Close database connection
-    db_handler.close()
-
     return results
 
 def main():
@@ -201,8 +378,24 @@ def main():
         help="Display detailed information"
     )
 
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Keep the databases and embedding model loaded and serve searches on a Unix socket"
+    )
+
+    parser.add_argument(
+        "--socket",
+        type=str,
+        default=DEFAULT_SOCKET_PATH,
+        help="Path of the search server's Unix socket"
+    )
+
     args = parser.parse_args()
 
+    if args.serve:
+        return serve(args.socket, args.duckdb_path, args.chroma_path)
+
     # Check if at least one search parameter is provided
     if not any([args.query, args.skills, args.companies, args.roles, args.education]):
         parser.error("At least one search parameter must be provided")
@@ -217,7 +410,8 @@ def main():
         limit=args.limit,
         duckdb_path=args.duckdb_path,
         chroma_path=args.chroma_path,
-        verbose=args.verbose
+        verbose=args.verbose,
+        socket_path=args.socket
     )
 
     return 0
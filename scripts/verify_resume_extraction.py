@@ -19,30 +19,48 @@ import os
 import sys
 import json
 import re
+import mmap
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import re2
+except ImportError:  # google-re2 is optional; fall back to the standard library
+    re2 = None
+
 logger = get_logger(__name__)
 
-def extract_candidate_names_from_table(text: str) -> List[Tuple[str, str]]:
+# RE2 compiles an alternation of literal names into a DFA, so the heading scan runs in
+# time linear in the document regardless of how many candidates there are
+_linear_re = re2 if re2 is not None else re
+
+def extract_candidate_names_from_table(text: Union[str, bytes, mmap.mmap]) -> List[Tuple[str, str]]:
     """
     Extract candidate names and emails from the tables at the beginning of the document.
 
     Args:
-        text: The full text content of the document
+        text: The full text content of the document, as a string or UTF-8 encoded buffer
 
     Returns:
         List of tuples containing (candidate_name, email)
     """
     # Find tables with candidate information
     table_pattern = r'\|Name\|Email Address\|.*?\|(.*?)(?=\n\n# )'
-    tables = re.findall(table_pattern, text, re.DOTALL)
+    if isinstance(text, str):
+        tables = re.findall(table_pattern, text, re.DOTALL)
+    else:
+        tables = [table.decode('utf-8') for table in re.findall(table_pattern.encode(), text, re.DOTALL)]
 
     candidates = []
 
@@ -65,6 +83,30 @@ def extract_candidate_names_from_table(text: str) -> List[Tuple[str, str]]:
     logger.info(f"Extracted {len(candidates)} candidate names from tables")
     return candidates
 
+def _find_resume_starts(content: Union[bytes, mmap.mmap], names: List[str]) -> Dict[str, int]:
+    """
+    Find the byte offset of the first "# <name>" heading for each candidate name.
+
+    Args:
+        content: The UTF-8 encoded content of the document
+        names: Candidate names to look for
+
+    Returns:
+        Dictionary mapping each name that was found to the start of its heading
+    """
+    if not names:
+        return {}
+
+    # Try longer names first so a name is never shadowed by one of its prefixes
+    alternatives = sorted({name.encode('utf-8') for name in names}, key=len, reverse=True)
+    heading_pattern = _linear_re.compile(b'# (' + b'|'.join(re.escape(name) for name in alternatives) + b')\n')
+
+    start_positions = {}
+    for match in heading_pattern.finditer(content):
+        start_positions.setdefault(match.group(1).decode('utf-8'), match.start())
+
+    return start_positions
+
 def create_name_to_text_map(text_file_path: str) -> Dict[str, str]:
     """
     Create a mapping from candidate names to their raw resume text.
@@ -75,9 +117,33 @@ def create_name_to_text_map(text_file_path: str) -> Dict[str, str]:
     Returns:
         Dictionary mapping candidate names to their raw resume text
     """
-    # Read the processed text file
-    with open(text_file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
+    # Map the processed text file instead of reading it into memory; text is only
+    # decoded for the slices that end up in the mapping
+    with open(text_file_path, 'rb') as f:
+        # Empty files cannot be mapped
+        if os.fstat(f.fileno()).st_size == 0:
+            return _map_names_to_text(b'')
+
+        content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    try:
+        return _map_names_to_text(content)
+    finally:
+        content.close()
+
+def _map_names_to_text(content: Union[bytes, mmap.mmap]) -> Dict[str, str]:
+    """
+    Create a mapping from candidate names to their raw resume text.
+
+    Args:
+        content: The UTF-8 encoded (usually memory-mapped) processed text file
+
+    Returns:
+        Dictionary mapping candidate names to their raw resume text
+    """
+    # Normalize Windows line endings the way reading in text mode would
+    if content.find(b'\r') != -1:
+        content = content[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
 
     # Extract candidate names and emails from the tables at the beginning
     candidates = extract_candidate_names_from_table(content)
@@ -85,41 +151,33 @@ def create_name_to_text_map(text_file_path: str) -> Dict[str, str]:
     if not candidates:
         logger.warning("No candidates found in the tables. Falling back to regex pattern matching.")
         # Fallback to the old method if no candidates are found in tables
-        name_pattern = r'# ([A-Za-z]+ [A-Za-z]+)\n'
-        names = re.findall(name_pattern, content)
+        name_pattern = rb'# ([A-Za-z]+ [A-Za-z]+)\n'
+        names = [name.decode('utf-8') for name in re.findall(name_pattern, content)]
         # Filter out non-candidate names (like section headers)
         candidates = [(name, "") for name in names if len(name.split()) == 2]
 
     # Create a map to store resume content for each candidate
     name_to_text_map = {}
 
-    # Find the start of each resume by looking for the candidate's name as a heading
-    for i, (candidate_name, email) in enumerate(candidates):
-        # Escape special characters in the name for regex
-        escaped_name = re.escape(candidate_name)
+    # Find where each candidate's resume starts (the first "# <name>" heading) with
+    # a single scan of the document for all candidate names at once
+    start_positions = _find_resume_starts(content, [name for name, _ in candidates])
 
-        # Find the start of this candidate's resume
-        resume_start_pattern = rf'# {escaped_name}\n'
-        start_match = re.search(resume_start_pattern, content)
+    for i, (candidate_name, email) in enumerate(candidates):
+        start_pos = start_positions.get(candidate_name)
 
-        if not start_match:
+        if start_pos is None:
             logger.warning(f"Could not find resume start for {candidate_name}, skipping")
             continue
 
-        start_pos = start_match.start()
-
-        # Find the start of the next candidate's resume (if any)
+        # The resume runs until the next candidate's heading (if any)
         end_pos = len(content)
         if i < len(candidates) - 1:
             next_candidate, _ = candidates[i + 1]
-            escaped_next_name = re.escape(next_candidate)
-            next_start_pattern = rf'# {escaped_next_name}\n'
-            next_start_match = re.search(next_start_pattern, content)
-            if next_start_match:
-                end_pos = next_start_match.start()
+            end_pos = start_positions.get(next_candidate, end_pos)
 
         # Extract the resume content
-        resume_text = content[start_pos:end_pos].strip()
+        resume_text = content[start_pos:end_pos].decode('utf-8').strip()
 
         # Store in the map
         name_to_text_map[candidate_name] = resume_text
@@ -145,8 +203,12 @@ def main():
     name_to_text_map = create_name_to_text_map(args.input_file)
 
     # Save the mapping to a JSON file
-    with open(args.output_file, 'w', encoding='utf-8') as f:
-        json.dump(name_to_text_map, f, indent=2)
+    if orjson is not None:
+        with open(args.output_file, 'wb') as f:
+            f.write(orjson.dumps(name_to_text_map, option=orjson.OPT_INDENT_2))
+    else:
+        with open(args.output_file, 'w', encoding='utf-8') as f:
+            json.dump(name_to_text_map, f, indent=2)
 
     logger.info(f"Saved name-to-text mapping to {args.output_file}")
     logger.info(f"Extracted {len(name_to_text_map)} candidate resumes")
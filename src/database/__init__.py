@@ -5,6 +5,8 @@ This module provides a hybrid database solution for storing and searching resume
 combining the strengths of structured data storage with vector-based semantic search.
 """
 
+import importlib
+
 from .schema import (
     Candidate,
     ContactInfo,
@@ -13,9 +15,26 @@ from .schema import (
     SearchQuery,
     SearchResult
 )
-from .duckdb_handler import DuckDBHandler
-from .chroma_handler import ChromaDBHandler
-from .hybrid_search import HybridSearchHandler
+
+# Handlers are imported on first use: ChromaDB and the embedding model are heavy
+# to import, and code that only needs the schema (such as resume parsing worker
+# processes) should not pay for them.
+_LAZY_ATTRIBUTES = {
+    'DuckDBHandler': '.duckdb_handler',
+    'ChromaDBHandler': '.chroma_handler',
+    'HybridSearchHandler': '.hybrid_search',
+    'get_handler': '.hybrid_search',
+    'close_handlers': '.hybrid_search'
+}
+
+def __getattr__(name):
+    """Import handler classes and functions on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'Candidate',
@@ -26,5 +45,7 @@ __all__ = [
     'SearchResult',
     'DuckDBHandler',
     'ChromaDBHandler',
-    'HybridSearchHandler'
+    'HybridSearchHandler',
+    'get_handler',
+    'close_handlers'
 ]
@@ -12,17 +12,35 @@ from chromadb.utils import embedding_functions
 from sentence_transformers import SentenceTransformer
 
 from ..utils.logger import get_logger
+from ..utils.helpers import normalize_skill
 from .schema import Candidate, SearchQuery
+from .embedding_cache import EmbeddingCache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
 logger = get_logger(__name__)
 
+def _dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+def _skill_key(skill: str) -> str:
+    """Metadata key flagging that a candidate has the given skill."""
+    return f"skill_{normalize_skill(skill)}"
+
 class ChromaDBHandler:
     """Handler for ChromaDB vector database operations."""
 
     def __init__(self,
                  db_path: str = "data/chroma_db",
                  collection_name: str = "candidates",
-                 embedding_model: str = "all-MiniLM-L6-v2"):
+                 embedding_model: str = "all-MiniLM-L6-v2",
+                 embedding_cache_path: Optional[str] = "data/embedding_cache.sqlite"):
         """
         Initialize the ChromaDB handler.
 
@@ -30,10 +48,14 @@ class ChromaDBHandler:
             db_path: Path to the ChromaDB directory
             collection_name: Name of the collection to use
             embedding_model: Name of the sentence transformer model to use
+            embedding_cache_path: Path to the embedding cache file, or None to disable caching
         """
         self.db_path = Path(db_path)
         self.collection_name = collection_name
         self.embedding_model_name = embedding_model
+        self.embedding_cache = (
+            EmbeddingCache(embedding_cache_path, embedding_model) if embedding_cache_path else None
+        )
 
         # Ensure parent directory exists
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
@@ -77,31 +99,116 @@ class ChromaDBHandler:
         Returns:
             ID of the inserted candidate
         """
-        logger.info(f"Inserting candidate into vector store: {candidate.candidate_name}")
+        logger.debug(f"Inserting candidate into vector store: {candidate.candidate_name}")
+
+        return self.insert_candidates([candidate])[0]
 
-        # Generate embedding text if not provided
-        if not candidate.embedding_text:
-            embedding_text = self._create_embedding_text(candidate)
-        else:
-            embedding_text = candidate.embedding_text
+    def insert_candidates(self, candidates: List[Candidate]) -> List[str]:
+        """
+        Insert many candidates into the vector database.
+
+        All documents are embedded with one call to the embedding model, and the
+        explicit embeddings are passed to Chroma so it does not embed them again.
+
+        Args:
+            candidates: Candidate objects to insert
+
+        Returns:
+            IDs of the inserted candidates
+        """
+        logger.info(f"Inserting {len(candidates)} candidates into vector store")
+
+        # Build the missing embedding texts in one pass over the batch
+        pending = [candidate for candidate in candidates if not candidate.embedding_text]
+        created_texts = iter(self._create_embedding_texts(pending))
+
+        ids = []
+        documents = []
+        metadatas = []
+
+        for candidate in candidates:
+            ids.append(candidate.id)
+            documents.append(candidate.embedding_text or next(created_texts))
+            metadatas.append(self._create_metadata(candidate))
+
+        embeddings = self._embed(documents)
+
+        # Chroma rejects adds larger than the client's maximum batch size
+        get_max_batch_size = getattr(self.client, "get_max_batch_size", None)
+        batch_size = max(get_max_batch_size() if get_max_batch_size else len(ids), 1)
+
+        for start in range(0, len(ids), batch_size):
+            end = start + batch_size
+            self.collection.add(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end]
+            )
+
+        return ids
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, reusing cached embeddings where possible.
+
+        Texts missing from the cache are embedded together in one model call.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            One embedding per text
+        """
+        if not texts:
+            return []
+
+        if self.embedding_cache is None:
+            return [list(map(float, embedding)) for embedding in self.embedding_function(texts)]
+
+        embeddings = self.embedding_cache.get_many(texts)
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if missing:
+            logger.info(f"Embedding {len(missing)} of {len(texts)} texts ({len(texts) - len(missing)} cached)")
+            missing_texts = [texts[i] for i in missing]
+            computed = self.embedding_function(missing_texts)
+            self.embedding_cache.put_many(missing_texts, computed)
+            for i, embedding in zip(missing, computed):
+                embeddings[i] = embedding
+
+        return [list(map(float, embedding)) for embedding in embeddings]
+
+    def _create_metadata(self, candidate: Candidate) -> Dict[str, Any]:
+        """
+        Create the metadata stored alongside a candidate's embedding.
+
+        Args:
+            candidate: Candidate object
+
+        Returns:
+            Metadata dictionary
+        """
+        companies = []
+        roles = []
+        for exp in candidate.work_experience:
+            companies.append(exp.company)
+            roles.append(exp.role)
 
-        # Create metadata
         metadata = {
             "candidate_name": candidate.candidate_name,
-            "skills": json.dumps(candidate.skills),
-            "companies": json.dumps([exp.company for exp in candidate.work_experience]),
-            "roles": json.dumps([exp.role for exp in candidate.work_experience]),
-            "education": json.dumps([edu.institution for edu in candidate.education])
+            "skills": _dumps(candidate.skills),
+            "companies": _dumps(companies),
+            "roles": _dumps(roles),
+            "education": _dumps([edu.institution for edu in candidate.education])
         }
 
-        # Add to collection
-        self.collection.add(
-            ids=[candidate.id],
-            documents=[embedding_text],
-            metadatas=[metadata]
-        )
+        # One boolean key per skill so skill filters are equality matches on
+        # indexed metadata rather than substring scans of the skills string
+        for skill in candidate.skills:
+            metadata[_skill_key(skill)] = True
 
-        return candidate.id
+        return metadata
 
     def _create_embedding_text(self, candidate: Candidate) -> str:
         """
@@ -113,26 +220,42 @@ class ChromaDBHandler:
         Returns:
             Text optimized for embedding
         """
-        # Format work experience
-        work_experience = "\n".join(
-            f"Role: {exp.role} at {exp.company}. Responsibilities: {' '.join(exp.responsibilities)}"
-            for exp in candidate.work_experience
-        )
+        return self._create_embedding_texts([candidate])[0]
 
-        # Format education
-        education = "\n".join(
-            f"Degree: {edu.degree} at {edu.institution}"
-            for edu in candidate.education
-        )
+    def _create_embedding_texts(self, candidates: List[Candidate]) -> List[str]:
+        """
+        Create optimized text for semantic search for a batch of candidates.
 
-        # Create embedding text
-        return f"""
-        Candidate: {candidate.candidate_name}
-        Skills: {", ".join(candidate.skills)}
-        Education: {education}
-        Experience: {work_experience}
-        Certifications: {", ".join(candidate.certifications)}
+        Args:
+            candidates: Candidate objects
+
+        Returns:
+            Text optimized for embedding, one per candidate
         """
+        # Bind the join methods once for the whole batch
+        join = "".join
+        join_commas = ", ".join
+        join_lines = "\n".join
+        join_words = " ".join
+
+        return [
+            join((
+                "\n        Candidate: ", candidate.candidate_name,
+                "\n        Skills: ", join_commas(candidate.skills),
+                "\n        Education: ", join_lines([
+                    "Degree: " + edu.degree + " at " + edu.institution
+                    for edu in candidate.education
+                ]),
+                "\n        Experience: ", join_lines([
+                    "Role: " + exp.role + " at " + exp.company
+                    + ". Responsibilities: " + join_words(exp.responsibilities)
+                    for exp in candidate.work_experience
+                ]),
+                "\n        Certifications: ", join_commas(candidate.certifications),
+                "\n        "
+            ))
+            for candidate in candidates
+        ]
 
     def semantic_search(self, query: SearchQuery) -> List[Tuple[str, float]]:
         """
@@ -146,33 +269,33 @@ class ChromaDBHandler:
         """
         logger.info(f"Performing semantic search with query: {query.text}")
 
-        # Build where clause for metadata filtering
+        # Build where clause for metadata filtering: the candidate must have every skill
         where_clause = {}
 
         if query.skills:
-            # For each skill, check if it's in the skills list
-            # This is a simplistic approach - in a real system you'd use proper filtering
-            for skill in query.skills:
-                where_clause[f"skills"] = {"$contains": skill}
+            skill_filters = [{_skill_key(skill): True} for skill in query.skills]
+            where_clause = skill_filters[0] if len(skill_filters) == 1 else {"$and": skill_filters}
 
-        # Execute query
+        # Execute query; only IDs and distances are used, so skip documents and metadata
         results = self.collection.query(
             query_texts=[query.text],
             n_results=query.limit + query.offset,
-            where=where_clause if where_clause else None
+            where=where_clause if where_clause else None,
+            include=["distances"]
         )
 
         # Process results
-        scored_candidates = []
+        ids = results["ids"][0] if results["ids"] else []
+        distances = results["distances"][0] if results.get("distances") else [0.0] * len(ids)
 
-        if results["ids"] and results["ids"][0]:
-            for i, candidate_id in enumerate(results["ids"][0]):
-                score = results["distances"][0][i] if "distances" in results and results["distances"] else 0.0
-                # Convert distance to similarity score (1.0 - distance)
-                similarity = 1.0 - score
-                scored_candidates.append((candidate_id, similarity))
+        # Convert distance to similarity score (1.0 - distance)
+        scored_candidates = [
+            (candidate_id, 1.0 - distance) for candidate_id, distance in zip(ids, distances)
+        ]
 
-        # Apply offset
+        # Apply offset (Chroma already returns at most limit results when there is none)
+        if query.offset == 0:
+            return scored_candidates
         return scored_candidates[query.offset:query.offset + query.limit]
 
     def delete_candidate(self, candidate_id: str) -> bool:
@@ -195,4 +318,6 @@ class ChromaDBHandler:
     def close(self):
         """Close the database connection."""
         # ChromaDB doesn't require explicit closing
+        if self.embedding_cache is not None:
+            self.embedding_cache.close()
         logger.info("ChromaDB connection closed")
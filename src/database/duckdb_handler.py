@@ -5,7 +5,11 @@ DuckDB handler for structured data storage with fuzzy search capabilities.
 import os
 import json
 import uuid
+import functools
+from collections import OrderedDict
 import duckdb
+import numpy as np
+import pandas as pd
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Tuple
 from uuid import UUID, uuid4
@@ -13,10 +17,72 @@ from datetime import date, datetime
 from rapidfuzz import fuzz, process
 
 from ..utils.logger import get_logger
+from ..utils.helpers import generate_uuids, normalize_skill
 from .schema import Candidate, Education, WorkExperience, SearchQuery
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 logger = get_logger(__name__)
 
+# Minimum fuzzy similarity (0-1) for a company, role or institution to count as a match
+FUZZY_MATCH_THRESHOLD = 0.7
+
+# Maximum number of deserialized candidates kept in memory
+CANDIDATE_CACHE_SIZE = 4096
+
+def _dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+# Company suffixes removed during normalization
+_COMPANY_SUFFIXES = ["inc", "llc", "corp", "corporation", "ltd", "limited"]
+
+# Translation table that deletes punctuation
+_PUNCT_TABLE = str.maketrans("", "", ",.()")
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_text(text: str) -> str:
+    """
+    Normalize text for better fuzzy matching.
+
+    Results are memoized, since the same company and institution names recur
+    across many candidates.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text
+    """
+    if not text:
+        return ""
+
+    # Convert to lowercase
+    normalized = text.lower()
+
+    # Remove common suffixes
+    for suffix in _COMPANY_SUFFIXES:
+        normalized = normalized.replace(f" {suffix}", "")
+        normalized = normalized.replace(f" {suffix}.", "")
+
+    # Remove punctuation
+    normalized = normalized.translate(_PUNCT_TABLE)
+
+    return normalized.strip()
+
+
 # SQL statements for database setup
 CREATE_CANDIDATES_TABLE = """
 CREATE TABLE IF NOT EXISTS candidates (
@@ -26,7 +92,6 @@ CREATE TABLE IF NOT EXISTS candidates (
     contact_info JSON,
     education JSON,
     work_experience JSON,
-    skills JSON,
     certifications JSON,
     summary TEXT,
     raw_text TEXT,
@@ -65,7 +130,9 @@ CREATE_SKILLS_TABLE = """
 CREATE TABLE IF NOT EXISTS skills (
     id TEXT PRIMARY KEY,
     candidate_id TEXT REFERENCES candidates(id),
-    skill TEXT NOT NULL
+    skill TEXT NOT NULL,
+    normalized_skill TEXT,
+    position INTEGER
 );
 """
 
@@ -81,6 +148,12 @@ class DuckDBHandler:
         """
         self.db_path = Path(db_path)
 
+        # Normalized names for fuzzy matching, loaded on first search
+        self._match_corpus = None
+
+        # Recently loaded candidates, least recently used first
+        self._candidate_cache = OrderedDict()
+
         # Ensure parent directory exists
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
 
@@ -100,54 +173,50 @@ class DuckDBHandler:
         self.conn.execute(CREATE_EDUCATION_TABLE)
         self.conn.execute(CREATE_SKILLS_TABLE)
 
+        # Databases created before skills were normalized and ordered lack these columns
+        self.conn.execute("ALTER TABLE skills ADD COLUMN IF NOT EXISTS normalized_skill TEXT;")
+        self.conn.execute("ALTER TABLE skills ADD COLUMN IF NOT EXISTS position INTEGER;")
+        self._backfill_normalized_skills()
+
         # Create indexes for faster searches
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_candidate_name ON candidates(candidate_name);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_company ON work_experience(normalized_company);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_role ON work_experience(normalized_role);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_institution ON education(normalized_institution);")
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_skill ON skills(skill);")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_normalized_skill ON skills(normalized_skill, candidate_id);"
+        )
 
         logger.info("Database tables and indexes created successfully")
 
-    def _normalize_text(self, text: str) -> str:
+    def _backfill_normalized_skills(self) -> None:
+        """Fill in normalized_skill for skill rows stored before the column existed."""
+        skills = [row[0] for row in self.conn.execute(
+            "SELECT DISTINCT skill FROM skills WHERE normalized_skill IS NULL"
+        ).fetchall()]
+        if not skills:
+            return
+
+        logger.info(f"Normalizing {len(skills)} distinct skills stored by an older version")
+        skill_map = pd.DataFrame({"skill": skills, "normalized_skill": [normalize_skill(skill) for skill in skills]})
+        self.conn.register("skill_map", skill_map)
+        try:
+            self.conn.execute("""
+            UPDATE skills SET normalized_skill = skill_map.normalized_skill
+            FROM skill_map
+            WHERE skills.skill = skill_map.skill AND skills.normalized_skill IS NULL
+            """)
+        finally:
+            self.conn.unregister("skill_map")
+
+    def _prepare_candidate(self, candidate: Candidate) -> None:
         """
-        Normalize text for better fuzzy matching.
+        Fill in IDs, embedding text and normalized fields before insertion.
 
         Args:
-            text: Text to normalize
-
-        Returns:
-            Normalized text
+            candidate: Candidate to prepare
         """
-        if not text:
-            return ""
-
-        # Convert to lowercase
-        normalized = text.lower()
-
-        # Remove common suffixes
-        for suffix in ["inc", "llc", "corp", "corporation", "ltd", "limited"]:
-            normalized = normalized.replace(f" {suffix}", "")
-            normalized = normalized.replace(f" {suffix}.", "")
-
-        # Remove punctuation
-        for char in ",.()":
-            normalized = normalized.replace(char, "")
-
-        return normalized.strip()
-
-    def insert_candidate(self, candidate: Candidate) -> str:
-        """
-        Insert a candidate into the database.
-
-        Args:
-            candidate: Candidate to insert
-
-        Returns:
-            ID of the inserted candidate
-        """
-        logger.info(f"Inserting candidate: {candidate.candidate_name}")
-
         # Generate ID if not provided
         if not candidate.id:
             candidate.id = str(uuid4())
@@ -163,87 +232,170 @@ class DuckDBHandler:
                 exp.id = str(uuid4())
 
             if not exp.normalized_company:
-                exp.normalized_company = self._normalize_text(exp.company)
+                exp.normalized_company = _normalize_text(exp.company)
             if not exp.normalized_role:
-                exp.normalized_role = self._normalize_text(exp.role)
+                exp.normalized_role = _normalize_text(exp.role)
 
         # Normalize institution names
         for edu in candidate.education:
             if not edu.normalized_institution:
-                edu.normalized_institution = self._normalize_text(edu.institution)
+                edu.normalized_institution = _normalize_text(edu.institution)
 
-        # Insert into candidates table
-        self.conn.execute(
-            """
-            INSERT INTO candidates (
-                id, candidate_name, document_type, contact_info, education,
-                work_experience, skills, certifications, summary, raw_text, embedding_text
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                candidate.id,
-                candidate.candidate_name,
-                candidate.document_type,
-                json.dumps(candidate.contact_info.dict()),
-                json.dumps([edu.dict() for edu in candidate.education]),
-                json.dumps([exp.dict() for exp in candidate.work_experience]),
-                json.dumps(candidate.skills),
-                json.dumps(candidate.certifications),
-                candidate.summary,
-                candidate.raw_text,
-                candidate.embedding_text
-            )
-        )
+    def insert_candidate(self, candidate: Candidate) -> str:
+        """
+        Insert a candidate into the database.
 
-        # Insert work experience
-        for i, exp in enumerate(candidate.work_experience):
-            self.conn.execute(
-                """
-                INSERT INTO work_experience (
-                    id, candidate_id, company, normalized_company, role, normalized_role,
-                    responsibilities, start_date, end_date
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    exp.id,
-                    candidate.id,
-                    exp.company,
-                    exp.normalized_company,
-                    exp.role,
-                    exp.normalized_role,
-                    json.dumps(exp.responsibilities),
-                    exp.start_date,
-                    exp.end_date
-                )
-            )
+        Args:
+            candidate: Candidate to insert
 
-        # Insert education
-        for i, edu in enumerate(candidate.education):
-            self.conn.execute(
-                """
-                INSERT INTO education (
-                    id, candidate_id, institution, normalized_institution, degree, graduation_date, gpa
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    edu.id,
-                    candidate.id,
-                    edu.institution,
-                    edu.normalized_institution,
-                    edu.degree,
-                    edu.graduation_date,
-                    edu.gpa
-                )
-            )
+        Returns:
+            ID of the inserted candidate
+        """
+        logger.debug(f"Inserting candidate: {candidate.candidate_name}")
 
-        # Insert skills
-        for skill in candidate.skills:
-            self.conn.execute(
-                "INSERT INTO skills (id, candidate_id, skill) VALUES (?, ?, ?)",
-                (str(uuid4()), candidate.id, skill)
-            )
+        return self.insert_candidates([candidate])[0]
+
+    def _insert_frame(self, table: str, columns: Dict[str, List[Any]]) -> None:
+        """
+        Append column-oriented rows to a table.
+
+        Uses DuckDB's appender, which writes the frame directly without planning
+        an INSERT statement. Columns not given take their defaults.
+
+        Args:
+            table: Name of the table to append to
+            columns: Mapping of column name to the list of values for that column
+        """
+        frame = pd.DataFrame(columns)
+        if frame.empty:
+            return
+
+        self.conn.append(table, frame, by_name=True)
+
+    def insert_candidates(self, candidates: List[Candidate]) -> List[str]:
+        """
+        Insert many candidates into the database in one transaction.
+
+        Rows for each table are gathered column by column and appended in one
+        call per table, which is much faster than one INSERT per row.
+
+        Args:
+            candidates: Candidates to insert
+
+        Returns:
+            IDs of the inserted candidates
+        """
+        logger.info(f"Bulk inserting {len(candidates)} candidates")
+
+        candidate_rows = {column: [] for column in (
+            "id", "candidate_name", "document_type", "contact_info", "education",
+            "work_experience", "certifications", "summary", "raw_text", "embedding_text"
+        )}
+        experience_rows = {column: [] for column in (
+            "id", "candidate_id", "company", "normalized_company", "role", "normalized_role",
+            "responsibilities", "start_date", "end_date"
+        )}
+        education_rows = {column: [] for column in (
+            "id", "candidate_id", "institution", "normalized_institution", "degree", "graduation_date", "gpa"
+        )}
+        skill_rows = {"id": [], "candidate_id": [], "skill": [], "normalized_skill": [], "position": []}
+
+        # Build the missing embedding texts in one pass over the batch
+        pending = [candidate for candidate in candidates if not candidate.embedding_text]
+        for candidate, embedding_text in zip(pending, self._create_embedding_texts(pending)):
+            candidate.embedding_text = embedding_text
+
+        for candidate in candidates:
+            self._prepare_candidate(candidate)
+
+            candidate_rows["id"].append(candidate.id)
+            candidate_rows["candidate_name"].append(candidate.candidate_name)
+            candidate_rows["document_type"].append(candidate.document_type)
+            candidate_rows["contact_info"].append(_dumps(candidate.contact_info.model_dump(mode="json")))
+            candidate_rows["education"].append(_dumps([edu.model_dump(mode="json") for edu in candidate.education]))
+            candidate_rows["work_experience"].append(_dumps([exp.model_dump(mode="json") for exp in candidate.work_experience]))
+            candidate_rows["certifications"].append(_dumps(candidate.certifications))
+            candidate_rows["summary"].append(candidate.summary)
+            candidate_rows["raw_text"].append(candidate.raw_text)
+            candidate_rows["embedding_text"].append(candidate.embedding_text)
+
+            for exp in candidate.work_experience:
+                experience_rows["id"].append(exp.id)
+                experience_rows["candidate_id"].append(candidate.id)
+                experience_rows["company"].append(exp.company)
+                experience_rows["normalized_company"].append(exp.normalized_company)
+                experience_rows["role"].append(exp.role)
+                experience_rows["normalized_role"].append(exp.normalized_role)
+                experience_rows["responsibilities"].append(_dumps(exp.responsibilities))
+                experience_rows["start_date"].append(exp.start_date)
+                experience_rows["end_date"].append(exp.end_date)
+
+            for edu in candidate.education:
+                education_rows["id"].append(edu.id)
+                education_rows["candidate_id"].append(candidate.id)
+                education_rows["institution"].append(edu.institution)
+                education_rows["normalized_institution"].append(edu.normalized_institution)
+                education_rows["degree"].append(edu.degree)
+                education_rows["graduation_date"].append(edu.graduation_date)
+                education_rows["gpa"].append(edu.gpa)
+
+            for position, skill in enumerate(candidate.skills):
+                skill_rows["candidate_id"].append(candidate.id)
+                skill_rows["skill"].append(skill)
+                skill_rows["normalized_skill"].append(normalize_skill(skill))
+                skill_rows["position"].append(position)
+
+        skill_rows["id"] = generate_uuids(len(skill_rows["skill"]))
+
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self._insert_frame("candidates", candidate_rows)
+            self._insert_frame("work_experience", experience_rows)
+            self._insert_frame("education", education_rows)
+            self._insert_frame("skills", skill_rows)
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        # New rows invalidate the cached fuzzy matching names
+        self._match_corpus = None
+
+        return [candidate.id for candidate in candidates]
+
+    def delete_candidate(self, candidate_id: str) -> bool:
+        """
+        Delete a candidate and their work experience, education and skills.
+
+        Args:
+            candidate_id: ID of the candidate to delete
 
-        return candidate.id
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            # Child rows go in one transaction. DuckDB only sees them as gone once that
+            # commits, so the candidate row itself is deleted in a second one.
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                self.conn.execute("DELETE FROM skills WHERE candidate_id = ?", (candidate_id,))
+                self.conn.execute("DELETE FROM work_experience WHERE candidate_id = ?", (candidate_id,))
+                self.conn.execute("DELETE FROM education WHERE candidate_id = ?", (candidate_id,))
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+
+            self.conn.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,))
+        except Exception as e:
+            logger.error(f"Error deleting candidate {candidate_id}: {e}")
+            return False
+        finally:
+            # Drop the candidate from the caches, even after a partial delete
+            self._candidate_cache.pop(candidate_id, None)
+            self._match_corpus = None
+
+        return True
 
     def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
         """
@@ -255,25 +407,73 @@ class DuckDBHandler:
         Returns:
             Candidate object, or None if not found
         """
-        result = self.conn.execute(
-            "SELECT * FROM candidates WHERE id = ?", (candidate_id,)
-        ).fetchone()
+        return self.get_candidates([candidate_id]).get(candidate_id)
+
+    def get_candidates(self, candidate_ids: List[str]) -> Dict[str, Candidate]:
+        """
+        Retrieve several candidates from the database with a single query.
+
+        Recently loaded candidates are served from an in-memory LRU cache; only
+        the rest are read from the database. Callers always receive their own
+        copies, so mutating a returned candidate never changes the cached one.
+
+        Args:
+            candidate_ids: IDs of the candidates to load
+
+        Returns:
+            Dictionary mapping candidate ID to Candidate object; IDs that are not
+            found are left out
+        """
+        candidates = {}
+        missing_ids = []
+        for candidate_id in candidate_ids:
+            candidate = self._candidate_cache.get(candidate_id)
+            if candidate is not None:
+                self._candidate_cache.move_to_end(candidate_id)
+                candidates[candidate_id] = candidate.model_copy(deep=True)
+            else:
+                missing_ids.append(candidate_id)
+
+        if not missing_ids:
+            return candidates
+
+        placeholders = ", ".join(["?"] * len(missing_ids))
+        results = self.conn.execute(
+            f"SELECT * FROM candidates WHERE id IN ({placeholders})", missing_ids
+        ).fetchall()
+
+        # Skills live only in the skills table; position keeps their original order
+        # (rows stored before the column existed have no position and fall back to rowid)
+        columns = [column[0] for column in self.conn.description]
+        skills_by_candidate = dict(self.conn.execute(
+            f"""
+            SELECT candidate_id, list(skill ORDER BY position, rowid) FROM skills
+            WHERE candidate_id IN ({placeholders})
+            GROUP BY candidate_id
+            """,
+            missing_ids
+        ).fetchall())
+
+        # Convert to Candidate objects
+        for result in results:
+            candidate_dict = dict(zip(columns, result))
 
-        if not result:
-            return None
+            # Parse JSON fields
+            candidate_dict["contact_info"] = _loads(candidate_dict["contact_info"])
+            candidate_dict["education"] = _loads(candidate_dict["education"])
+            candidate_dict["work_experience"] = _loads(candidate_dict["work_experience"])
+            candidate_dict["certifications"] = _loads(candidate_dict["certifications"])
+            candidate_dict["skills"] = skills_by_candidate.get(candidate_dict["id"], [])
 
-        # Convert to dictionary
-        candidate_dict = dict(zip(result.keys(), result))
+            # Create Candidate object
+            candidate = Candidate(**candidate_dict)
+            candidates[candidate.id] = candidate.model_copy(deep=True)
 
-        # Parse JSON fields
-        candidate_dict["contact_info"] = json.loads(candidate_dict["contact_info"])
-        candidate_dict["education"] = json.loads(candidate_dict["education"])
-        candidate_dict["work_experience"] = json.loads(candidate_dict["work_experience"])
-        candidate_dict["skills"] = json.loads(candidate_dict["skills"])
-        candidate_dict["certifications"] = json.loads(candidate_dict["certifications"])
+            self._candidate_cache[candidate.id] = candidate
+            if len(self._candidate_cache) > CANDIDATE_CACHE_SIZE:
+                self._candidate_cache.popitem(last=False)
 
-        # Create Candidate object
-        return Candidate(**candidate_dict)
+        return candidates
 
     def _create_embedding_text(self, candidate: Candidate) -> str:
         """
@@ -285,26 +485,123 @@ class DuckDBHandler:
         Returns:
             Text optimized for embedding
         """
-        # Format work experience
-        work_experience = "\n".join(
-            f"Role: {exp.role} at {exp.company}. Responsibilities: {' '.join(exp.responsibilities)}"
-            for exp in candidate.work_experience
-        )
+        return self._create_embedding_texts([candidate])[0]
 
-        # Format education
-        education = "\n".join(
-            f"Degree: {edu.degree} at {edu.institution}"
-            for edu in candidate.education
-        )
+    def _create_embedding_texts(self, candidates: List[Candidate]) -> List[str]:
+        """
+        Create optimized text for semantic search for a batch of candidates.
+
+        Args:
+            candidates: Candidate objects
+
+        Returns:
+            Text optimized for embedding, one per candidate
+        """
+        # Bind the join methods once for the whole batch
+        join = "".join
+        join_commas = ", ".join
+        join_lines = "\n".join
+        join_words = " ".join
+
+        return [
+            join((
+                "\n        Candidate: ", candidate.candidate_name,
+                "\n        Skills: ", join_commas(candidate.skills),
+                "\n        Education: ", join_lines([
+                    "Degree: " + edu.degree + " at " + edu.institution
+                    for edu in candidate.education
+                ]),
+                "\n        Experience: ", join_lines([
+                    "Role: " + exp.role + " at " + exp.company
+                    + ". Responsibilities: " + join_words(exp.responsibilities)
+                    for exp in candidate.work_experience
+                ]),
+                "\n        Certifications: ", join_commas(candidate.certifications),
+                "\n        "
+            ))
+            for candidate in candidates
+        ]
+
+    def _load_match_corpus(self) -> Tuple[Dict[str, int], Dict[str, Tuple[np.ndarray, np.ndarray, List[str]]]]:
+        """
+        Load the normalized company, role and institution names used for fuzzy matching.
 
-        # Create embedding text
-        return f"""
-        Candidate: {candidate.candidate_name}
-        Skills: {", ".join(candidate.skills)}
-        Education: {education}
-        Experience: {work_experience}
-        Certifications: {", ".join(candidate.certifications)}
+        The names are read once with one query per table and kept until the next
+        insert, so searches do not re-read and re-normalize them from every candidate.
+        Each distinct name is stored once, since the same companies, roles and
+        institutions recur across many candidates.
+
+        Returns:
+            Tuple of (candidate ID to slot mapping,
+            field name to (slot per row, distinct value index per row, distinct values))
+        """
+        if self._match_corpus is None:
+            candidate_slots = {}
+
+            def load(sql: str) -> Tuple[np.ndarray, np.ndarray, List[str]]:
+                rows = self.conn.execute(sql).fetchall()
+                slots = np.fromiter(
+                    (candidate_slots.setdefault(candidate_id, len(candidate_slots)) for candidate_id, _ in rows),
+                    dtype=np.int64,
+                    count=len(rows)
+                )
+                distinct_values = {}
+                value_index = np.fromiter(
+                    (distinct_values.setdefault(value or "", len(distinct_values)) for _, value in rows),
+                    dtype=np.int64,
+                    count=len(rows)
+                )
+                return slots, value_index, list(distinct_values)
+
+            corpus = {
+                "company": load("SELECT candidate_id, COALESCE(normalized_company, lower(company)) FROM work_experience"),
+                "role": load("SELECT candidate_id, COALESCE(normalized_role, lower(role)) FROM work_experience"),
+                "institution": load("SELECT candidate_id, COALESCE(normalized_institution, lower(institution)) FROM education")
+            }
+            self._match_corpus = (candidate_slots, corpus)
+
+        return self._match_corpus
+
+    def _best_match_scores(self,
+                           terms: List[str],
+                           slots: np.ndarray,
+                           value_index: np.ndarray,
+                           values: List[str],
+                           slot_count: int) -> np.ndarray:
         """
+        Find each candidate's best fuzzy match score against a list of query terms.
+
+        All term/value pairs are scored with a single rapidfuzz cdist call, once
+        per distinct value, spread across all CPU cores.
+
+        Args:
+            terms: Query terms to match
+            slots: Candidate slot of each row
+            value_index: Index into values of each row
+            values: Distinct normalized values to match the terms against
+            slot_count: Number of candidate slots
+
+        Returns:
+            Best score (0-1) per candidate slot, or 0 where no score exceeds the threshold
+        """
+        best_scores = np.zeros(slot_count)
+        if not values:
+            return best_scores
+
+        matrix = process.cdist(
+            [_normalize_text(term) for term in terms],
+            values,
+            scorer=fuzz.token_set_ratio,
+            dtype=np.float64,
+            workers=-1
+        )
+
+        # Best score for each value over all terms, dropping those under the threshold
+        value_scores = matrix.max(axis=0) / 100.0
+        value_scores[value_scores <= FUZZY_MATCH_THRESHOLD] = 0.0
+
+        np.maximum.at(best_scores, slots, value_scores[value_index])
+        return best_scores
 
     def fuzzy_search(self, query: SearchQuery) -> List[Tuple[Candidate, float]]:
         """
@@ -318,103 +615,79 @@ class DuckDBHandler:
         """
         logger.info(f"Performing fuzzy search with query: {query}")
 
-        # Start with all candidates
-        candidates_query = "SELECT * FROM candidates"
+        # Score on candidate IDs and skill match counts only; full rows are fetched
+        # for the result page
+        candidates_query = "SELECT id, 0 AS skill_matches FROM candidates"
         params = []
 
-        # Add filters for skills
-        if query.skills:
-            skill_placeholders = ", ".join(["?"] * len(query.skills))
+        # Add filters for skills, counting each candidate's matching skills in DuckDB
+        # Skills are compared normalized, the same way the ChromaDB skill filter does
+        query_skills = list(dict.fromkeys(normalize_skill(skill) for skill in query.skills or []))
+        if query_skills:
+            skill_placeholders = ", ".join(["?"] * len(query_skills))
             candidates_query = f"""
-            SELECT c.* FROM candidates c
-            JOIN skills s ON c.id = s.candidate_id
-            WHERE s.skill IN ({skill_placeholders})
-            GROUP BY c.id
+            WITH matched_ids AS MATERIALIZED (
+                SELECT candidate_id, COUNT(DISTINCT normalized_skill) AS skill_matches FROM skills
+                WHERE normalized_skill IN ({skill_placeholders})
+                GROUP BY candidate_id
+            )
+            SELECT c.id, m.skill_matches FROM candidates c
+            JOIN matched_ids m ON c.id = m.candidate_id
             """
-            params.extend(query.skills)
+            params.extend(query_skills)
 
         # Execute query
         results = self.conn.execute(candidates_query, params).fetchall()
 
-        # Convert to Candidate objects
-        candidates = []
-        for result in results:
-            candidate_dict = dict(zip(result.keys(), result))
+        # Score the fuzzy fields for all candidates at once
+        candidate_slots, corpus = self._load_match_corpus()
+        fuzzy_scores = []
 
-            # Parse JSON fields
-            candidate_dict["contact_info"] = json.loads(candidate_dict["contact_info"])
-            candidate_dict["education"] = json.loads(candidate_dict["education"])
-            candidate_dict["work_experience"] = json.loads(candidate_dict["work_experience"])
-            candidate_dict["skills"] = json.loads(candidate_dict["skills"])
-            candidate_dict["certifications"] = json.loads(candidate_dict["certifications"])
+        # Match companies
+        if query.companies:
+            fuzzy_scores.append(self._best_match_scores(query.companies, *corpus["company"], len(candidate_slots)))
 
-            # Create Candidate object
-            candidates.append(Candidate(**candidate_dict))
+        # Match roles
+        if query.roles:
+            fuzzy_scores.append(self._best_match_scores(query.roles, *corpus["role"], len(candidate_slots)))
 
-        # Perform fuzzy matching
-        scored_candidates = []
+        # Match education
+        if query.education:
+            fuzzy_scores.append(self._best_match_scores(query.education, *corpus["institution"], len(candidate_slots)))
 
-        for candidate in candidates:
+        # Combine scores
+        scored_ids = []
+
+        for candidate_id, skill_matches in results:
             score = 0.0
             match_count = 0
 
-            # Match companies
-            if query.companies:
-                company_scores = []
-                for company in query.companies:
-                    for exp in candidate.work_experience:
-                        company_score = fuzz.token_sort_ratio(company.lower(), exp.company.lower()) / 100.0
-                        if company_score > 0.7:  # 70% similarity threshold
-                            company_scores.append(company_score)
-
-                if company_scores:
-                    score += max(company_scores) * query.fuzzy_weight
-                    match_count += 1
-
-            # Match roles
-            if query.roles:
-                role_scores = []
-                for role in query.roles:
-                    for exp in candidate.work_experience:
-                        role_score = fuzz.token_sort_ratio(role.lower(), exp.role.lower()) / 100.0
-                        if role_score > 0.7:  # 70% similarity threshold
-                            role_scores.append(role_score)
-
-                if role_scores:
-                    score += max(role_scores) * query.fuzzy_weight
-                    match_count += 1
-
-            # Match education
-            if query.education:
-                edu_scores = []
-                for edu_query in query.education:
-                    for edu in candidate.education:
-                        edu_score = fuzz.token_sort_ratio(edu_query.lower(), edu.institution.lower()) / 100.0
-                        if edu_score > 0.7:  # 70% similarity threshold
-                            edu_scores.append(edu_score)
-
-                if edu_scores:
-                    score += max(edu_scores) * query.fuzzy_weight
-                    match_count += 1
-
-            # Match skills (exact match)
-            if query.skills:
-                skill_matches = set(query.skills).intersection(set(candidate.skills))
-                if skill_matches:
-                    skill_score = len(skill_matches) / len(query.skills)
-                    score += skill_score * query.exact_weight
-                    match_count += 1
+            slot = candidate_slots.get(candidate_id)
+            if slot is not None:
+                for field_scores in fuzzy_scores:
+                    if field_scores[slot] > 0:
+                        score += float(field_scores[slot]) * query.fuzzy_weight
+                        match_count += 1
+
+            # Match skills (exact match after normalization)
+            if skill_matches:
+                skill_score = skill_matches / len(query_skills)
+                score += skill_score * query.exact_weight
+                match_count += 1
 
             # Normalize score
             if match_count > 0:
                 score /= match_count
-                scored_candidates.append((candidate, score))
+                scored_ids.append((candidate_id, score))
 
         # Sort by score (descending)
-        scored_candidates.sort(key=lambda x: x[1], reverse=True)
+        scored_ids.sort(key=lambda x: x[1], reverse=True)
+
+        # Apply limit and offset, then load only the candidates on this page
+        page = scored_ids[query.offset:query.offset + query.limit]
+        candidates = self.get_candidates([candidate_id for candidate_id, _ in page])
 
-        # Apply limit and offset
-        return scored_candidates[query.offset:query.offset + query.limit]
+        return [(candidates[candidate_id], score) for candidate_id, score in page]
 
     def close(self):
         """Close the database connection."""
@@ -0,0 +1,106 @@
+"""
+Persistent cache of text embeddings keyed by a hash of the model name and text.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from ..utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# SQL statements for cache setup. Vectors are stored as float16, which halves the
+# cache size; the rounding error is negligible for similarity search.
+CREATE_EMBEDDINGS_TABLE = """
+CREATE TABLE IF NOT EXISTS embeddings_f16 (
+    key TEXT PRIMARY KEY,
+    vector BLOB NOT NULL
+);
+"""
+
+# Maximum number of keys looked up per SELECT (stays under SQLite's variable limit)
+LOOKUP_BATCH_SIZE = 500
+
+class EmbeddingCache:
+    """SQLite-backed cache of embedding vectors, stored as float16."""
+
+    def __init__(self, db_path: str, model_name: str):
+        """
+        Initialize the embedding cache.
+
+        Args:
+            db_path: Path to the SQLite cache file
+            model_name: Name of the embedding model, included in every cache key
+        """
+        self.db_path = Path(db_path)
+        self.model_name = model_name
+
+        # Ensure parent directory exists
+        self.db_path.parent.mkdir(exist_ok=True, parents=True)
+
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute(CREATE_EMBEDDINGS_TABLE)
+        self.conn.commit()
+
+        logger.info(f"Using embedding cache at {self.db_path}")
+
+    def _key(self, text: str) -> str:
+        """
+        Build the cache key for a text.
+
+        Args:
+            text: Text that was embedded
+
+        Returns:
+            Hex SHA-256 digest of the model name and text
+        """
+        return hashlib.sha256(f"{self.model_name}\0{text}".encode('utf-8')).hexdigest()
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up cached embeddings.
+
+        Args:
+            texts: Texts to look up
+
+        Returns:
+            One float32 embedding per text, or None where the text is not cached
+        """
+        keys = [self._key(text) for text in texts]
+        found = {}
+
+        for start in range(0, len(keys), LOOKUP_BATCH_SIZE):
+            chunk = keys[start:start + LOOKUP_BATCH_SIZE]
+            placeholders = ", ".join(["?"] * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT key, vector FROM embeddings_f16 WHERE key IN ({placeholders})", chunk
+            )
+            for key, vector in rows:
+                found[key] = np.frombuffer(vector, dtype=np.float16).astype(np.float32)
+
+        return [found.get(key) for key in keys]
+
+    def put_many(self, texts: Sequence[str], embeddings: Sequence[Sequence[float]]) -> None:
+        """
+        Store embeddings in the cache.
+
+        Args:
+            texts: Texts that were embedded
+            embeddings: Embedding for each text
+        """
+        rows = [
+            (self._key(text), np.asarray(embedding, dtype=np.float16).tobytes())
+            for text, embedding in zip(texts, embeddings)
+        ]
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO embeddings_f16 (key, vector) VALUES (?, ?)", rows
+            )
+
+    def close(self):
+        """Close the cache database."""
+        self.conn.close()
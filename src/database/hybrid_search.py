@@ -3,6 +3,8 @@ Hybrid search handler that combines DuckDB and ChromaDB for powerful search capa
 """
 
 import os
+import atexit
+import threading
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union, Tuple
 from uuid import uuid4
@@ -21,7 +23,8 @@ class HybridSearchHandler:
                  duckdb_path: str = "data/hr_database.duckdb",
                  chroma_path: str = "data/chroma_db",
                  collection_name: str = "candidates",
-                 embedding_model: str = "all-MiniLM-L6-v2"):
+                 embedding_model: str = "all-MiniLM-L6-v2",
+                 embedding_cache_path: Optional[str] = "data/embedding_cache.sqlite"):
         """
         Initialize the hybrid search handler.
 
@@ -30,12 +33,14 @@ class HybridSearchHandler:
             chroma_path: Path to the ChromaDB directory
             collection_name: Name of the ChromaDB collection to use
             embedding_model: Name of the sentence transformer model to use
+            embedding_cache_path: Path to the embedding cache file, or None to disable caching
         """
         self.duckdb_handler = DuckDBHandler(db_path=duckdb_path)
         self.chroma_handler = ChromaDBHandler(
             db_path=chroma_path,
             collection_name=collection_name,
-            embedding_model=embedding_model
+            embedding_model=embedding_model,
+            embedding_cache_path=embedding_cache_path
         )
 
         logger.info("Hybrid search handler initialized")
@@ -50,7 +55,7 @@ class HybridSearchHandler:
         Returns:
             ID of the inserted candidate
         """
-        logger.info(f"Inserting candidate into both databases: {candidate.candidate_name}")
+        logger.debug(f"Inserting candidate into both databases: {candidate.candidate_name}")
 
         # Generate ID if not provided
         if not candidate.id:
@@ -68,6 +73,41 @@ class HybridSearchHandler:
 
         return candidate.id
 
+    def insert_candidates_bulk(self, candidates: List[Candidate]) -> List[str]:
+        """
+        Insert a batch of candidates into both databases.
+
+        Each database receives the whole batch in one call instead of one
+        call per candidate. If the ChromaDB insert fails, the batch is removed
+        from both databases again before the error is raised, so the two never
+        hold different candidates.
+
+        Args:
+            candidates: Candidate objects to insert
+
+        Returns:
+            IDs of the inserted candidates
+        """
+        logger.info(f"Bulk inserting {len(candidates)} candidates into both databases")
+
+        if not candidates:
+            return []
+
+        # Insert into DuckDB (fills in IDs and embedding text)
+        ids = self.duckdb_handler.insert_candidates(candidates)
+
+        # Insert into ChromaDB
+        try:
+            self.chroma_handler.insert_candidates(candidates)
+        except Exception:
+            logger.error(f"ChromaDB insert failed; removing {len(ids)} candidates from both databases")
+            for candidate_id in ids:
+                self.chroma_handler.delete_candidate(candidate_id)
+                self.duckdb_handler.delete_candidate(candidate_id)
+            raise
+
+        return ids
+
     def get_candidate(self, candidate_id: str) -> Optional[Candidate]:
         """
         Retrieve a candidate from the database by ID.
@@ -92,21 +132,25 @@ class HybridSearchHandler:
         """
         logger.info(f"Performing hybrid search with query: {query}")
 
-        results = []
+        # Results keyed by candidate ID, so fuzzy hits merge into semantic ones in O(1)
+        results_by_id: Dict[str, SearchResult] = {}
 
         # Perform semantic search if text query is provided
         if query.text:
             semantic_results = self.chroma_handler.semantic_search(query)
 
-            # Get candidate objects and create search results
+            # Get candidate objects with one query and create search results
+            candidates = self.duckdb_handler.get_candidates(
+                [candidate_id for candidate_id, _ in semantic_results]
+            )
             for candidate_id, score in semantic_results:
-                candidate = self.duckdb_handler.get_candidate(candidate_id)
+                candidate = candidates.get(candidate_id)
                 if candidate:
-                    results.append(SearchResult(
+                    results_by_id[candidate.id] = SearchResult(
                         candidate=candidate,
                         score=score * query.semantic_weight,
                         match_details={"semantic_score": score}
-                    ))
+                    )
 
         # Perform fuzzy search
         fuzzy_results = self.duckdb_handler.fuzzy_search(query)
@@ -114,7 +158,7 @@ class HybridSearchHandler:
         # Add fuzzy search results
         for candidate, score in fuzzy_results:
             # Check if candidate is already in results
-            existing_result = next((r for r in results if r.candidate.id == candidate.id), None)
+            existing_result = results_by_id.get(candidate.id)
 
             if existing_result:
                 # Update existing result
@@ -122,14 +166,14 @@ class HybridSearchHandler:
                 existing_result.match_details["fuzzy_score"] = score
             else:
                 # Add new result
-                results.append(SearchResult(
+                results_by_id[candidate.id] = SearchResult(
                     candidate=candidate,
                     score=score * query.fuzzy_weight,
                     match_details={"fuzzy_score": score}
-                ))
+                )
 
         # Sort by score (descending)
-        results.sort(key=lambda x: x.score, reverse=True)
+        results = sorted(results_by_id.values(), key=lambda x: x.score, reverse=True)
 
         # Apply limit and offset
         return results[query.offset:query.offset + query.limit]
@@ -147,13 +191,50 @@ class HybridSearchHandler:
         # Delete from ChromaDB
         chroma_success = self.chroma_handler.delete_candidate(candidate_id)
 
-        # TODO: Implement delete in DuckDB handler
-        # duckdb_success = self.duckdb_handler.delete_candidate(candidate_id)
+        # Delete from DuckDB
+        duckdb_success = self.duckdb_handler.delete_candidate(candidate_id)
 
-        return chroma_success
+        return chroma_success and duckdb_success
 
     def close(self):
         """Close the database connections."""
         self.duckdb_handler.close()
         self.chroma_handler.close()
         logger.info("Database connections closed")
+
+# Handlers shared by get_handler, keyed by (duckdb_path, chroma_path)
+_shared_handlers: Dict[Tuple[str, str], HybridSearchHandler] = {}
+_shared_handlers_lock = threading.Lock()
+
+def get_handler(duckdb_path: str = "data/hr_database.duckdb",
+                chroma_path: str = "data/chroma_db") -> HybridSearchHandler:
+    """
+    Get a process-wide hybrid search handler for the given databases.
+
+    The first call opens the databases and loads the embedding model; later calls
+    with the same paths return the same handler. Shared handlers are closed when
+    the process exits.
+
+    Args:
+        duckdb_path: Path to the DuckDB database file
+        chroma_path: Path to the ChromaDB directory
+
+    Returns:
+        Shared hybrid search handler
+    """
+    key = (duckdb_path, chroma_path)
+    with _shared_handlers_lock:
+        handler = _shared_handlers.get(key)
+        if handler is None:
+            handler = HybridSearchHandler(duckdb_path=duckdb_path, chroma_path=chroma_path)
+            _shared_handlers[key] = handler
+        return handler
+
+def close_handlers():
+    """Close every handler created by get_handler."""
+    with _shared_handlers_lock:
+        while _shared_handlers:
+            _, handler = _shared_handlers.popitem()
+            handler.close()
+
+atexit.register(close_handlers)
@@ -0,0 +1,135 @@
+"""
+Conversion of extracted resume JSON files into Candidate objects.
+
+This module only depends on the schema, so resume parsing worker processes can
+import it without loading the database handlers.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Any, Type
+from pydantic import BaseModel
+
+from ..utils.logger import get_logger
+from ..utils.helpers import generate_uuids
+from .schema import Candidate, ContactInfo, Education, WorkExperience
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+logger = get_logger(__name__)
+
+def _build_model(model: Type[BaseModel], trust_input: bool, **fields: Any) -> BaseModel:
+    """
+    Create a model instance, skipping validation for trusted input.
+
+    Args:
+        model: Pydantic model class to instantiate
+        trust_input: Whether to skip validation and use the fields as they are
+        **fields: Field values for the model
+
+    Returns:
+        Model instance
+    """
+    if trust_input:
+        return model.model_construct(**fields)
+    return model(**fields)
+
+def convert_json_to_candidate(resume_data: Dict[str, Any], trust_input: bool = False) -> Candidate:
+    """
+    Convert a resume JSON to a Candidate object.
+
+    Args:
+        resume_data: Resume data as a dictionary
+        trust_input: Whether to skip Pydantic validation (only for data already
+            validated upstream, such as the LLM extraction output)
+
+    Returns:
+        Candidate object
+    """
+    # Create contact info
+    contact_info = _build_model(ContactInfo, trust_input, **resume_data.get("contact_info", {}))
+
+    # Create education list
+    education_list = []
+    for edu_data in resume_data.get("education", []):
+        # Set graduation_date to None to avoid date parsing issues
+        edu_data["graduation_date"] = None
+        education_list.append(_build_model(Education, trust_input, **edu_data))
+
+    # Create work experience list
+    work_experience_data = resume_data.get("work_experience", [])
+    missing_ids = sum(1 for exp_data in work_experience_data if "id" not in exp_data)
+    new_ids = iter(generate_uuids(missing_ids))
+
+    work_experience_list = []
+    for exp_data in work_experience_data:
+        # Handle date format issues - set to None to avoid date parsing
+        exp_data["start_date"] = None
+        exp_data["end_date"] = None
+
+        # Add an ID field if missing
+        if "id" not in exp_data:
+            exp_data["id"] = next(new_ids)
+
+        work_experience_list.append(_build_model(WorkExperience, trust_input, **exp_data))
+
+    # Ensure certifications is a list
+    certifications = resume_data.get("certifications", [])
+    if certifications is None:
+        certifications = []
+
+    # Create candidate
+    candidate = _build_model(
+        Candidate,
+        trust_input,
+        candidate_name=resume_data.get("candidate_name", ""),
+        document_type=resume_data.get("document_type", "resume"),
+        contact_info=contact_info,
+        education=education_list,
+        work_experience=work_experience_list,
+        skills=resume_data.get("skills", []),
+        certifications=certifications,
+        summary=resume_data.get("summary", None),
+        raw_text=resume_data.get("raw_text", None)
+    )
+
+    return candidate
+
+def load_candidate_file(resume_file: str, trust_input: bool = False) -> Optional[Candidate]:
+    """
+    Load a resume JSON file and convert it to a Candidate object.
+
+    Meant to run in worker processes, so errors are logged here rather than raised.
+
+    Args:
+        resume_file: Path to the resume JSON file
+        trust_input: Whether to skip Pydantic validation
+
+    Returns:
+        Candidate object, or None if the file could not be converted
+    """
+    try:
+        # Load resume data
+        if orjson is not None:
+            with open(resume_file, 'rb') as f:
+                resume_data = orjson.loads(f.read())
+        else:
+            with open(resume_file, 'r', encoding='utf-8') as f:
+                resume_data = json.load(f)
+
+        # Per-file progress is shown by tqdm; only log names when debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            candidate_name = resume_data.get('candidate_name', Path(resume_file).stem)
+            logger.debug(f"Converting resume for {candidate_name}")
+
+        # Convert to Candidate object
+        return convert_json_to_candidate(resume_data, trust_input)
+
+    except Exception as e:
+        logger.error(f"Error converting resume {resume_file}: {e}")
+        logger.exception(e)
+        return None
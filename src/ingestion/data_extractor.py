@@ -4,6 +4,7 @@ Data Extractor module for extracting structured data from text using LLMs.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
@@ -28,6 +29,7 @@ class DataExtractor:
         self.model_name = config.get('model_name', 'gpt-4')
         self.temperature = config.get('temperature', 0.1)
         self.max_tokens = config.get('max_tokens', 1000)
+        self.concurrency = config.get('concurrency', 16)
         
         # Load extraction prompt
         prompt_path = Path(os.environ.get('CONFIG_DIR', 'config')) / 'prompts' / 'extraction_prompt.txt'
@@ -132,10 +134,16 @@ class DataExtractor:
         output_dir = Path(output_dir)
         output_dir.mkdir(exist_ok=True, parents=True)
         
-        results = []
-        for text_file in text_dir.glob("*.txt"):
-            output_file = output_dir / f"{text_file.stem}.json"
-            extracted_data = self.process_file(text_file, output_file)
-            results.append(extracted_data)
+        text_files = list(text_dir.glob("*.txt"))
+        if not text_files:
+            return []
+
+        # Extraction is dominated by LLM request latency, so run the requests
+        # concurrently; the pool size caps the number of requests in flight
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(text_files))) as executor:
+            results = list(executor.map(
+                lambda text_file: self.process_file(text_file, output_dir / f"{text_file.stem}.json"),
+                text_files
+            ))
             
         return results
\ No newline at end of file
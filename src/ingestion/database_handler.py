@@ -6,12 +6,30 @@ import json
 import os
 import sqlite3
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, List, Optional, Tuple, Union, Any
 
 from ..utils.logger import get_logger
+from ..utils.helpers import json_field_expression, tune_sqlite_connection
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
 logger = get_logger(__name__)
 
+def _dumps(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data).decode('utf-8')
+    return json.dumps(data)
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class DatabaseHandler:
     """Class for handling database operations."""
     
@@ -25,6 +43,7 @@ class DatabaseHandler:
         self.config = config
         self.db_type = config.get('type', 'sqlite')
         self.db_path = Path(config.get('path', '../data/hr_database.db'))
+        self.indexed_fields = config.get('indexed_fields', [])
         
         # Ensure parent directory exists
         self.db_path.parent.mkdir(exist_ok=True, parents=True)
@@ -37,7 +56,7 @@ class DatabaseHandler:
         logger.info(f"Initializing {self.db_type} database at {self.db_path}")
         
         if self.db_type == 'sqlite':
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = tune_sqlite_connection(sqlite3.connect(self.db_path))
             self.cursor = self.conn.cursor()
             
             # Create tables if they don't exist
@@ -64,6 +83,14 @@ class DatabaseHandler:
         CREATE INDEX IF NOT EXISTS idx_document_type ON documents(document_type)
         ''')
         
+        # Create JSON1 expression indexes for content fields that are commonly filtered on
+        for field in self.indexed_fields:
+            index_name = "idx_document_" + field.replace(".", "_")
+            self.cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {index_name} "
+                f"ON documents(document_type, {json_field_expression(field)})"
+            )
+        
         self.conn.commit()
         logger.info("Database tables created successfully")
     
@@ -81,7 +108,7 @@ class DatabaseHandler:
         """
         logger.info(f"Inserting {document_type} document: {file_name}")
         
-        content_json = json.dumps(content)
+        content_json = _dumps(content)
         
         self.cursor.execute(
             "INSERT INTO documents (document_type, file_name, content_json) VALUES (?, ?, ?)",
@@ -91,6 +118,32 @@ class DatabaseHandler:
         
         return self.cursor.lastrowid
     
+    def insert_documents(self, documents: List[Tuple[str, str, Dict[str, Any]]]) -> int:
+        """
+        Insert multiple documents into the database in a single transaction.
+        
+        Args:
+            documents: List of (document_type, file_name, content) tuples
+            
+        Returns:
+            Number of documents inserted
+        """
+        logger.info(f"Inserting {len(documents)} documents")
+        
+        rows = [
+            (document_type, file_name, _dumps(content))
+            for document_type, file_name, content in documents
+        ]
+        
+        # Commits once on success, rolls back the whole batch on error
+        with self.conn:
+            self.cursor.executemany(
+                "INSERT INTO documents (document_type, file_name, content_json) VALUES (?, ?, ?)",
+                rows
+            )
+        
+        return len(rows)
+    
     def get_document(self, document_id: int) -> Optional[Dict[str, Any]]:
         """
         Retrieve a document from the database by ID.
@@ -111,7 +164,7 @@ class DatabaseHandler:
             return None
             
         document_type, file_name, content_json = result
-        content = json.loads(content_json)
+        content = _loads(content_json)
         
         return {
             "id": document_id,
@@ -145,7 +198,7 @@ class DatabaseHandler:
         results = []
         for row in self.cursor.fetchall():
             doc_id, doc_type, file_name, content_json = row
-            content = json.loads(content_json)
+            content = _loads(content_json)
             
             results.append({
                 "id": doc_id,
@@ -10,8 +10,25 @@ from typing import Dict, List, Optional, Union, Any
 
 from ..utils.logger import get_logger
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
 logger = get_logger(__name__)
 
+def _dump_bytes(data: Any) -> bytes:
+    """Serialize data to indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _load_bytes(data: bytes) -> Any:
+    """Parse UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class QueryCache:
     """Class for caching query results."""
     
@@ -62,6 +79,19 @@ class QueryCache:
         """
         return self.cache_dir / f"{cache_key}.json"
     
+    def _read_cache_file(self, cache_file: Path) -> Dict[str, Any]:
+        """
+        Read and parse a cache file.
+        
+        Args:
+            cache_file: Path to the cache file
+            
+        Returns:
+            Cached data
+        """
+        with open(cache_file, 'rb') as f:
+            return _load_bytes(f.read())
+    
     def get(self, query_type: str, query_params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
         Get cached results for a query.
@@ -83,8 +113,7 @@ class QueryCache:
             return None
             
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = self._read_cache_file(cache_file)
                 
             # Check if cache is expired
             if time.time() - cache_data.get('timestamp', 0) > self.ttl:
@@ -120,8 +149,8 @@ class QueryCache:
                 'results': results
             }
             
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
+            with open(cache_file, 'wb') as f:
+                f.write(_dump_bytes(cache_data))
                 
             logger.info(f"Cached results for key: {cache_key}")
         except Exception as e:
@@ -146,8 +175,7 @@ class QueryCache:
             # Invalidate entries for a specific query type
             for cache_file in self.cache_dir.glob("*.json"):
                 try:
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        cache_data = json.load(f)
+                    cache_data = self._read_cache_file(cache_file)
                         
                     if cache_data.get('query_type') == query_type:
                         cache_file.unlink()
@@ -167,8 +195,7 @@ class QueryCache:
         
         for cache_file in self.cache_dir.glob("*.json"):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cache_data = json.load(f)
+                cache_data = self._read_cache_file(cache_file)
                     
                 if current_time - cache_data.get('timestamp', 0) > self.ttl:
                     cache_file.unlink()
@@ -3,16 +3,149 @@ Database Connector module for querying the HR database.
 """
 
 import json
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Any
 
 from ..utils.logger import get_logger
+from ..utils.helpers import json_field_expression, tune_sqlite_connection
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
 
 logger = get_logger(__name__)
 
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON string, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class _SqlitePool:
+    """Pool of read-only connections to a SQLite database file."""
+
+    def __init__(self, db_path: Path, size: int):
+        """
+        Initialize the pool. Connections are opened on first use.
+
+        Args:
+            db_path: Path to the SQLite database file
+            size: Maximum number of open connections
+        """
+        self.uri = f"{db_path.resolve().as_uri()}?mode=ro"
+        self.size = size
+        self.users = 0
+        self.closed = False
+        self._idle = queue.LifoQueue()
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a new read-only connection."""
+        conn = tune_sqlite_connection(sqlite3.connect(self.uri, uri=True, check_same_thread=False))
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection, waiting for one to be returned if all are in use."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_open = self._opened < self.size
+                if can_open:
+                    self._opened += 1
+            if can_open:
+                try:
+                    conn = self._open()
+                except Exception:
+                    with self._lock:
+                        self._opened -= 1
+                    raise
+            else:
+                conn = self._idle.get()
+
+        try:
+            yield conn
+        finally:
+            with self._lock:
+                if not self.closed:
+                    self._idle.put(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    def close(self):
+        """Close the idle connections; borrowed ones are closed when returned."""
+        with self._lock:
+            self.closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+# Read-only pools shared by all open connectors in the process, keyed by database
+# file. The key includes the device and inode, so a file that is deleted and
+# recreated at the same path gets a new pool instead of reading the old file.
+_read_pools: Dict[Tuple[Path, int, int], _SqlitePool] = {}
+_read_pools_lock = threading.Lock()
+
+def _get_read_pool(db_path: Path, size: int) -> _SqlitePool:
+    """
+    Get the process-wide read-only connection pool for a database file.
+
+    Every call must be paired with a call to _release_read_pool.
+
+    Args:
+        db_path: Path to the SQLite database file, which must exist
+        size: Maximum number of open connections, used when the pool is created
+
+    Returns:
+        Shared connection pool
+    """
+    path = db_path.resolve()
+    stat = path.stat()
+    key = (path, stat.st_dev, stat.st_ino)
+    with _read_pools_lock:
+        pool = _read_pools.get(key)
+        if pool is None:
+            pool = _read_pools[key] = _SqlitePool(path, size)
+        pool.users += 1
+        return pool
+
+def _release_read_pool(pool: _SqlitePool):
+    """
+    Release a pool obtained from _get_read_pool, closing it once no connector uses it.
+
+    Args:
+        pool: Pool to release
+    """
+    with _read_pools_lock:
+        pool.users -= 1
+        if pool.users > 0:
+            return
+        for key, shared_pool in list(_read_pools.items()):
+            if shared_pool is pool:
+                del _read_pools[key]
+    pool.close()
+
 class DatabaseConnector:
-    """Class for connecting to and querying the HR database."""
+    """
+    Class for connecting to and querying the HR database.
+    
+    Queries run on pooled read-only connections, separate from the writer
+    connection exposed as conn/cursor, so they only see committed data. Changes
+    made through conn or cursor must be committed before search_documents,
+    get_document or a raw SELECT can see them. In-memory databases use the writer
+    connection for everything.
+    """
     
     def __init__(self, config: Dict):
         """
@@ -24,6 +157,7 @@ class DatabaseConnector:
         self.config = config
         self.db_type = config.get('type', 'sqlite')
         self.db_path = Path(config.get('path', '../data/hr_database.db'))
+        self.read_connections = config.get('read_connections', 4)
         
         # Initialize database connection
         self._connect_db()
@@ -33,13 +167,32 @@ class DatabaseConnector:
         logger.info(f"Connecting to {self.db_type} database at {self.db_path}")
         
         if self.db_type == 'sqlite':
-            self.conn = sqlite3.connect(self.db_path)
+            # Single writer connection, shared across threads behind a lock
+            self.conn = tune_sqlite_connection(sqlite3.connect(self.db_path, check_same_thread=False))
             self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
             self.cursor = self.conn.cursor()
+            self._write_lock = threading.Lock()
+
+            # Reads go through a shared pool of read-only connections, except for
+            # in-memory databases, which other connections cannot see
+            if str(self.db_path) == ':memory:':
+                self._read_pool = None
+            else:
+                self._read_pool = _get_read_pool(self.db_path, self.read_connections)
         else:
             logger.error(f"Unsupported database type: {self.db_type}")
             raise ValueError(f"Unsupported database type: {self.db_type}")
     
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a connection for a read-only query."""
+        if self._read_pool is None:
+            with self._write_lock:
+                yield self.conn
+        else:
+            with self._read_pool.connection() as conn:
+                yield conn
+    
     def search_documents(self, 
                          document_type: str, 
                          filters: Dict[str, Any] = None, 
@@ -65,32 +218,32 @@ class DatabaseConnector:
         query = "SELECT id, document_type, file_name, content_json FROM documents WHERE document_type = ?"
         params = [document_type]
         
-        # Add filters
+        # Add filters, compared against the extracted JSON field values
         if filters:
-            # In a real implementation, this would be more sophisticated
-            # For now, we'll just do a simple JSON substring search
             for key, value in filters.items():
-                # This is a simplistic approach - in a real system you'd use proper JSON querying
-                query += f" AND content_json LIKE ?"
-                params.append(f"%\"{key}\": \"{value}\"%")
+                query += f" AND {json_field_expression(key)} = ?"
+                params.append(value)
         
         # Add sorting
         if sort_by:
-            # Again, this is simplistic - real implementation would be more sophisticated
+            order_terms = []
             for field, direction in sort_by.items():
-                query += f" ORDER BY content_json"  # This is a placeholder
+                direction = "DESC" if str(direction).upper() == "DESC" else "ASC"
+                order_terms.append(f"{json_field_expression(field)} {direction}")
+            query += " ORDER BY " + ", ".join(order_terms)
         
         # Add limit
         query += " LIMIT ?"
         params.append(limit)
         
         # Execute the query
-        self.cursor.execute(query, params)
+        with self._reader() as conn:
+            rows = conn.execute(query, params).fetchall()
         
         # Process results
         results = []
-        for row in self.cursor.fetchall():
-            content = json.loads(row['content_json'])
+        for row in rows:
+            content = _loads(row['content_json'])
             
             # Filter fields if specified
             if fields:
@@ -119,16 +272,16 @@ class DatabaseConnector:
         Returns:
             Document as a dictionary, or None if not found
         """
-        self.cursor.execute(
-            "SELECT document_type, file_name, content_json FROM documents WHERE id = ?",
-            (document_id,)
-        )
+        with self._reader() as conn:
+            row = conn.execute(
+                "SELECT document_type, file_name, content_json FROM documents WHERE id = ?",
+                (document_id,)
+            ).fetchone()
         
-        row = self.cursor.fetchone()
         if row is None:
             return None
             
-        content = json.loads(row['content_json'])
+        content = _loads(row['content_json'])
         
         return {
             "id": document_id,
@@ -141,6 +294,9 @@ class DatabaseConnector:
         """
         Execute a raw SQL query.
         
+        SELECT statements run on a pooled read-only connection; any other statement
+        runs on the writer connection and is committed.
+        
         Args:
             query: SQL query to execute
             params: Query parameters
@@ -153,15 +309,20 @@ class DatabaseConnector:
         if params is None:
             params = []
             
-        self.cursor.execute(query, params)
+        if query.lstrip()[:6].upper() == "SELECT":
+            with self._reader() as conn:
+                rows = conn.execute(query, params).fetchall()
+        else:
+            with self._write_lock, self.conn:
+                rows = self.conn.execute(query, params).fetchall()
         
         results = []
-        for row in self.cursor.fetchall():
+        for row in rows:
             result = dict(row)
             
             # Parse content_json if present
             if 'content_json' in result:
-                result['content'] = json.loads(result['content_json'])
+                result['content'] = _loads(result['content_json'])
                 del result['content_json']
                 
             results.append(result)
@@ -169,7 +330,10 @@ class DatabaseConnector:
         return results
     
     def close(self):
-        """Close the database connection."""
+        """Close the database connection and release the shared read pool."""
+        if getattr(self, '_read_pool', None) is not None:
+            _release_read_pool(self._read_pool)
+            self._read_pool = None
         if hasattr(self, 'conn'):
             self.conn.close()
             logger.info("Database connection closed")
\ No newline at end of file
@@ -4,6 +4,9 @@ Helpers module for common utility functions.
 
 import json
 import os
+import re
+import sqlite3
+import uuid
 import yaml
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
@@ -12,6 +15,19 @@ from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Document content fields usable in SQL: dot-separated identifiers such as contact_info.email
+_JSON_FIELD_PATTERN = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)*")
+
+# PRAGMAs applied to every SQLite connection: WAL lets readers run alongside the
+# writer, and synchronous=NORMAL only syncs at WAL checkpoints instead of on every commit
+SQLITE_PRAGMAS = [
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+]
+
 def load_config(config_path: Union[str, Path] = None) -> Dict[str, Any]:
     """
     Load configuration from a YAML file.
@@ -138,4 +154,66 @@ def format_error(error: Exception) -> Dict[str, str]:
     return {
         "error": str(error),
         "type": error.__class__.__name__
-    }
\ No newline at end of file
+    }
+
+def generate_uuids(count: int) -> List[str]:
+    """
+    Generate random (version 4) UUID strings with a single call to the OS random source.
+    
+    Args:
+        count: Number of UUIDs to generate
+        
+    Returns:
+        List of UUID strings, in the same format as str(uuid.uuid4())
+    """
+    random_bytes = os.urandom(16 * count)
+    return [
+        str(uuid.UUID(bytes=random_bytes[i:i + 16], version=4))
+        for i in range(0, len(random_bytes), 16)
+    ]
+
+def normalize_skill(skill: str) -> str:
+    """
+    Normalize a skill name for matching, so "Python " and "python" are the same skill.
+    
+    Args:
+        skill: Skill name as written in a resume or query
+        
+    Returns:
+        Normalized skill name
+    """
+    return skill.strip().lower()
+
+def tune_sqlite_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    """
+    Apply the standard PRAGMAs to a SQLite connection.
+    
+    Args:
+        conn: SQLite connection to configure
+        
+    Returns:
+        The same connection
+    """
+    for pragma in SQLITE_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def json_field_expression(field: str) -> str:
+    """
+    Build the SQLite JSON1 expression that extracts a field from a document's content.
+    
+    The path is inlined rather than bound as a parameter so that queries match the
+    text of the expression indexes on documents, which lets SQLite use them.
+    
+    Args:
+        field: Content field name, with dots for nested fields
+        
+    Returns:
+        SQL expression extracting the field from content_json
+        
+    Raises:
+        ValueError: If the field name is not a dot-separated list of identifiers
+    """
+    if not _JSON_FIELD_PATTERN.fullmatch(field):
+        raise ValueError(f"Invalid document field name: {field!r}")
+    return f"json_extract(content_json, '$.{field}')"
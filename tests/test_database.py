@@ -0,0 +1,115 @@
+"""
+Tests for the database module.
+"""
+
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path to import modules
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.database.duckdb_handler import DuckDBHandler
+from src.database.schema import Candidate, ContactInfo, Education, WorkExperience, SearchQuery
+
+class TestDuckDBHandler(unittest.TestCase):
+    """Tests for the DuckDBHandler class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = DuckDBHandler(str(Path(self.temp_dir) / "hr_database.duckdb"))
+
+        self.alice = Candidate(
+            candidate_name="Alice Smith",
+            contact_info=ContactInfo(email="alice@example.com"),
+            education=[Education(institution="Stanford University", degree="BS Computer Science")],
+            work_experience=[WorkExperience(company="Google Inc.", role="Software Engineer",
+                                            responsibilities=["Built search infrastructure"])],
+            skills=["Python", "SQL", "Docker"]
+        )
+        self.bob = Candidate(
+            candidate_name="Bob Jones",
+            contact_info=ContactInfo(email="bob@example.com"),
+            work_experience=[WorkExperience(company="Acme Corp", role="Data Analyst")],
+            skills=["python", "Excel"]
+        )
+        self.db.insert_candidates([self.alice, self.bob])
+
+    def tearDown(self):
+        """Tear down test fixtures."""
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _count_rows(self, table, candidate_id):
+        """Count the rows of a table that belong to a candidate."""
+        return self.db.conn.execute(
+            f"SELECT COUNT(*) FROM {table} WHERE candidate_id = ?", (candidate_id,)
+        ).fetchone()[0]
+
+    def test_get_candidate(self):
+        """Test candidate retrieval."""
+        candidate = self.db.get_candidate(self.alice.id)
+
+        # Check that the candidate round-trips, with skills in their original order
+        self.assertEqual(candidate.candidate_name, "Alice Smith")
+        self.assertEqual(candidate.contact_info.email, "alice@example.com")
+        self.assertEqual(candidate.skills, ["Python", "SQL", "Docker"])
+        self.assertEqual(candidate.work_experience[0].company, "Google Inc.")
+        self.assertEqual(candidate.education[0].institution, "Stanford University")
+
+        # Check that an unknown ID is not found
+        self.assertIsNone(self.db.get_candidate("missing"))
+
+    def test_get_candidate_returns_copies(self):
+        """Test that mutating a returned candidate does not change the cached one."""
+        # The first lookup caches the candidate; the second is served from the cache
+        self.db.get_candidate(self.alice.id)
+        candidate = self.db.get_candidate(self.alice.id)
+        candidate.skills.append("Rust")
+        candidate.work_experience[0].role = "Manager"
+
+        candidate = self.db.get_candidate(self.alice.id)
+        self.assertEqual(candidate.skills, ["Python", "SQL", "Docker"])
+        self.assertEqual(candidate.work_experience[0].role, "Software Engineer")
+
+    def test_fuzzy_search(self):
+        """Test fuzzy search on skills and companies."""
+        # Skills match regardless of case and surrounding whitespace
+        results = self.db.fuzzy_search(SearchQuery(skills=["PYTHON ", "sql"]))
+        self.assertEqual([candidate.id for candidate, _ in results], [self.alice.id, self.bob.id])
+        self.assertGreater(results[0][1], results[1][1])
+
+        # Company names are matched fuzzily
+        results = self.db.fuzzy_search(SearchQuery(companies=["Google"]))
+        self.assertEqual(results[0][0].id, self.alice.id)
+
+    def test_delete_candidate(self):
+        """Test candidate deletion."""
+        # Load the candidate so it is cached before it is deleted
+        self.assertIsNotNone(self.db.get_candidate(self.alice.id))
+        self.assertEqual(len(self.db.fuzzy_search(SearchQuery(skills=["Python"]))), 2)
+
+        self.assertTrue(self.db.delete_candidate(self.alice.id))
+
+        # Check that the candidate and all of their child rows are gone
+        self.assertEqual(self.db.conn.execute(
+            "SELECT COUNT(*) FROM candidates WHERE id = ?", (self.alice.id,)
+        ).fetchone()[0], 0)
+        for table in ("skills", "work_experience", "education"):
+            self.assertEqual(self._count_rows(table, self.alice.id), 0)
+
+        # Check that the cache and the fuzzy match corpus were invalidated
+        self.assertIsNone(self.db.get_candidate(self.alice.id))
+        results = self.db.fuzzy_search(SearchQuery(skills=["Python"]))
+        self.assertEqual([candidate.id for candidate, _ in results], [self.bob.id])
+        self.assertEqual(self.db.fuzzy_search(SearchQuery(companies=["Google"])), [])
+
+        # Check that the other candidate is untouched
+        self.assertEqual(self.db.get_candidate(self.bob.id).skills, ["python", "Excel"])
+        self.assertEqual(self._count_rows("skills", self.bob.id), 2)
+
+if __name__ == '__main__':
+    unittest.main()
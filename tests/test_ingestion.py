@@ -177,6 +177,20 @@ class TestDataExtractor(unittest.TestCase):
             # Check that files were opened for reading and writing
             self.assertEqual(mock_open.call_count, 2)
 
+    def test_batch_process(self):
+        """Test concurrent batch processing."""
+        text_files = [Path("text_dir/a.txt"), Path("text_dir/b.txt"), Path("text_dir/c.txt")]
+
+        with patch('pathlib.Path.glob', return_value=text_files), \
+             patch('pathlib.Path.mkdir'), \
+             patch.object(self.extractor, 'process_file', side_effect=lambda text_file, output_file: {"source": text_file.stem}) as mock_process:
+            results = self.extractor.batch_process("text_dir", "output_dir")
+
+            # Check that every file was processed and results keep the file order
+            self.assertEqual(mock_process.call_count, 3)
+            self.assertEqual([result["source"] for result in results], ["a", "b", "c"])
+            mock_process.assert_any_call(Path("text_dir/b.txt"), Path("output_dir/b.json"))
+
 class TestDatabaseHandler(unittest.TestCase):
     """Tests for the DatabaseHandler class."""
 
@@ -212,6 +226,20 @@ class TestDatabaseHandler(unittest.TestCase):
         self.assertIsInstance(doc_id, int)
         self.assertGreater(doc_id, 0)
 
+    def test_insert_documents(self):
+        """Test bulk document insertion."""
+        # Insert a batch of documents
+        count = self.db_handler.insert_documents([
+            ('resume', 'test1.pdf', {'candidate_name': 'Test Candidate 1'}),
+            ('resume', 'test2.pdf', {'candidate_name': 'Test Candidate 2'}),
+            ('job_description', 'job1.pdf', {'job_title': 'Software Engineer'})
+        ])
+
+        # Check that all documents were inserted
+        self.assertEqual(count, 3)
+        self.assertEqual(len(self.db_handler.query_documents('resume')), 2)
+        self.assertEqual(len(self.db_handler.query_documents('job_description')), 1)
+
     def test_get_document(self):
         """Test document retrieval."""
         # Insert a document
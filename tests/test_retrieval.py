@@ -6,6 +6,7 @@ import os
 import sys
 import unittest
 import json
+import sqlite3
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
@@ -13,6 +14,7 @@ from unittest.mock import patch, MagicMock
 # Add parent directory to path to import modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.retrieval import database_connector
 from src.retrieval.database_connector import DatabaseConnector
 from src.retrieval.query_tools import QueryTools
 from src.retrieval.cache import QueryCache
@@ -91,7 +93,25 @@ class TestDatabaseConnector(unittest.TestCase):
         
         # Check that the correct number of documents were returned
         self.assertEqual(len(limited), 1)
-    
+
+    def test_search_documents_json_fields(self):
+        """Test filtering and sorting on JSON content fields."""
+        # Filter on an exact field value
+        filtered = self.db.search_documents('resume', {'candidate_name': 'Test Candidate 2'})
+
+        # Check that only the matching document was returned
+        self.assertEqual([doc['file_name'] for doc in filtered], ['test2.pdf'])
+
+        # Sort by a content field
+        ordered = self.db.search_documents('resume', sort_by={'candidate_name': 'desc'})
+
+        # Check that the documents were returned in descending order
+        self.assertEqual([doc['file_name'] for doc in ordered], ['test2.pdf', 'test1.pdf'])
+
+        # Check that field names cannot inject SQL
+        with self.assertRaises(ValueError):
+            self.db.search_documents('resume', {"name') OR 1=1 --": 'x'})
+
     def test_get_document(self):
         """Test document retrieval."""
         # Get a document
@@ -114,6 +134,101 @@ class TestDatabaseConnector(unittest.TestCase):
         # Check that the correct number of documents were returned
         self.assertEqual(len(results), 2)
 
+class TestDatabaseConnectorPooling(unittest.TestCase):
+    """Tests for pooled reads on a file-backed database."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = Path(self.temp_dir.name) / 'hr_database.db'
+        self.config = {'type': 'sqlite', 'path': str(self.db_path)}
+        self._create_database(['a.pdf', 'b.pdf'])
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+    
+    def _create_database(self, file_names):
+        """Create the database file with one resume per file name."""
+        conn = sqlite3.connect(self.db_path)
+        conn.execute('''
+        CREATE TABLE documents (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            document_type TEXT NOT NULL,
+            file_name TEXT NOT NULL,
+            content_json TEXT NOT NULL
+        )
+        ''')
+        conn.executemany(
+            "INSERT INTO documents (document_type, file_name, content_json) VALUES (?, ?, ?)",
+            [('resume', file_name, json.dumps({'candidate_name': file_name})) for file_name in file_names]
+        )
+        conn.commit()
+        conn.close()
+    
+    def _file_names(self, db):
+        """File names of all resumes, read through the pool."""
+        return sorted(doc['file_name'] for doc in db.search_documents('resume', limit=100))
+    
+    def test_reads_see_committed_writes(self):
+        """Test that pooled reads see writes once they are committed."""
+        db = DatabaseConnector(self.config)
+        try:
+            self.assertEqual(self._file_names(db), ['a.pdf', 'b.pdf'])
+            
+            # Uncommitted writes on the writer cursor are not visible to pooled reads
+            db.cursor.execute(
+                "INSERT INTO documents (document_type, file_name, content_json) VALUES (?, ?, ?)",
+                ('resume', 'c.pdf', json.dumps({'candidate_name': 'c.pdf'}))
+            )
+            self.assertEqual(self._file_names(db), ['a.pdf', 'b.pdf'])
+            
+            # Committed writes are
+            db.conn.commit()
+            self.assertEqual(self._file_names(db), ['a.pdf', 'b.pdf', 'c.pdf'])
+            
+            # Raw writes are committed by execute_raw_query
+            db.execute_raw_query("DELETE FROM documents WHERE file_name = ?", ['a.pdf'])
+            self.assertEqual(self._file_names(db), ['b.pdf', 'c.pdf'])
+        finally:
+            db.close()
+    
+    def test_close_releases_pool(self):
+        """Test that the shared pool is closed once its last connector closes."""
+        first = DatabaseConnector(self.config)
+        second = DatabaseConnector(self.config)
+        
+        # Connectors for the same file share one pool
+        self.assertIs(first._read_pool, second._read_pool)
+        pool = first._read_pool
+        self.assertEqual(self._file_names(first), ['a.pdf', 'b.pdf'])
+        
+        first.close()
+        self.assertFalse(pool.closed)
+        self.assertEqual(self._file_names(second), ['a.pdf', 'b.pdf'])
+        
+        second.close()
+        self.assertTrue(pool.closed)
+        self.assertNotIn(pool, database_connector._read_pools.values())
+    
+    def test_recreated_database(self):
+        """Test that a database recreated at the same path is read afresh."""
+        old = DatabaseConnector(self.config)
+        self.assertEqual(self._file_names(old), ['a.pdf', 'b.pdf'])
+        
+        # Replace the file while the old connector is still open
+        self.db_path.unlink()
+        for suffix in ('-wal', '-shm'):
+            Path(f"{self.db_path}{suffix}").unlink(missing_ok=True)
+        self._create_database(['z.pdf'])
+        
+        new = DatabaseConnector(self.config)
+        try:
+            self.assertEqual(self._file_names(new), ['z.pdf'])
+        finally:
+            new.close()
+            old.close()
+
 class TestQueryTools(unittest.TestCase):
     """Tests for the QueryTools class."""
     